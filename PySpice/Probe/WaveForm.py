@@ -133,13 +133,14 @@ class WaveForm(UnitValues):
 
     ##############################################
 
-    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
-        result = super().__array_ufunc__(ufunc, method, *inputs, **kwargs)
-        # self._logger.info("result\n{}".format(result))
-        if isinstance(result, UnitValues):
-            return self.from_unit_values(name='', array=result, title='', abscissa=self._abscissa)
-        else:
-            return result  # e.g. foo <= 0
+    def _wrap_result(self, array, prefixed_unit):
+        # Called by UnitValues.__array_ufunc__, array is a new ndarray thus a view avoids a copy
+        waveform = array.view(WaveForm)
+        waveform._prefixed_unit = prefixed_unit
+        waveform._name = ''
+        waveform._title = ''
+        waveform._abscissa = self._abscissa
+        return waveform
 
     ##############################################
 
@@ -240,20 +241,37 @@ class Analysis:
       :attr:`elements`
         Dictionary for elements ...
 
+      :attr:`units`
+        Dictionary for the prefixed units indexed by waveform names
+
+    If the simulator is created with ``units=False``, then the waveforms are plain Numpy arrays and
+    the units are only available in :attr:`units`.  The values of an operating point are then
+    scalars, instead of waveforms of length 1.
+
     """
 
     ##############################################
 
-    def __init__(self, simulation, nodes=(), branches=(), elements=(), internal_parameters=()):
+    def __init__(self, simulation, nodes=(), branches=(), elements=(), internal_parameters=(), units=None):
 
         # Fixme: branches are elements in fact, and elements is not yet supported ...
 
         self._simulation = simulation
-        # Fixme: to func?
-        self._nodes = {waveform.name:waveform for waveform in nodes}
-        self._branches = {waveform.name:waveform for waveform in branches}
-        self._elements = {waveform.name:waveform for waveform in elements}
-        self._internal_parameters = {waveform.name:waveform for waveform in internal_parameters}
+        self._nodes = self._to_dict(nodes)
+        self._branches = self._to_dict(branches)
+        self._elements = self._to_dict(elements)
+        self._internal_parameters = self._to_dict(internal_parameters)
+        self._units = units
+
+    ##############################################
+
+    @staticmethod
+    def _to_dict(waveforms):
+        # Unit-free waveforms are given as a dictionary of Numpy arrays
+        if isinstance(waveforms, dict):
+            return waveforms
+        else:
+            return {waveform.name:waveform for waveform in waveforms}
 
     ##############################################
 
@@ -278,6 +296,25 @@ class Analysis:
     def internal_parameters(self):
         return self._internal_parameters
 
+    @property
+    def units(self):
+        if self._units is None:
+            # same precedence as _get_item
+            self._units = {}
+            for waveforms in (self._internal_parameters, self._elements, self._branches, self._nodes):
+                for name, waveform in waveforms.items():
+                    self._units[name] = waveform.prefixed_unit
+            # the abscissa is also in the table of a unit-free analysis
+            for waveform in self._abscissae():
+                self._units.setdefault(waveform.name, waveform.prefixed_unit)
+        return self._units
+
+    ##############################################
+
+    def _abscissae(self):
+        """Return the abscissa waveforms"""
+        return ()
+
    ##############################################
 
     def _get_item(self, name):
@@ -337,9 +374,9 @@ class SensitivityAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, elements, internal_parameters):
+    def __init__(self, simulation, elements, internal_parameters, units=None):
         super().__init__(simulation=simulation, elements=elements,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
 
 ####################################################################################################
 
@@ -359,10 +396,10 @@ class DcAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, sweep, nodes, branches, internal_parameters):
+    def __init__(self, simulation, sweep, nodes, branches, internal_parameters, units=None):
 
         super().__init__(simulation=simulation, nodes=nodes, branches=branches,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
 
         self._sweep = sweep
 
@@ -373,6 +410,9 @@ class DcAnalysis(Analysis):
         """Return an Numpy array for the sweep abscissa"""
         return self._sweep
 
+    def _abscissae(self):
+        return (self._sweep,)
+
 ####################################################################################################
 
 class AcAnalysis(Analysis):
@@ -381,10 +421,10 @@ class AcAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, frequency, nodes, branches, internal_parameters):
+    def __init__(self, simulation, frequency, nodes, branches, internal_parameters, units=None):
 
         super().__init__(simulation=simulation, nodes=nodes, branches=branches,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
 
         self._frequency = frequency
 
@@ -395,6 +435,9 @@ class AcAnalysis(Analysis):
         """Return an Numpy array for the frequency abscissa"""
         return self._frequency
 
+    def _abscissae(self):
+        return (self._frequency,)
+
 ####################################################################################################
 
 class TransientAnalysis(Analysis):
@@ -403,10 +446,10 @@ class TransientAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, time, nodes, branches, internal_parameters):
+    def __init__(self, simulation, time, nodes, branches, internal_parameters, units=None):
 
         super().__init__(simulation=simulation, nodes=nodes, branches=branches,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
 
         self._time = time
 
@@ -417,6 +460,9 @@ class TransientAnalysis(Analysis):
         """Return an Numpy array for the time abscissa"""
         return self._time
 
+    def _abscissae(self):
+        return (self._time,)
+
 ####################################################################################################
 
 class PoleZeroAnalysis(Analysis):
@@ -425,9 +471,9 @@ class PoleZeroAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, nodes, branches, internal_parameters):
+    def __init__(self, simulation, nodes, branches, internal_parameters, units=None):
         super().__init__(simulation=simulation, nodes=nodes, branches=branches,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
 
 ####################################################################################################
 
@@ -437,9 +483,9 @@ class NoiseAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, nodes, branches, internal_parameters):
+    def __init__(self, simulation, nodes, branches, internal_parameters, units=None):
         super().__init__(simulation=simulation, nodes=nodes, branches=branches,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
 
 ####################################################################################################
 
@@ -449,10 +495,10 @@ class DistortionAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, frequency, nodes, branches, internal_parameters):
+    def __init__(self, simulation, frequency, nodes, branches, internal_parameters, units=None):
 
         super().__init__(simulation=simulation, nodes=nodes, branches=branches,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
 
         self._frequency = frequency
 
@@ -463,6 +509,9 @@ class DistortionAnalysis(Analysis):
         """Return an Numpy array for the frequency abscissa"""
         return self._frequency
 
+    def _abscissae(self):
+        return (self._frequency,)
+
 ####################################################################################################
 
 class TransferFunctionAnalysis(Analysis):
@@ -471,7 +520,7 @@ class TransferFunctionAnalysis(Analysis):
 
     ##############################################
 
-    def __init__(self, simulation, nodes, branches, internal_parameters):
+    def __init__(self, simulation, nodes, branches, internal_parameters, units=None):
 
         super().__init__(simulation=simulation, nodes=nodes, branches=branches,
-                         internal_parameters=internal_parameters)
+                         internal_parameters=internal_parameters, units=units)
@@ -20,7 +20,27 @@
 
 ####################################################################################################
 
+"""Convert SPICE netlists to PySpice code.
+
+A single file is converted to the standard output or to the file given by ``--output``.
+
+In batch mode, i.e. when several files, directories or glob patterns are given, the netlists are
+converted in parallel by a pool of worker processes and the Python files are written to the output
+directory, by default next to the netlists.  A file whose output is newer than the netlist is
+skipped, unless ``--force`` is set.  A summary is printed at the end.
+
+"""
+
+####################################################################################################
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 import argparse
+import glob
+import json
+import os
+import sys
+import time
 
 ####################################################################################################
 
@@ -33,16 +53,176 @@ from PySpice.Spice.Parser import SpiceParser
 
 ####################################################################################################
 
+DEFAULT_EXTENSIONS = ('.cir', '.lib', '.mod', '.sp', '.spice', '.sub')
+
+####################################################################################################
+
+def find_netlists(inputs, extensions=DEFAULT_EXTENSIONS):
+
+    """Return the list of ``(path, root)`` for the files, directories and glob patterns *inputs*,
+    *root* is the directory relative to which the output path is computed.
+
+    The directories are walked recursively and only the files having one of the *extensions* are
+    retained.
+
+    """
+
+    extensions = {extension.lower() for extension in extensions}
+    netlists = []
+    seen = set()
+
+    def add(path, root):
+        key = os.path.realpath(str(path))
+        if key not in seen:
+            seen.add(key)
+            netlists.append((path, root))
+
+    for input_ in inputs:
+        if glob.has_magic(input_):
+            paths = sorted(Path(_) for _ in glob.glob(input_, recursive=True))
+        else:
+            paths = [Path(input_)]
+        for path in paths:
+            if path.is_dir():
+                for file_path in sorted(path.rglob('*')):
+                    if file_path.suffix.lower() in extensions and file_path.is_file():
+                        add(file_path, path)
+            elif path.is_file():
+                add(path, path.parent)
+            else:
+                raise FileNotFoundError("{} not found".format(path))
+
+    return netlists
+
+####################################################################################################
+
+def output_path(path, root, output_directory=None):
+    """Return the path of the Python file for the netlist *path*."""
+    if output_directory is None:
+        return path.with_suffix('.py')
+    return Path(output_directory).joinpath(path.relative_to(root)).with_suffix('.py')
+
+####################################################################################################
+
+def is_up_to_date(input_path, output_path):
+    """Test if *output_path* is newer than *input_path*."""
+    try:
+        return output_path.stat().st_mtime >= input_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+####################################################################################################
+
+def convert_file(input_path, output_path=None, ground=0, build=False, cache=False):
+
+    """Convert the netlist *input_path* and write the code to *output_path*, return the code if
+    *output_path* is None.
+
+    """
+
+    parser = SpiceParser(path=str(input_path), cache=cache)
+
+    if build:
+        parser.build_circuit()
+
+    circuit = parser.to_python_code(ground=ground)
+    if output_path is None:
+        return circuit
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name('{}.{}.tmp'.format(output_path.name, os.getpid()))
+    with open(str(tmp_path), 'w') as f:
+        f.write(circuit)
+    os.replace(str(tmp_path), str(output_path))
+
+####################################################################################################
+
+def _convert_job(input_path, output_path, ground, build, cache):
+
+    """Convert a netlist and return an error message or None, this function is run in the worker
+    processes.
+
+    """
+
+    try:
+        convert_file(input_path, output_path, ground, build, cache)
+    except Exception as e:
+        return '{}: {}'.format(type(e).__name__, e)
+    return None
+
+####################################################################################################
+
+def convert_files(netlists, output_directory=None, ground=0, build=False, cache=False,
+                  force=False, workers=None):
+
+    """Convert the *netlists*, a list of ``(path, root)`` as returned by :func:`find_netlists`, and
+    return a summary dictionary.
+
+    The netlists are converted by a pool of *workers* processes, None means the number of
+    processors.  *cache* is passed to :class:`SpiceParser`.
+
+    The netlists having the same output path, e.g. :file:`foo.cir` and :file:`foo.lib`, are not
+    converted and are reported as failed.
+
+    """
+
+    start_time = time.monotonic()
+    summary = {
+        'converted': [],
+        'skipped': [],
+        'failed': {},
+    }
+
+    destinations = [output_path(path, root, output_directory) for path, root in netlists]
+    sources = {}
+    for (path, root), destination in zip(netlists, destinations):
+        sources.setdefault(destination, []).append(path)
+
+    jobs = []
+    for (path, root), destination in zip(netlists, destinations):
+        if len(sources[destination]) > 1:
+            error = 'Output path {} collides with {}'.format(
+                destination, ', '.join([str(_) for _ in sources[destination] if _ != path]))
+            logger.error("Cannot convert {} - {}".format(path, error))
+            summary['failed'][str(path)] = error
+        elif not force and is_up_to_date(path, destination):
+            summary['skipped'].append(str(path))
+        else:
+            jobs.append((path, destination))
+
+    if jobs:
+        args = [(path, destination, ground, build, cache) for path, destination in jobs]
+        if workers == 1 or len(jobs) == 1:
+            errors = [_convert_job(*arg) for arg in args]
+        else:
+            number_of_workers = min(workers or os.cpu_count() or 1, len(jobs))
+            chunksize = max(1, len(jobs) // (4 * number_of_workers))
+            with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+                errors = list(executor.map(_convert_job, *zip(*args), chunksize=chunksize))
+        for (path, destination), error in zip(jobs, errors):
+            if error is None:
+                summary['converted'].append(str(path))
+            else:
+                logger.error("Cannot convert {} - {}".format(path, error))
+                summary['failed'][str(path)] = error
+
+    summary['time'] = time.monotonic() - start_time
+    return summary
+
+####################################################################################################
+
 def main():
 
     parser = argparse.ArgumentParser(description='Convert a circuit file to PySpice')
 
     parser.add_argument('circuit_file', # metavar='circuit_file',
-                        help='.cir file')
+                        nargs='+',
+                        help='.cir file, or files, directories and glob patterns in batch mode')
 
     parser.add_argument('-o', '--output',
                         default=None,
-                        help='Output file')
+                        help='Output file, or output directory in batch mode')
 
     parser.add_argument('--ground',
                         type=int,
@@ -53,18 +233,59 @@ def main():
                         default=False, action='store_true',
                         help='Build circuit')
 
+    parser.add_argument('--workers',
+                        type=int,
+                        default=None,
+                        help='Number of worker processes in batch mode, default to the number of processors')
+
+    parser.add_argument('--force',
+                        default=False, action='store_true',
+                        help='Convert the files whose output is up to date')
+
+    parser.add_argument('--cache',
+                        default=False, action='store_true',
+                        help='Use the parser cache')
+
+    parser.add_argument('--extensions',
+                        default=','.join(DEFAULT_EXTENSIONS),
+                        help='Comma separated extensions of the netlists found in the directories')
+
+    parser.add_argument('--summary',
+                        default=None,
+                        help='Write the summary to this JSON file')
+
     args = parser.parse_args()
 
     ##############################################
 
-    parser = SpiceParser(path=args.circuit_file)
+    inputs = args.circuit_file
+    if len(inputs) == 1 and not glob.has_magic(inputs[0]) and not os.path.isdir(inputs[0]):
+        circuit = convert_file(inputs[0], args.output, ground=args.ground, build=args.build, cache=args.cache)
+        if circuit is not None:
+            print(circuit)
+        return
 
-    if args.build:
-        parser.build_circuit()
+    ##############################################
+
+    extensions = [extension.strip() for extension in args.extensions.split(',') if extension.strip()]
+    netlists = find_netlists(inputs, extensions)
+    summary = convert_files(
+        netlists,
+        output_directory=args.output,
+        ground=args.ground,
+        build=args.build,
+        cache=args.cache,
+        force=args.force,
+        workers=args.workers,
+    )
+
+    print('Converted {} files, skipped {} up to date files, {} failures in {:.1f} s'.format(
+        len(summary['converted']), len(summary['skipped']), len(summary['failed']), summary['time']))
+    for path, error in summary['failed'].items():
+        print('  {}: {}'.format(path, error))
+    if args.summary is not None:
+        with open(args.summary, 'w') as f:
+            json.dump(summary, f, indent=4)
 
-    circuit = parser.to_python_code(ground=args.ground)
-    if args.output is not None:
-        with open(args.output, 'w') as f:
-            f.write(circuit)
-    else:
-        print(circuit)
+    if summary['failed']:
+        sys.exit(1)
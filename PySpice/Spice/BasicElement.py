@@ -1713,3 +1713,8 @@ class GSSElement(NPinElement):
     def __init__(self):
 
         raise NotImplementedError
+
+####################################################################################################
+
+# HighLevelElement adds the element shortcuts, cf. Netlist
+from . import HighLevelElement
@@ -100,6 +100,12 @@ class Constant:
 
     ##############################################
 
+    @property
+    def value(self):
+        return self._value
+
+    ##############################################
+
     def __str__(self):
         return str(self._value)
 
@@ -308,6 +314,7 @@ class NotEqual(BinaryOperator):
 
 class LessEqual(BinaryOperator):
     OPERATOR = '<='
+    PRECEDENCE = 5
 
 class GreaterEqual(BinaryOperator):
     OPERATOR = '>='
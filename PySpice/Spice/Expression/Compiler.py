@@ -0,0 +1,264 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2017 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This module implements a compiler of Spice expressions to vectorised Python functions.
+
+The AST of an expression is translated to the source code of a Python function whose arguments are
+the variables of the expression, this function is evaluated using Numpy functions and thus works on
+scalars as well as on arrays, e.g. to evaluate a parameter on thousands of Monte Carlo samples in a
+single call::
+
+    expression = compile_expression('r0 * (1 + tc1 * (temp - 27))')
+    expression(r0=1e3, tc1=np.random.normal(1e-3, 1e-4, 10000), temp=50)
+
+The compiled expressions are memoized by their text.
+
+"""
+
+####################################################################################################
+
+import functools
+import logging
+
+import numpy as np
+
+####################################################################################################
+
+from ..Number import spice_number_to_float
+from .Ast import (
+    BinaryOperator, Constant, Function, If, UnaryOperator, Variable,
+)
+from .Parser import get_parser
+
+####################################################################################################
+
+_module_logger = logging.getLogger(__name__)
+
+####################################################################################################
+
+def _as_float(x):
+    # a comparison returns a boolean, SPICE uses 1 and 0
+    return np.multiply(x, 1.)
+
+def _if(condition, x, y):
+    # both branches are evaluated
+    result = np.where(condition, x, y)
+    return result[()] if result.ndim == 0 else result
+
+def _pwr(x, y):
+    return np.sign(x) * np.power(np.abs(x), y)
+
+def _int_divide(x, y):
+    return np.trunc(np.divide(x, y))
+
+#: The operators mapped to a format string of the operands
+UNARY_OPERATORS = {
+    '-': '(-{0})',
+    '!': '_as_float(np.logical_not({0}))',
+}
+
+BINARY_OPERATORS = {
+    '**': 'np.power({0}, {1})',
+    '*': '({0} * {1})',
+    '/': 'np.divide({0}, {1})',
+    '%': 'np.fmod({0}, {1})',
+    '\\': '_int_divide({0}, {1})',
+    '+': '({0} + {1})',
+    '-': '({0} - {1})',
+    '==': '_as_float(np.equal({0}, {1}))',
+    '!=': '_as_float(np.not_equal({0}, {1}))',
+    '<=': '_as_float(np.less_equal({0}, {1}))',
+    '>=': '_as_float(np.greater_equal({0}, {1}))',
+    '<': '_as_float(np.less({0}, {1}))',
+    '>': '_as_float(np.greater({0}, {1}))',
+    '&&': '_as_float(np.logical_and({0}, {1}))',
+    '||': '_as_float(np.logical_or({0}, {1}))',
+}
+
+#: The SPICE functions, the names are case insensitive
+FUNCTIONS = {
+    'abs': np.abs,
+    'sqrt': np.sqrt,
+    'exp': np.exp,
+    'ln': np.log,
+    'log': np.log,
+    'log10': np.log10,
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'asin': np.arcsin,
+    'acos': np.arccos,
+    'atan': np.arctan,
+    'atan2': np.arctan2,
+    'sinh': np.sinh,
+    'cosh': np.cosh,
+    'tanh': np.tanh,
+    'asinh': np.arcsinh,
+    'acosh': np.arccosh,
+    'atanh': np.arctanh,
+    'min': np.minimum,
+    'max': np.maximum,
+    'pow': np.power,
+    'pwr': _pwr,
+    'sgn': np.sign,
+    'sign': np.sign,
+    'int': np.trunc,
+    'floor': np.floor,
+    'ceil': np.ceil,
+    'nint': np.rint,
+    'limit': np.clip,
+    'hypot': np.hypot,
+    'u': lambda x: _as_float(np.greater(x, 0)),
+    'uramp': lambda x: np.maximum(x, 0),
+    'if': _if,
+}
+
+#: The constants, a variable of the expression cannot shadow them
+CONSTANTS = {
+    'pi': np.pi,
+}
+
+####################################################################################################
+
+class CompiledExpression:
+
+    """This class implements a compiled expression.
+
+    The values of the variables are passed as keyword arguments or as a mapping, they can be scalars
+    or arrays which are broadcasted.
+
+    """
+
+    _logger = _module_logger.getChild('CompiledExpression')
+
+    ##############################################
+
+    def __init__(self, text, ast):
+
+        self._text = text
+        self._variables = []
+        expression = self._to_source(ast)
+        arguments = ', '.join(['v{}'.format(i) for i in range(len(self._variables))])
+        self._source = 'def _expression({}):\n    return {}\n'.format(arguments, expression)
+        namespace = dict(np=np, _as_float=_as_float, _if=_if, _int_divide=_int_divide)
+        namespace.update({'f_' + name: function for name, function in FUNCTIONS.items()})
+        exec(compile(self._source, '<expression {}>'.format(text), 'exec'), namespace)
+        self._function = namespace['_expression']
+
+    ##############################################
+
+    @property
+    def text(self):
+        return self._text
+
+    @property
+    def variables(self):
+        """Names of the variables in the order of appearance"""
+        return list(self._variables)
+
+    @property
+    def source(self):
+        """Source code of the Python function"""
+        return self._source
+
+    ##############################################
+
+    def _to_source(self, node):
+
+        if isinstance(node, Constant):
+            return repr(spice_number_to_float(node.value))
+        elif isinstance(node, Variable):
+            name = node.name
+            if name.lower() in CONSTANTS:
+                return repr(CONSTANTS[name.lower()])
+            if name not in self._variables:
+                self._variables.append(name)
+            return 'v{}'.format(self._variables.index(name))
+        elif isinstance(node, If):
+            return '_if({}, {}, {})'.format(*[self._to_source(operand)
+                                              for operand in (node.condition, node.then_expression, node.else_expression)])
+        elif isinstance(node, Function):
+            name = node.name.lower()
+            if name not in FUNCTIONS:
+                raise NameError("Unknown function {}".format(node.name))
+            operands = [self._to_source(operand) for operand in node.iter_on_operands()]
+            return 'f_{}({})'.format(name, ', '.join(operands))
+        elif isinstance(node, UnaryOperator):
+            return UNARY_OPERATORS[node.OPERATOR].format(self._to_source(node.operand))
+        elif isinstance(node, BinaryOperator):
+            return BINARY_OPERATORS[node.OPERATOR].format(self._to_source(node.operand1),
+                                                          self._to_source(node.operand2))
+        else:
+            raise NotImplementedError("Cannot compile {}".format(node))
+
+    ##############################################
+
+    def __call__(self, variables=None, **kwargs):
+
+        if variables is not None:
+            kwargs = dict(variables, **kwargs)
+        try:
+            values = [kwargs[name] for name in self._variables]
+        except KeyError as e:
+            raise NameError("Undefined variable {} in {}".format(e.args[0], self._text))
+        return self._function(*values)
+
+    ##############################################
+
+    def __repr__(self):
+        return 'CompiledExpression({})'.format(self._text)
+
+####################################################################################################
+
+@functools.lru_cache(maxsize=4096)
+def parse_expression(text):
+    """Parse the expression *text* and return its AST, the ASTs are memoized by their text."""
+    ast = get_parser().parse(text)
+    if ast is None:
+        raise ValueError("Empty expression")
+    return ast
+
+####################################################################################################
+
+def iter_variables(ast):
+
+    """Yield the names of the variables of an AST, the constants like ``pi`` are excluded."""
+
+    if isinstance(ast, Variable):
+        if ast.name.lower() not in CONSTANTS:
+            yield ast.name
+    elif isinstance(ast, If):
+        for node in (ast.condition, ast.then_expression, ast.else_expression):
+            yield from iter_variables(node)
+    elif not isinstance(ast, Constant):
+        for node in ast.iter_on_operands():
+            yield from iter_variables(node)
+
+####################################################################################################
+
+@functools.lru_cache(maxsize=4096)
+def compile_expression(text):
+
+    """Compile the expression *text* and return a :class:`CompiledExpression`, the compiled
+    expressions are memoized by their text.
+
+    """
+
+    return CompiledExpression(text, parse_expression(text))
@@ -19,11 +19,20 @@
 ####################################################################################################
 
 """This module implements a parser for Spice expressions.
+
+The lexer and the LALR tables are precomputed and shipped in the modules :mod:`_lextab` and
+:mod:`_parsetab`, they are loaded read-only.  The tables must be regenerated using
+:meth:`Parser.write_tables` when the grammar is modified, else the parser falls back to build the
+tables at runtime.  Use :func:`get_parser` to share a parser instance in a process.
+
 """
 
 ####################################################################################################
 
+import functools
 import logging
+import os
+import sys
 
 ####################################################################################################
 
@@ -52,6 +61,9 @@ class Parser:
 
     _logger = _module_logger.getChild('Parser')
 
+    LEX_TABLE_MODULE = __package__ + '._lextab'
+    PARSE_TABLE_MODULE = __package__ + '._parsetab'
+
     ##############################################
 
     reserved = {
@@ -61,7 +73,7 @@ class Parser:
         'NAME',
         # 'INT', 'FLOAT',
         'NUMBER',
-        'SEMICOLON',
+        'SEMICOLON', 'COMMA',
         'LEFT_PARENTHESIS', 'RIGHT_PARENTHESIS',
         'SET',
         'NOT',
@@ -101,6 +113,7 @@ class Parser:
     ##############################################
 
     t_SEMICOLON = r';'
+    t_COMMA = r','
 
     t_LEFT_PARENTHESIS = r'\('
     t_RIGHT_PARENTHESIS = r'\)'
@@ -114,7 +127,7 @@ class Parser:
     t_MULTIPLY = r'\*'
     t_DIVIDE = r'/'
     t_MODULO = r'%'
-    t_INT_DIVIDE = r'\/'
+    t_INT_DIVIDE = r'\\'
 
     t_PLUS = r'\+'
     t_MINUS = r'-'
@@ -148,10 +161,8 @@ class Parser:
     # floating_constant = '(((('+fractional_constant+')'+exponent_part+'?)|([0-9]+'+exponent_part+'))[FfLl]?)'
 
     def t_NUMBER(self, t):
-        # 1 1. 1.23 .1
-        # r'\d*\.?\d+([eE][-+]?\d+)?'
-        # r'(\d+)(\.\d+)(e(\+|-)?(\d+))? | (\d+)e(\+|-)?(\d+)'
-        r'\d+\.\d+(e(\+|-)?(\d+))? | \d+\.(e(\+|-)?(\d+))? | \.\d+(e(\+|-)?(\d+))? | \d+'
+        # 1 1. 1.23 .1 1e3 and the SPICE scale factors 1k 10meg
+        r'(\d+\.\d* | \.\d+ | \d+)([eE][-+]?\d+)?[a-zA-Zμ]*'
         t.value = t.value
         return t
 
@@ -187,9 +198,9 @@ class Parser:
     #     'empty :'
     #     pass
 
-    def p_statement(self, t):
+    def p_statement(self, p):
         'statement : expression'
-        print('statement', t[1])
+        p[0] = p[1]
 
     # def p_program(self, p):
     #     '''program : statement
@@ -226,24 +237,23 @@ class Parser:
     #     else:
     #         p[0] = StatementList(p[1])
 
-    # def p_expression_list(self, p):
-    #     '''expression_list : expression
-    #                        | expression_list COMMA expression
-    #     '''
-    #     if len(p) == 3:
-    #         p[1].add(p[2])
-    #         p[0] = p[1]
-    #     else:
-    #         p[0] = StatementList(p[1])
+    def p_expression_list(self, p):
+        '''expression_list : expression
+                           | expression_list COMMA expression
+        '''
+        if len(p) == 4:
+            p[0] = p[1] + [p[3]]
+        else:
+            p[0] = [p[1]]
 
-    # def p_function(self, p):
-    #     '''function : NAME LEFT_PARENTHESIS expression_list RIGHT_PARENTHESIS
-    #                 | NAME LEFT_PARENTHESIS RIGHT_PARENTHESIS
-    #     '''
-    #     if len(p) == 5:
-    #         p[0] = Function(p[1], p[3])
-    #     else:
-    #         p[0] = Function(p[1])
+    def p_function(self, p):
+        '''function : NAME LEFT_PARENTHESIS expression_list RIGHT_PARENTHESIS
+                    | NAME LEFT_PARENTHESIS RIGHT_PARENTHESIS
+        '''
+        if len(p) == 5:
+            p[0] = Function(p[1], *p[3])
+        else:
+            p[0] = Function(p[1])
 
     def p_variable(self, p):
         '''variable : NAME
@@ -262,17 +272,23 @@ class Parser:
     def p_float(self, p):
         '''constant : NUMBER
         '''
-        if '.' in p[1]:
-            p[0] = FloatConstant(p[1])
-        else:
+        if p[1].isdigit():
             p[0] = IntConstant(p[1])
+        else:
+            p[0] = FloatConstant(p[1])
 
     def p_value(self, p):
         '''expression : variable
                       | constant
+                      | function
         '''
         p[0] = p[1]
 
+    def p_parenthesis(self, p):
+        '''expression : LEFT_PARENTHESIS expression RIGHT_PARENTHESIS
+        '''
+        p[0] = p[2]
+
     def p_unnary_operation(self, p):
         # OP ...
         '''expression : MINUS expression
@@ -313,10 +329,46 @@ class Parser:
 
     ##############################################
 
-    def _build(self, **kwargs):
+    def _build(self):
+
+        # The lexer table is only written if it is missing
+        self._lexer = lex.lex(module=self, optimize=True, lextab=self.LEX_TABLE_MODULE)
+        self._parser = yacc.yacc(module=self, tabmodule=self.PARSE_TABLE_MODULE,
+                                 write_tables=False, debug=False)
+
+    ##############################################
+
+    @classmethod
+    def _reflect(cls):
+        parser = cls.__new__(cls)
+        return parser, {name: getattr(parser, name) for name in dir(parser)}
+
+    ##############################################
+
+    @classmethod
+    def signature(cls):
+        """Return the signature of the grammar, it must match the one of the parser table."""
+        parser, pdict = cls._reflect()
+        reflect = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+        reflect.get_all()
+        return reflect.signature()
+
+    ##############################################
+
+    @classmethod
+    def write_tables(cls):
+
+        """Regenerate the lexer and parser tables in the package."""
 
-        self._lexer = lex.lex(module=self, **kwargs)
-        self._parser = yacc.yacc(module=self, **kwargs)
+        directory = os.path.dirname(__file__)
+        for module in (cls.LEX_TABLE_MODULE, cls.PARSE_TABLE_MODULE):
+            sys.modules.pop(module, None)
+            path = os.path.join(directory, module.rpartition('.')[2] + '.py')
+            if os.path.exists(path):
+                os.remove(path)
+        parser = cls._reflect()[0]
+        lex.lex(module=parser, optimize=True, lextab=cls.LEX_TABLE_MODULE, outputdir=directory)
+        yacc.yacc(module=parser, tabmodule=cls.PARSE_TABLE_MODULE, outputdir=directory, debug=False)
 
     ##############################################
 
@@ -329,8 +381,10 @@ class Parser:
 
     def parse(self, text):
 
+        """Parse the expression *text* and return its AST."""
+
         self._reset() # Fixme: after ?
-        self._parser.parse(text, lexer=self._lexer)
+        return self._parser.parse(text, lexer=self._lexer)
         # return self._program
 
     ##############################################
@@ -344,3 +398,10 @@ class Parser:
             if not token:
                 break
             print(token)
+
+####################################################################################################
+
+@functools.lru_cache(maxsize=None)
+def get_parser():
+    """Return the parser instance shared in the process."""
+    return Parser()
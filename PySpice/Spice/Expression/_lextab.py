@@ -0,0 +1,10 @@
+# _lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'COLON', 'COMMA', 'DIVIDE', 'EQUAL', 'GREATER', 'GREATER_EQUAL', 'IF', 'INT_DIVIDE', 'LEFT_PARENTHESIS', 'LESS', 'LESS_EQUAL', 'MINUS', 'MODULO', 'MULTIPLY', 'NAME', 'NOT', 'NOT_EQUAL', 'NUMBER', 'OR', 'PLUS', 'POWER', 'RIGHT_PARENTHESIS', 'SEMICOLON', 'SET'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_newline>\\r?\\n+)|(?P<t_NAME>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_NUMBER>(\\d+\\.\\d* | \\.\\d+ | \\d+)([eE][-+]?\\d+)?[a-zA-Zμ]*)|(?P<t_ignore_COMMENT>\\#[^\\n]*)|(?P<t_OR>\\|\\|)|(?P<t_POWER>\\*\\*)|(?P<t_AND>&&)|(?P<t_EQUAL>==)|(?P<t_GREATER_EQUAL>>=)|(?P<t_IF>\\?)|(?P<t_INT_DIVIDE>\\\\)|(?P<t_LEFT_PARENTHESIS>\\()|(?P<t_LESS_EQUAL><=)|(?P<t_MULTIPLY>\\*)|(?P<t_NOT_EQUAL>!=)|(?P<t_PLUS>\\+)|(?P<t_RIGHT_PARENTHESIS>\\))|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_MINUS>-)|(?P<t_MODULO>%)|(?P<t_NOT>!)|(?P<t_SEMICOLON>;)|(?P<t_SET>=)', [None, ('t_newline', 'newline'), ('t_NAME', 'NAME'), ('t_NUMBER', 'NUMBER'), None, None, (None, None), (None, 'OR'), (None, 'POWER'), (None, 'AND'), (None, 'EQUAL'), (None, 'GREATER_EQUAL'), (None, 'IF'), (None, 'INT_DIVIDE'), (None, 'LEFT_PARENTHESIS'), (None, 'LESS_EQUAL'), (None, 'MULTIPLY'), (None, 'NOT_EQUAL'), (None, 'PLUS'), (None, 'RIGHT_PARENTHESIS'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GREATER'), (None, 'LESS'), (None, 'MINUS'), (None, 'MODULO'), (None, 'NOT'), (None, 'SEMICOLON'), (None, 'SET')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
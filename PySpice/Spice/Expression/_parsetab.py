@@ -0,0 +1,59 @@
+
+# _parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'statementleftIFleftORleftANDleftGREATERLESSGREATER_EQUALLESS_EQUALNOT_EQUALEQUALleftMINUSPLUSleftINT_DIVIDEMODULODIVIDEMULTIPLYleftPOWERleftNOTAND COLON COMMA DIVIDE EQUAL GREATER GREATER_EQUAL IF INT_DIVIDE LEFT_PARENTHESIS LESS LESS_EQUAL MINUS MODULO MULTIPLY NAME NOT NOT_EQUAL NUMBER OR PLUS POWER RIGHT_PARENTHESIS SEMICOLON SETstatement : expressionexpression_list : expression\n                           | expression_list COMMA expression\n        function : NAME LEFT_PARENTHESIS expression_list RIGHT_PARENTHESIS\n                    | NAME LEFT_PARENTHESIS RIGHT_PARENTHESIS\n        variable : NAME\n        constant : NUMBER\n        expression : variable\n                      | constant\n                      | function\n        expression : LEFT_PARENTHESIS expression RIGHT_PARENTHESIS\n        expression : MINUS expression\n                      | NOT expression\n        expression : expression POWER expression\n                      | expression MULTIPLY expression\n                      | expression DIVIDE expression\n                      | expression MODULO expression\n                      | expression INT_DIVIDE expression\n                      | expression PLUS expression\n                      | expression MINUS expression\n                      | expression EQUAL expression\n                      | expression NOT_EQUAL expression\n                      | expression LESS expression\n                      | expression GREATER expression\n                      | expression LESS_EQUAL expression\n                      | expression GREATER_EQUAL expression\n                      | expression AND expression\n                      | expression OR expression\n        expression : expression IF expression COLON expression\n        '
+    
+_lr_action_items = {'LEFT_PARENTHESIS':([0,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[6,6,6,6,30,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'MINUS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,51,52,53,54,55,],[7,17,-8,-9,-10,7,7,7,-6,-7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,17,-12,-13,7,-14,-15,-16,-17,-18,-19,-20,17,17,17,17,17,17,17,17,17,-11,-5,17,7,-4,7,17,17,]),'NOT':([0,6,7,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'NAME':([0,6,7,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'NUMBER':([0,6,7,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'$end':([1,2,3,4,5,9,10,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,47,49,52,54,],[0,-1,-8,-9,-10,-6,-7,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-11,-5,-4,-29,]),'POWER':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[11,-8,-9,-10,-6,-7,11,11,-13,-14,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-11,-5,11,-4,11,11,]),'MULTIPLY':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[12,-8,-9,-10,-6,-7,12,12,-13,-14,-15,-16,-17,-18,12,12,12,12,12,12,12,12,12,12,12,-11,-5,12,-4,12,12,]),'DIVIDE':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[13,-8,-9,-10,-6,-7,13,13,-13,-14,-15,-16,-17,-18,13,13,13,13,13,13,13,13,13,13,13,-11,-5,13,-4,13,13,]),'MODULO':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[14,-8,-9,-10,-6,-7,14,14,-13,-14,-15,-16,-17,-18,14,14,14,14,14,14,14,14,14,14,14,-11,-5,14,-4,14,14,]),'INT_DIVIDE':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[15,-8,-9,-10,-6,-7,15,15,-13,-14,-15,-16,-17,-18,15,15,15,15,15,15,15,15,15,15,15,-11,-5,15,-4,15,15,]),'PLUS':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[16,-8,-9,-10,-6,-7,16,-12,-13,-14,-15,-16,-17,-18,-19,-20,16,16,16,16,16,16,16,16,16,-11,-5,16,-4,16,16,]),'EQUAL':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[18,-8,-9,-10,-6,-7,18,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,18,18,18,-11,-5,18,-4,18,18,]),'NOT_EQUAL':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[19,-8,-9,-10,-6,-7,19,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,19,19,19,-11,-5,19,-4,19,19,]),'LESS':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[20,-8,-9,-10,-6,-7,20,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,20,20,20,-11,-5,20,-4,20,20,]),'GREATER':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[21,-8,-9,-10,-6,-7,21,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,21,21,21,-11,-5,21,-4,21,21,]),'LESS_EQUAL':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[22,-8,-9,-10,-6,-7,22,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,22,22,22,-11,-5,22,-4,22,22,]),'GREATER_EQUAL':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[23,-8,-9,-10,-6,-7,23,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,23,23,23,-11,-5,23,-4,23,23,]),'AND':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[24,-8,-9,-10,-6,-7,24,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,24,24,-11,-5,24,-4,24,24,]),'OR':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[25,-8,-9,-10,-6,-7,25,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,25,-11,-5,25,-4,25,25,]),'IF':([2,3,4,5,9,10,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,52,54,55,],[26,-8,-9,-10,-6,-7,26,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,26,-11,-5,26,-4,26,26,]),'RIGHT_PARENTHESIS':([3,4,5,9,10,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,47,48,49,50,52,54,55,],[-8,-9,-10,-6,-7,47,-12,-13,49,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-11,52,-5,-2,-4,-29,-3,]),'COLON':([3,4,5,9,10,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,52,54,],[-8,-9,-10,-6,-7,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,51,-11,-5,-4,-29,]),'COMMA':([3,4,5,9,10,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,47,48,49,50,52,54,55,],[-8,-9,-10,-6,-7,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-11,53,-5,-2,-4,-29,-3,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'statement':([0,],[1,]),'expression':([0,6,7,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[2,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,50,54,55,]),'variable':([0,6,7,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'constant':([0,6,7,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'function':([0,6,7,8,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,30,51,53,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'expression_list':([30,],[48,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> statement","S'",1,None,None,None),
+  ('statement -> expression','statement',1,'p_statement','Parser.py',202),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','Parser.py',241),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','Parser.py',242),
+  ('function -> NAME LEFT_PARENTHESIS expression_list RIGHT_PARENTHESIS','function',4,'p_function','Parser.py',250),
+  ('function -> NAME LEFT_PARENTHESIS RIGHT_PARENTHESIS','function',3,'p_function','Parser.py',251),
+  ('variable -> NAME','variable',1,'p_variable','Parser.py',259),
+  ('constant -> NUMBER','constant',1,'p_float','Parser.py',273),
+  ('expression -> variable','expression',1,'p_value','Parser.py',281),
+  ('expression -> constant','expression',1,'p_value','Parser.py',282),
+  ('expression -> function','expression',1,'p_value','Parser.py',283),
+  ('expression -> LEFT_PARENTHESIS expression RIGHT_PARENTHESIS','expression',3,'p_parenthesis','Parser.py',288),
+  ('expression -> MINUS expression','expression',2,'p_unnary_operation','Parser.py',293),
+  ('expression -> NOT expression','expression',2,'p_unnary_operation','Parser.py',294),
+  ('expression -> expression POWER expression','expression',3,'p_binary_operation','Parser.py',300),
+  ('expression -> expression MULTIPLY expression','expression',3,'p_binary_operation','Parser.py',301),
+  ('expression -> expression DIVIDE expression','expression',3,'p_binary_operation','Parser.py',302),
+  ('expression -> expression MODULO expression','expression',3,'p_binary_operation','Parser.py',303),
+  ('expression -> expression INT_DIVIDE expression','expression',3,'p_binary_operation','Parser.py',304),
+  ('expression -> expression PLUS expression','expression',3,'p_binary_operation','Parser.py',305),
+  ('expression -> expression MINUS expression','expression',3,'p_binary_operation','Parser.py',306),
+  ('expression -> expression EQUAL expression','expression',3,'p_binary_operation','Parser.py',307),
+  ('expression -> expression NOT_EQUAL expression','expression',3,'p_binary_operation','Parser.py',308),
+  ('expression -> expression LESS expression','expression',3,'p_binary_operation','Parser.py',309),
+  ('expression -> expression GREATER expression','expression',3,'p_binary_operation','Parser.py',310),
+  ('expression -> expression LESS_EQUAL expression','expression',3,'p_binary_operation','Parser.py',311),
+  ('expression -> expression GREATER_EQUAL expression','expression',3,'p_binary_operation','Parser.py',312),
+  ('expression -> expression AND expression','expression',3,'p_binary_operation','Parser.py',313),
+  ('expression -> expression OR expression','expression',3,'p_binary_operation','Parser.py',314),
+  ('expression -> expression IF expression COLON expression','expression',5,'p_if','Parser.py',320),
+]
@@ -863,3 +863,8 @@ class RandomCurrentSource(CurrentSource, CurrentSourceMixinAbc, RandomMixin):
     ##############################################
 
     format_spice_parameters = RandomMixin.format_spice_parameters
+
+####################################################################################################
+
+from . import add_element_shortcuts
+add_element_shortcuts()
@@ -20,12 +20,15 @@
 
 ####################################################################################################
 
+from contextlib import contextmanager
+import json
 import logging
+import os
 import re
 
 ####################################################################################################
 
-from ..Tools.File import Directory
+from ..Tools.File import Directory, File
 from .Parser import SpiceParser
 
 ####################################################################################################
@@ -50,6 +53,22 @@ class SpiceLibrary:
 
         spice_library['1N4148']
 
+    The files are scanned using the fast mode of the parser, cf. :meth:`SpiceParser.scan`.  If
+    *index* is set, then the result of the scan is stored in a persistent index which maps each
+    sub-circuit and model name to a file and a byte range.  On the next instantiation, only the
+    files whose modification time or size changed are scanned again, as well as the files which
+    include, directly or not, a file which changed, was added or was removed.  *index* is a path to the
+    index file, or True to use the file :attr:`INDEX_FILENAME` at the root of the library.  By
+    default, the library directory is never written.
+
+    The files can be scanned in parallel by a pool of *workers* processes, None means the number of
+    processors.  The result doesn't depend on the number of workers.
+
+    If *recurse* is set, the included files are resolved using *include_resolver*, cf.
+    :class:`IncludeResolver`, a new resolver is created if it is None.  The includes are resolved by
+    this process once the files are scanned, thus each included file is scanned once whatever the
+    number of workers.
+
     """
 
     _logger = _module_logger.getChild('Library')
@@ -62,36 +81,63 @@ class SpiceLibrary:
         '.mod@xyce',
     )
 
+    INDEX_FILENAME = '.pyspice-library-index.json'
+    INDEX_VERSION = 3
+
     ##############################################
 
-    def __init__(self, root_path, recurse=False, section=None):
+    def __init__(self, root_path, recurse=False, section=None, index=False, workers=1, include_resolver=None):
 
         self._directory = Directory(root_path).expand_vars_and_user()
+        self._recurse = recurse
+        self._section = section
+        if recurse and include_resolver is None:
+            include_resolver = IncludeResolver()
+        self._include_resolver = include_resolver
 
         self._subcircuits = {}
         self._models = {}
+        self._byte_ranges = {}
+
+        self._index_path = self._get_index_path(index)
+        index_entries = self._load_index()
 
+        files = []   # (path, key, entry)
+        files_to_scan = []
+        stamps = {}
         for path in self._directory.iter_file():
             extension = path.extension.lower()
             if extension in self.EXTENSIONS:
-                self._logger.debug("Parse {}".format(path))
-                try:
-                    spice_parser = SpiceParser(path=path, recurse=recurse, section=section)
-                    for lib in spice_parser.incl_libs:
-                        self._subcircuits.update(lib._subcircuits)
-                        self._models.update(lib._models)
-                except Exception as e:
-                    # Parse problem with this file, so skip it and keep going.
-                    self._logger.warn("Problem parsing {path} - {e}".format(**locals()))
-                    continue
-                if spice_parser.is_only_subcircuit():
-                    for subcircuit in spice_parser.subcircuits:
-                        name = self._suffix_name(subcircuit.name, extension)
-                        self._subcircuits[name] = path
-                elif spice_parser.is_only_model():
-                    for model in spice_parser.models:
-                        name = self._suffix_name(model.name, extension)
-                        self._models[name] = path
+                key = str(path.relative_to(self._directory))
+                stat = os.stat(str(path))
+                entry = index_entries.get(key)
+                if (entry is None
+                    or entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size
+                    or not self._are_dependencies_unchanged(entry, stamps)):
+                    entry = None
+                    files_to_scan.append((len(files), str(path), extension, stat))
+                files.append([path, key, entry])
+
+        for (i, path, extension, stat), entry in zip(files_to_scan, self._scan_files(files_to_scan, workers)):
+            if 'error' in entry:
+                # Parse problem with this file, so skip it and keep going.
+                self._logger.warn("Problem parsing {} - {}".format(path, entry['error']))
+            entry['mtime'] = stat.st_mtime_ns
+            entry['size'] = stat.st_size
+            files[i][2] = entry
+
+        # merge in the directory order
+        entries = {}
+        # the files read by this library, cf. _resolve_includes
+        self._dependencies = {}
+        for path, key, entry in files:
+            entries[key] = entry
+            self._add_entry(path, entry)
+            self._dependencies[os.path.realpath(str(path))] = [entry['mtime'], entry['size']]
+            self._dependencies.update(entry.get('dependencies', {}))
+
+        if entries != index_entries:
+            self._save_index(entries)
 
     ##############################################
 
@@ -105,6 +151,158 @@ class SpiceLibrary:
 
     ##############################################
 
+    def _scan_files(self, files, workers):
+
+        """Scan the files and return the list of entries."""
+
+        args = [(path, extension, self._recurse, self._section) for i, path, extension, stat in files]
+        if workers == 1 or len(files) <= 1:
+            entries = [_scan_file(*arg) for arg in args]
+        else:
+            self._logger.debug("Scan {} files using a process pool".format(len(files)))
+            number_of_workers = workers or os.cpu_count() or 1
+            chunksize = max(1, len(files) // (4 * number_of_workers))
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+                entries = list(executor.map(_scan_file, *zip(*args), chunksize=chunksize))
+
+        # the include resolver is shared by the files
+        for (i, path, extension, stat), entry in zip(files, entries):
+            includes = entry.pop('includes', None)
+            if includes:
+                self._resolve_includes(path, includes, entry)
+
+        return entries
+
+    ##############################################
+
+    def _resolve_includes(self, path, includes, entry):
+
+        """Add the definitions of the files included by *path* to *entry*.
+
+        The stamps of the included files are stored in the ``dependencies`` item of the entry, a
+        missing file has a None stamp.
+
+        """
+
+        dependencies = entry.setdefault('dependencies', {})
+        try:
+            with self._include_resolver.scope(path):
+                for include in includes:
+                    include_path = os.path.join(os.path.dirname(path), include)
+                    dependencies[IncludeResolver._key(include_path)] = self._stamp(include_path)
+                    lib = self._include_resolver.resolve(include_path)
+                    if lib is None:
+                        continue
+                    dependencies.update(lib._dependencies)
+                    for name, included_path in lib._subcircuits.items():
+                        entry['included_subcircuits'][name] = str(included_path)
+                    for name, included_path in lib._models.items():
+                        entry['included_models'][name] = str(included_path)
+        except Exception as e:
+            # the file is skipped as for a parse problem
+            entry.update(subcircuits={}, models={}, error=str(e))
+
+    ##############################################
+
+    @staticmethod
+    def _stamp(path):
+        """Return the modification time and the size of a file, or None if it doesn't exist."""
+        try:
+            stat = os.stat(os.path.expandvars(os.path.expanduser(str(path))))
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    ##############################################
+
+    def _are_dependencies_unchanged(self, entry, stamps):
+        """Return True if the stamps of the included files of an entry are unchanged."""
+        for path, stamp in entry.get('dependencies', {}).items():
+            if path not in stamps:
+                stamps[path] = self._stamp(path)
+            if stamps[path] != stamp:
+                return False
+        return True
+
+    ##############################################
+
+    def _add_entry(self, path, entry):
+
+        for key, names in (('included_subcircuits', self._subcircuits),
+                           ('included_models', self._models)):
+            for name, included_path in entry[key].items():
+                names[name] = File(os.path.basename(included_path), os.path.dirname(included_path))
+                self._byte_ranges.pop(name, None)
+
+        for key, names in (('subcircuits', self._subcircuits), ('models', self._models)):
+            for name, byte_range in entry[key].items():
+                names[name] = path
+                self._byte_ranges[name] = byte_range
+
+    ##############################################
+
+    def _get_index_path(self, index):
+        if index is True:
+            if not self._directory.is_directory():
+                return None
+            return os.path.join(str(self._directory), self.INDEX_FILENAME)
+        elif index:
+            return str(index)
+        else:
+            return None
+
+    ##############################################
+
+    def _index_header(self):
+        return {
+            'version': self.INDEX_VERSION,
+            'recurse': bool(self._recurse),
+            'section': self._section,
+        }
+
+    ##############################################
+
+    def _load_index(self):
+
+        """Return the file entries of the index or an empty dict if the index is missing or
+        outdated.
+
+        """
+
+        if self._index_path is None or not os.path.exists(self._index_path):
+            return {}
+        try:
+            with open(self._index_path, 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            self._logger.warning("Cannot read library index {} - {}".format(self._index_path, e))
+            return {}
+        if index.get('header') != self._index_header():
+            return {}
+        return index.get('files', {})
+
+    ##############################################
+
+    def _save_index(self, entries):
+
+        if self._index_path is None:
+            return
+        index = {
+            'header': self._index_header(),
+            'files': entries,
+        }
+        tmp_path = self._index_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self._index_path)
+        except OSError as e:
+            # e.g. read-only library
+            self._logger.info("Cannot write library index {} - {}".format(self._index_path, e))
+
+    ##############################################
+
     def __getitem__(self, name):
 
         if name in self._subcircuits:
@@ -118,6 +316,36 @@ class SpiceLibrary:
 
     ##############################################
 
+    def location(self, name):
+
+        """Return the path of the file which defines a sub-circuit or a model, and the byte offset of
+        the definition, the offset is None for the definitions found in an included file.
+
+        """
+
+        byte_range = self._byte_ranges.get(name)
+        return self[name], byte_range[0] if byte_range is not None else None
+
+    ##############################################
+
+    def definition(self, name):
+
+        """Return the text of the definition of a sub-circuit or a model, it is read from the file
+        using the indexed byte range.
+
+        """
+
+        path = self[name]
+        byte_range = self._byte_ranges.get(name)
+        if byte_range is None:
+            raise KeyError("No byte range for {}".format(name))
+        start, stop = byte_range
+        with open(str(path), 'rb') as f:
+            f.seek(start)
+            return f.read(stop - start).decode('utf-8', 'replace')
+
+    ##############################################
+
     @property
     def subcircuits(self):
         """ Dictionary of sub-circuits """
@@ -148,3 +376,107 @@ class SpiceLibrary:
             if re.search(s, name):
                 matches[name] = mdl_subckt
         return matches
+
+####################################################################################################
+
+class IncludeResolver:
+
+    """This class resolves the included files of a recursive parse session.
+
+    Each included file is scanned once, the library is memoized by its real path and shared by the
+    subsequent includes.  An include of a file which is being resolved, i.e. an include cycle, is
+    skipped with a warning.
+
+    """
+
+    _logger = _module_logger.getChild('IncludeResolver')
+
+    ##############################################
+
+    def __init__(self):
+        self._libraries = {}
+        self._stack = []
+
+    ##############################################
+
+    @staticmethod
+    def _key(path):
+        return os.path.realpath(os.path.expandvars(os.path.expanduser(str(path))))
+
+    ##############################################
+
+    @contextmanager
+    def scope(self, path):
+
+        """Context manager to mark the file *path* as being resolved."""
+
+        if path is None:
+            yield
+            return
+        self._stack.append(self._key(path))
+        try:
+            yield
+        finally:
+            self._stack.pop()
+
+    ##############################################
+
+    def resolve(self, path):
+
+        """Return the :class:`SpiceLibrary` of the included file *path*, or None if the include
+        closes a cycle.
+
+        """
+
+        key = self._key(path)
+        library = self._libraries.get(key)
+        if library is not None:
+            return library
+        if key in self._stack:
+            self._logger.warning("Include cycle {}".format(' -> '.join(self._stack[self._stack.index(key):] + [key])))
+            return None
+        with self.scope(key):
+            library = SpiceLibrary(root_path=key, recurse=True, index=False, include_resolver=self)
+        self._libraries[key] = library
+        return library
+
+    ##############################################
+
+    def __len__(self):
+        return len(self._libraries)
+
+####################################################################################################
+
+def _scan_file(path, extension, recurse, section):
+
+    """Scan a file and return its index entry, this function is run in the worker processes.
+
+    If *recurse* is set, the included files are returned in the ``includes`` item of the entry, they
+    are resolved by :meth:`SpiceLibrary._resolve_includes`.
+
+    """
+
+    _module_logger.debug("Scan {}".format(path))
+    entry = {
+        'subcircuits': {},
+        'models': {},
+        'included_subcircuits': {},
+        'included_models': {},
+    }
+    try:
+        scan = SpiceParser.scan(path, section=section)
+        if recurse and scan.includes:
+            entry['includes'] = list(scan.includes)
+    except Exception as e:
+        entry['error'] = str(e)
+        return entry
+    if scan.is_only_subcircuit():
+        definitions, key = scan.subcircuits, 'subcircuits'
+    elif scan.is_only_model():
+        definitions, key = scan.models, 'models'
+    else:
+        definitions = ()
+    for definition in definitions:
+        name = SpiceLibrary._suffix_name(definition.name, extension)
+        entry[key][name] = [definition.start, definition.stop]
+    return entry
@@ -0,0 +1,469 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+r"""This module implements a model-order reduction of linear RC/RLC networks using the PRIMA
+algorithm (Passive Reduced-order Interconnect Macromodeling Algorithm).
+
+A linear network made of resistors, capacitors and inductors is connected to the rest of the
+circuit through a few nodes, the *ports*.  Its MNA system excited by the port currents *i* reads
+
+.. math::
+
+    (G + s C) x = B i \qquad v = B^T x
+
+where *v* are the port voltages.  The inductor branch equations are negated so as *C* is positive
+semi-definite.  A block Krylov basis *V* of :math:`(G + s_0 C)^{-1} C` starting with
+:math:`(G + s_0 C)^{-1} B` is computed using a block Arnoldi process, then the system is projected
+by congruence
+
+.. math::
+
+    G_r = V^T G V \qquad C_r = V^T C V \qquad B_r = V^T B
+
+which matches the first moments of the port impedance at :math:`s_0` and preserves passivity.
+
+The reduced model is emitted as a :class:`PySpice.Spice.Netlist.SubCircuit` made of one capacitor
+per state, resistors or voltage controlled current sources, and voltage and current controlled
+sources which implement the port coupling.  For a RC network, the reduced system is diagonalised
+and the sub-circuit only requires a resistor per state.
+
+Example of usage::
+
+    models = circuit.reduce_order(preserved_nodes=('out',), order=4)
+
+"""
+
+####################################################################################################
+
+import logging
+
+import numpy as np
+import scipy.sparse as sparse
+import scipy.sparse.linalg as sparse_linalg
+
+####################################################################################################
+
+from ..BasicElement import Capacitor, Inductor
+from ..Netlist import SubCircuit
+from ..Reduction import coupled_inductor_names, passive_value
+from ..Topology import UnionFind
+from .Solver import MnaSystem, SingularMatrixError
+
+####################################################################################################
+
+_module_logger = logging.getLogger(__name__)
+
+####################################################################################################
+
+class LinearNetwork:
+
+    """This class stores a linear RC/RLC network of a netlist.
+
+    Public Attributes:
+
+      :attr:`elements`
+        the resistors, capacitors and inductors of the network
+
+      :attr:`ports`
+        the nodes connected to the rest of the circuit
+
+      :attr:`internal_nodes`
+        the nodes only connected to the network
+
+    """
+
+    ##############################################
+
+    def __init__(self, elements, ports, internal_nodes):
+        self.elements = elements
+        self.ports = ports
+        self.internal_nodes = internal_nodes
+
+    ##############################################
+
+    @property
+    def has_inductor(self):
+        return any(isinstance(element, Inductor) for element in self.elements)
+
+    @property
+    def is_resistive(self):
+        return not any(isinstance(element, (Capacitor, Inductor)) for element in self.elements)
+
+    ##############################################
+
+    def __repr__(self):
+        return 'LinearNetwork: {} elements, {} ports, {} internal nodes'.format(
+            len(self.elements), len(self.ports), len(self.internal_nodes))
+
+####################################################################################################
+
+def find_linear_networks(netlist, preserved_nodes=()):
+
+    """Return the list of the :class:`LinearNetwork` of a netlist.
+
+    A network is a connected set of plain resistors, capacitors and inductors, the ground is the
+    reference and thus doesn't connect the elements.  A port is a node which is also connected to
+    another element, an anchored node or a node listed in *preserved_nodes*.
+
+    """
+
+    preserved_node_names = set([str(node) for node in preserved_nodes])
+    preserved_node_names |= set([str(node) for node in netlist._anchored_nodes()])
+    coupled_inductors = coupled_inductor_names(netlist)
+
+    passive_elements = set()
+    union_find = UnionFind()
+    for element in netlist.elements:
+        if passive_value(element, coupled_inductors) is None:
+            continue
+        nodes = [node for node in element.nodes if not node.is_ground_node]
+        if not nodes:
+            continue
+        passive_elements.add(element)
+        for node in nodes:
+            union_find.add(node)
+        if len(nodes) == 2:
+            union_find.union(*nodes)
+
+    groups = {}
+    for element in netlist.elements:   # keep the netlist order
+        if element in passive_elements:
+            node = [node for node in element.nodes if not node.is_ground_node][0]
+            groups.setdefault(union_find.find(node), []).append(element)
+
+    networks = []
+    for elements in groups.values():
+        ports = []
+        internal_nodes = []
+        visited = set()
+        for element in elements:
+            for node in element.nodes:
+                if node.is_ground_node or node in visited:
+                    continue
+                visited.add(node)
+                if (node.name in preserved_node_names or
+                    any(pin.element not in passive_elements for pin in node.pins)):
+                    ports.append(node)
+                else:
+                    internal_nodes.append(node)
+        networks.append(LinearNetwork(elements, ports, internal_nodes))
+
+    return networks
+
+####################################################################################################
+
+class ReducedOrderModel:
+
+    r"""This class implements the reduced-order model of a linear network.
+
+    The model is written as
+
+    .. math::
+
+        (A + s I) z = B i \qquad v = B^T z
+
+    where *A* is diagonal for a RC network.
+
+    """
+
+    ##############################################
+
+    def __init__(self, port_names, A, B, is_diagonal, capacitance=1.):
+        self.port_names = list(port_names)
+        self.A = A
+        self.B = B
+        self.is_diagonal = is_diagonal
+        self.capacitance = capacitance   # typical node capacitance of the network
+        self.subcircuit = None
+        self.element = None
+
+    ##############################################
+
+    @property
+    def order(self):
+        return self.A.shape[0]
+
+    ##############################################
+
+    def port_impedance(self, frequencies):
+
+        """Return the impedance matrices of the model for an array of frequencies.
+
+        Return an array of shape (number of frequencies, number of ports, number of ports).
+
+        """
+
+        s = 2j * np.pi * np.asarray(frequencies, dtype=float)
+        identity = np.eye(self.order)
+        M = self.A[np.newaxis, :, :] + s[:, np.newaxis, np.newaxis] * identity[np.newaxis, :, :]
+        X = np.linalg.solve(M, np.broadcast_to(self.B, (len(s),) + self.B.shape))
+        return self.B.T[np.newaxis, :, :] @ X
+
+    ##############################################
+
+    def to_subcircuit(self, name, capacitance=None, shunt_resistance=1e12, tolerance=1e-12):
+
+        """Return a :class:`PySpice.Spice.Netlist.SubCircuit` implementing the model.
+
+        The external nodes are named *port1*, *port2* ... in the order of :attr:`port_names`.
+
+        Each state is a node *zk* with a capacitor of value *capacitance* to the ground, by default
+        the typical node capacitance of the network, the states are scaled so as the element values
+        are in a realistic range.  The states having a null
+        pole are shunted by a *shunt_resistance* resistor so as to provide a DC path to ground.  The
+        port *p* is a chain of voltage controlled voltage sources which sum the state voltages,
+        terminated by a *Vsensep* voltage source which drives the current controlled current sources
+        feeding the states.
+
+        """
+
+        number_of_ports = len(self.port_names)
+        port_nodes = ['port{}'.format(p + 1) for p in range(number_of_ports)]
+        subcircuit = SubCircuit(name, *port_nodes)
+        gnd = subcircuit.gnd
+
+        if capacitance is None:
+            capacitance = self.capacitance
+        # scale z' = z / sqrt(c) so as the state capacitance is c
+        A = self.A * capacitance
+        B = self.B * np.sqrt(capacitance)
+        threshold = tolerance * max(np.abs(A).max(), np.finfo(float).tiny)
+        gain_threshold = tolerance * max(np.abs(B).max(), np.finfo(float).tiny)
+
+        state_nodes = ['z{}'.format(k + 1) for k in range(self.order)]
+        for k, node in enumerate(state_nodes):
+            subcircuit.C(k + 1, node, gnd, capacitance)
+            if self.is_diagonal:
+                conductance = A[k, k]
+                resistance = 1 / conductance if conductance > threshold else shunt_resistance
+                subcircuit.R(k + 1, node, gnd, resistance)
+            else:
+                for j, control_node in enumerate(state_nodes):
+                    if abs(A[k, j]) > threshold:
+                        subcircuit.VCCS('{}_{}'.format(k + 1, j + 1), node, gnd, control_node, gnd, A[k, j])
+                subcircuit.R(k + 1, node, gnd, shunt_resistance)
+
+        for p, port_node in enumerate(port_nodes):
+            states = [k for k in range(self.order) if abs(B[k, p]) > gain_threshold]
+            sense_node = 'sense{}'.format(p + 1)
+            node = port_node
+            for i, k in enumerate(states):
+                next_node = sense_node if i == len(states) - 1 else 'chain{}_{}'.format(p + 1, i + 1)
+                subcircuit.VCVS('{}_{}'.format(p + 1, k + 1), node, next_node, state_nodes[k], gnd, B[k, p])
+                node = next_node
+            subcircuit.V('sense{}'.format(p + 1), node, gnd, 0)
+            for k in states:
+                subcircuit.F('{}_{}'.format(p + 1, k + 1), gnd, state_nodes[k],
+                             'Vsense{}'.format(p + 1), B[k, p])
+
+        return subcircuit
+
+####################################################################################################
+
+class PrimaReducer:
+
+    """This class implements the model-order reduction of the linear networks of a netlist.
+
+    Parameters:
+
+      *order*
+        number of block moments matched at each port, the order of the reduced model is lower or
+        equal to *order* times the number of ports
+
+      *expansion_frequency*
+        frequency of the expansion point, by default the moments are matched at DC, or at a
+        frequency six decades below the fastest node if the network doesn't have a DC path to
+        ground
+
+      *minimum_internal_nodes*
+        networks having less internal nodes are left untouched
+
+      *preserved_nodes*
+        list of nodes which must not be removed, e.g. the probed nodes
+
+      *shunt_resistance*
+        resistance used to provide a DC path to the states having a null pole
+
+      *tolerance*
+        relative tolerance used for the deflation of the Krylov basis
+
+    """
+
+    _logger = _module_logger.getChild('PrimaReducer')
+
+    ##############################################
+
+    def __init__(self,
+                 order=4,
+                 expansion_frequency=None,
+                 minimum_internal_nodes=10,
+                 preserved_nodes=(),
+                 shunt_resistance=1e12,
+                 tolerance=1e-10,
+                 ):
+
+        if order < 1:
+            raise ValueError("Order must be strictly positive")
+
+        self._order = int(order)
+        self._expansion_frequency = expansion_frequency
+        self._minimum_internal_nodes = minimum_internal_nodes
+        self._preserved_nodes = preserved_nodes
+        self._shunt_resistance = shunt_resistance
+        self._tolerance = tolerance
+
+    ##############################################
+
+    def _krylov_basis(self, G, C, B):
+
+        """Return an orthonormal basis of the block Krylov subspace."""
+
+        if self._expansion_frequency is not None:
+            s0 = 2 * np.pi * float(self._expansion_frequency)
+        else:
+            s0 = 0
+        try:
+            lu = sparse_linalg.splu((G + s0 * C).tocsc())
+        except RuntimeError:
+            if self._expansion_frequency is not None:
+                raise SingularMatrixError("Singular matrix at the expansion point")
+            # no DC path to ground
+            s0 = 1e-6 * abs(G.diagonal()).sum() / max(abs(C.diagonal()).sum(), np.finfo(float).tiny)
+            self._logger.info('Use expansion point {:.3e} Hz'.format(s0 / (2 * np.pi)))
+            lu = sparse_linalg.splu((G + s0 * C).tocsc())
+
+        blocks = []
+        W = lu.solve(B)
+        for j in range(self._order):
+            norm = np.linalg.norm(W)
+            if not norm:
+                break
+            # block modified Gram-Schmidt, done twice for stability
+            for i in range(2):
+                for V in blocks:
+                    W = W - V @ (V.T @ W)
+            # orthonormalise the block and deflate the dependent vectors
+            U, S, Vt = np.linalg.svd(W, full_matrices=False)
+            V = U[:, S > self._tolerance * norm]
+            if not V.shape[1]:
+                break
+            blocks.append(V)
+            W = lu.solve(C @ V)
+
+        return np.hstack(blocks)
+
+    ##############################################
+
+    def reduce_network(self, netlist, network):
+
+        """Return the :class:`ReducedOrderModel` of a :class:`LinearNetwork`.
+
+        Raise a :class:`PySpice.Spice.Mna.Solver.SingularMatrixError` if the reduced capacitance
+        matrix is singular.
+
+        """
+
+        system = MnaSystem(netlist, elements=network.elements)
+        port_names = [node.name for node in network.ports]
+        B = system.port_incidence(port_names)
+
+        # Negate the inductor branch equations so as C is positive semi-definite
+        signs = np.ones(system.size)
+        signs[len(system.node_names):] = -1
+        S = sparse.diags(signs)
+        G = (S @ system.G).tocsc()
+        C = (S @ system.C).tocsc()
+
+        V = self._krylov_basis(G, C, B)
+        Gr = V.T @ (G @ V)
+        Cr = V.T @ (C @ V)
+        Br = V.T @ B
+
+        # Change the basis so as the capacitance matrix is the identity
+        try:
+            L = np.linalg.cholesky((Cr + Cr.T) / 2)
+        except np.linalg.LinAlgError:
+            raise SingularMatrixError('Singular reduced capacitance matrix for {}'.format(network))
+        L_inv = np.linalg.inv(L)
+        A = L_inv @ Gr @ L_inv.T
+        B = L_inv @ Br
+
+        is_diagonal = not network.has_inductor
+        if is_diagonal:
+            # A is symmetric, thus diagonalisable by an orthogonal matrix
+            poles, U = np.linalg.eigh((A + A.T) / 2)
+            A = np.diag(poles)
+            B = U.T @ B
+
+        node_capacitances = np.abs(C.diagonal()[:len(system.node_names)])
+        capacitance = node_capacitances.mean() if node_capacitances.any() else 1.
+
+        return ReducedOrderModel(port_names, A, B, is_diagonal, capacitance)
+
+    ##############################################
+
+    def _subcircuit_name(self, netlist):
+        names = set(netlist.subcircuit_names)
+        i = 1
+        while 'prima{}'.format(i) in names or 'Xprima{}'.format(i) in netlist._elements:
+            i += 1
+        return 'prima{}'.format(i)
+
+    ##############################################
+
+    def reduce(self, netlist):
+
+        """Replace in place the linear networks of the netlist by a sub-circuit implementing their
+        reduced-order model.
+
+        The purely resistive networks are left untouched.  The models are computed before the
+        netlist is modified, thus the netlist is unchanged if :meth:`reduce_network` raises an
+        error.
+
+        Return the list of the :class:`ReducedOrderModel` instances.
+
+        """
+
+        networks = []
+        for network in find_linear_networks(netlist, self._preserved_nodes):
+            number_of_nodes = len(network.ports) + len(network.internal_nodes)
+            if (not network.ports or network.is_resistive or
+                len(network.internal_nodes) < self._minimum_internal_nodes):
+                continue
+            model = self.reduce_network(netlist, network)
+            if model.order < number_of_nodes:
+                networks.append((network, model))
+
+        models = []
+        for network, model in networks:
+            name = self._subcircuit_name(netlist)
+            model.subcircuit = model.to_subcircuit(name, shunt_resistance=self._shunt_resistance)
+
+            for element in network.elements:
+                element.detach()
+            for node in network.internal_nodes:
+                netlist._remove_node(node)
+            netlist.subcircuit(model.subcircuit)
+            model.element = netlist.X(name, name, *network.ports)
+
+            self._logger.info('Reduce {} to a model of order {}'.format(network, model.order))
+            models.append(model)
+
+        return models
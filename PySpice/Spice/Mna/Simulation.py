@@ -0,0 +1,150 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This modules implements a built-in simulator for linear circuits.
+
+Only the operating point and the AC analyses are supported, for circuits made of resistors,
+capacitors, inductors, independent sources and linear controlled sources.  The circuit is stamped in
+a sparse MNA system which is solved without any simulator round trip.
+
+Example of usage::
+
+    simulator = circuit.simulator(simulator='mna')
+    analysis = simulator.ac(start_frequency=1@u_Hz, stop_frequency=1@u_MHz, number_of_points=10,  variation='dec')
+
+"""
+
+####################################################################################################
+
+import logging
+
+import numpy as np
+
+####################################################################################################
+
+from ...Probe.WaveForm import OperatingPoint, AcAnalysis, WaveForm
+from ...Unit import u_V, u_A, u_Hz
+from ..Simulation import CircuitSimulator
+from .Solver import MnaSystem, ac_frequencies
+
+####################################################################################################
+
+_module_logger = logging.getLogger(__name__)
+
+####################################################################################################
+
+class MnaCircuitSimulator(CircuitSimulator):
+
+    """This class implements a simulator for linear circuits using a sparse MNA solver.
+
+    The keyword parameter *gmin* adds a conductance from each node to the ground.
+
+    """
+
+    _logger = _module_logger.getChild('MnaCircuitSimulator')
+
+    SIMULATOR = 'mna'
+
+    ANALYSES = ('op', 'ac')
+
+    ##############################################
+
+    def __init__(self, circuit, **kwargs):
+
+        self._gmin = kwargs.pop('gmin', 0)
+        super().__init__(circuit, **kwargs)
+
+        # Check the circuit is supported, but build the system when the analysis is run
+        # since the circuit can be modified in between.
+        MnaSystem(circuit, self._gmin)
+
+    ##############################################
+
+    def _run(self, analysis_method, *args, **kwargs):
+
+        super()._run(analysis_method, *args, **kwargs)
+
+        analyses = list(self.analysis_iter())
+        self.reset_analysis()
+        analysis_parameters = analyses[0]
+        analysis_name = analysis_parameters.analysis_name
+        if analysis_name not in self.ANALYSES:
+            raise NotImplementedError("The MNA simulator doesn't support the {} analysis".format(analysis_name))
+
+        system = MnaSystem(self._simulated_circuit, self._gmin)
+        if analysis_name == 'op':
+            return self._to_operating_point(system, system.solve_operating_point())
+        else:
+            frequencies = ac_frequencies(
+                analysis_parameters.variation,
+                analysis_parameters.number_of_points,
+                analysis_parameters.start_frequency,
+                analysis_parameters.stop_frequency,
+            )
+            return self._to_ac_analysis(system, frequencies, system.solve_ac(frequencies))
+
+    ##############################################
+
+    def _waveforms(self, system, data, abscissa=None):
+        number_of_nodes = len(system.node_names)
+        if self.units:
+            nodes = [WaveForm.from_unit_values(name, u_V(data[..., i]), abscissa=abscissa)
+                     for i, name in enumerate(system.node_names)]
+            branches = [WaveForm.from_unit_values(name, u_A(data[..., number_of_nodes + i]), abscissa=abscissa)
+                        for i, name in enumerate(system.branch_names)]
+        else:
+            nodes = {name:data[..., i] for i, name in enumerate(system.node_names)}
+            branches = {name:data[..., number_of_nodes + i] for i, name in enumerate(system.branch_names)}
+        return nodes, branches
+
+    ##############################################
+
+    def _unit_table(self, system, **kwargs):
+        """Return the units of the waveforms if they are unit-free, else None."""
+        if self.units:
+            return None
+        units = {name:u_V.prefixed_unit for name in system.node_names}
+        units.update({name:u_A.prefixed_unit for name in system.branch_names})
+        units.update({name:unit.prefixed_unit for name, unit in kwargs.items()})
+        return units
+
+    ##############################################
+
+    def _to_operating_point(self, system, x):
+        # the waveforms have a single value, unit-free values are scalars
+        nodes, branches = self._waveforms(system, x[np.newaxis, :] if self.units else x)
+        return OperatingPoint(simulation=self, nodes=nodes, branches=branches, units=self._unit_table(system))
+
+    ##############################################
+
+    def _to_ac_analysis(self, system, frequencies, x):
+        if self.units:
+            frequency = WaveForm.from_unit_values('frequency', u_Hz(frequencies))
+        else:
+            frequency = frequencies
+        nodes, branches = self._waveforms(system, x, abscissa=frequency)
+        return AcAnalysis(
+            simulation=self,
+            frequency=frequency,
+            nodes=nodes,
+            branches=branches,
+            internal_parameters=(),
+            units=self._unit_table(system, frequency=u_Hz),
+        )
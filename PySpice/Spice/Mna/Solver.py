@@ -0,0 +1,563 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+r"""This module implements the stamping of a linear netlist in a sparse MNA system.
+
+The system is written as
+
+.. math::
+
+    (G + j \omega C) x = b
+
+where *x* is the vector of the node voltages followed by the branch currents of the voltage sources,
+the voltage controlled voltage sources, the current controlled voltage sources and the inductors.
+
+The sign conventions are the SPICE ones, i.e. a branch current flows from the positive node
+through the element to the negative node.
+
+"""
+
+####################################################################################################
+
+import logging
+
+import numpy as np
+import scipy.sparse as sparse
+import scipy.sparse.linalg as sparse_linalg
+
+####################################################################################################
+
+from ...Unit.Unit import UnitValue
+from ..BasicElement import (
+    Resistor, Capacitor, Inductor,
+    VoltageSource, CurrentSource,
+    VoltageControlledCurrentSource, VoltageControlledVoltageSource,
+    CurrentControlledCurrentSource, CurrentControlledVoltageSource,
+)
+from ..HighLevelElement import SourceMixinAbc
+from ..Number import is_spice_number, spice_number_to_float, spice_numbers_to_array
+
+####################################################################################################
+
+_module_logger = logging.getLogger(__name__)
+
+####################################################################################################
+
+class UnsupportedElementError(NotImplementedError):
+    pass
+
+class SingularMatrixError(np.linalg.LinAlgError):
+    pass
+
+####################################################################################################
+
+SUPPORTED_ELEMENTS = (
+    Resistor, Capacitor, Inductor,
+    VoltageSource, CurrentSource,
+    VoltageControlledCurrentSource, VoltageControlledVoltageSource,
+    CurrentControlledCurrentSource, CurrentControlledVoltageSource,
+)
+
+# Elements having a branch current in the MNA system
+BRANCH_ELEMENTS = (
+    Inductor,
+    VoltageSource,
+    VoltageControlledVoltageSource,
+    CurrentControlledVoltageSource,
+)
+
+####################################################################################################
+
+def _to_float(value, element):
+
+    """Convert a parameter value to float, raise :class:`UnsupportedElementError` if the value is an
+    expression.
+
+    """
+
+    try:
+        return spice_number_to_float(value)
+    except ValueError:
+        raise UnsupportedElementError("Cannot convert value '{}' of element {}".format(value, element.name))
+
+####################################################################################################
+
+def _to_float_array(values, elements):
+
+    """Convert the parameter values of the elements to a float array, raise
+    :class:`UnsupportedElementError` if a value is an expression.
+
+    """
+
+    array = spice_numbers_to_array(values, strict=False)[0]
+    is_nan = np.isnan(array)
+    if is_nan.any():
+        i = int(np.argmax(is_nan))
+        raise UnsupportedElementError("Cannot convert value '{}' of element {}".format(values[i], elements[i].name))
+    return array
+
+####################################################################################################
+
+def _passive_values(elements, attribute):
+
+    """Return the values and the multipliers of the passive elements as float arrays."""
+
+    values = _to_float_array([getattr(element, attribute) for element in elements], elements)
+    multipliers = np.ones(len(elements))
+    multiplier_values = [(i, getattr(element, 'multiplier', None)) for i, element in enumerate(elements)]
+    multiplier_values = [(i, multiplier) for i, multiplier in multiplier_values if multiplier is not None]
+    if multiplier_values:
+        indexes, multiplier_values = zip(*multiplier_values)
+        indexes = list(indexes)
+        multipliers[indexes] = _to_float_array(multiplier_values, [elements[i] for i in indexes])
+    return values, multipliers
+
+####################################################################################################
+
+def _transient_initial_value(function, words, element):
+
+    """Return the value at t=0 of a transient function, SPICE uses it for the operating point when
+    the DC value of a source is not given.
+
+    """
+
+    function = function.lower()
+    keywords = dict(word.lower().split('=', 1) for word in words if '=' in word)
+    values = [_to_float(word, element) for word in words if '=' not in word]
+    if function in ('pulse', 'exp', 'sffm') and values:
+        # V1 or VO
+        return values[0]
+    elif function == 'sin' and len(values) >= 2:
+        # VO + VA sin(phase)
+        phase = values[5] if len(values) > 5 else 0.
+        return values[0] + values[1] * np.sin(np.deg2rad(phase))
+    elif function == 'pwl' and len(values) >= 2:
+        delay = _to_float(keywords.get('td', 0), element)
+        return float(np.interp(0., np.array(values[0::2]) + delay, values[1::2]))
+    elif function == 'am':
+        return 0.
+    raise UnsupportedElementError("Cannot compute the t=0 value of the {} function of element {}".format(
+        function.upper(), element.name))
+
+####################################################################################################
+
+def _source_values(element):
+
+    """Return the DC value and the AC phasor of an independent source.
+
+    If the DC value is not given, then the value at t=0 of the transient function is used.
+
+    """
+
+    dc_value = getattr(element, 'dc_offset', None)
+    ac_magnitude = getattr(element, 'ac_magnitude', None)
+    if dc_value is not None:
+        # high level source
+        dc_value = _to_float(dc_value, element)
+        ac_value = _to_float(ac_magnitude, element) if ac_magnitude is not None else 0.
+        return dc_value, complex(ac_value)
+
+    value = element.dc_value
+    if value is None and isinstance(element, SourceMixinAbc):
+        # high level source without DC offset, e.g. EXP or PWL
+        value = element.format_spice_parameters()
+    if value is None:
+        return 0., 0j
+    if isinstance(value, (UnitValue, int, float)):
+        return _to_float(value, element), 0j
+
+    # Parse a "<dc> value ac magnitude phase function(...)" specification
+    dc_value = None
+    ac_magnitude = 0.
+    ac_phase = 0.
+    function = None
+    words = str(value).replace('(', ' ( ').replace(')', ' ) ').replace(',', ' ').split()
+    i = 0
+    while i < len(words):
+        word = words[i].lower()
+        if word == 'dc' and i + 1 < len(words):
+            dc_value = _to_float(words[i+1], element)
+            i += 2
+        elif word == 'ac':
+            ac_magnitude = 1.
+            i += 1
+            if i < len(words) and is_spice_number(words[i]):
+                ac_magnitude = _to_float(words[i], element)
+                i += 1
+                if i < len(words) and is_spice_number(words[i]):
+                    ac_phase = _to_float(words[i], element)
+                    i += 1
+        elif is_spice_number(word) and i == 0:
+            dc_value = _to_float(word, element)
+            i += 1
+        elif i + 1 < len(words) and words[i+1] == '(':
+            # transient function
+            start = i + 2
+            i = start
+            while i < len(words) and words[i] != ')':
+                i += 1
+            if function is None:
+                function = (word, words[start:i])
+            i += 1
+        else:
+            i += 1
+
+    if dc_value is None:
+        dc_value = _transient_initial_value(*function, element) if function is not None else 0.
+    return dc_value, ac_magnitude * np.exp(1j * np.deg2rad(ac_phase))
+
+####################################################################################################
+
+class MnaSystem:
+
+    """This class stamps a linear netlist in a sparse MNA system.
+
+    Public Attributes:
+
+      :attr:`node_names`
+        the names of the nodes in the order of the unknowns
+
+      :attr:`branch_names`
+        the names of the elements having a branch current in the order of the unknowns
+
+    """
+
+    _logger = _module_logger.getChild('MnaSystem')
+
+    #: Maximum number of unknowns to use a batched dense solver for the AC analysis
+    DENSE_MAX_SIZE = 1000
+    #: Maximum size in bytes of the matrices of a batch of the dense solver
+    DENSE_BATCH_BYTES = 16 * 2**20
+
+    ##############################################
+
+    def __init__(self, netlist, gmin=0, elements=None):
+
+        # *elements* can be used to stamp a part of the netlist
+        if elements is None:
+            elements = netlist.elements
+        self._elements = [element for element in elements if element.enabled]
+
+        unsupported = [element for element in self._elements if not isinstance(element, SUPPORTED_ELEMENTS)]
+        if unsupported:
+            raise UnsupportedElementError(
+                "The MNA solver doesn't support the elements: {}".format(
+                    ' '.join([element.name for element in unsupported])))
+
+        self._netlist = netlist
+        self._gmin = gmin
+
+        self._node_index = {}
+        for element in self._elements:
+            for node in element.nodes:
+                if not node.is_ground_node and node.name not in self._node_index:
+                    self._node_index[node.name] = len(self._node_index)
+        self.node_names = list(self._node_index.keys())
+
+        number_of_nodes = len(self._node_index)
+        self._branch_index = {}
+        for element in self._elements:
+            if isinstance(element, BRANCH_ELEMENTS):
+                self._branch_index[element.name] = number_of_nodes + len(self._branch_index)
+        self.branch_names = list(self._branch_index.keys())
+
+        self._size = number_of_nodes + len(self._branch_index)
+
+        self._stamp()
+
+    ##############################################
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def G(self):
+        """Real part of the MNA matrix"""
+        return self._G
+
+    @property
+    def C(self):
+        """Reactive part of the MNA matrix"""
+        return self._C
+
+    ##############################################
+
+    def _index(self, node):
+        if node.is_ground_node:
+            return None
+        return self._node_index[node.name]
+
+    ##############################################
+
+    def _branch(self, element, name):
+        # name is the controlling source name, e.g. Vsense
+        if name in self._branch_index:
+            return self._branch_index[name]
+        lower_name = str(name).lower()
+        for branch_name, index in self._branch_index.items():
+            if branch_name.lower() == lower_name:
+                return index
+        raise UnsupportedElementError("Unknown controlling source {} for element {}".format(name, element.name))
+
+    ##############################################
+
+    def _stamp(self):
+
+        g_entries = ([], [], [])   # rows, columns, values
+        c_entries = ([], [], [])
+        dc_rhs = np.zeros(self._size)
+        ac_rhs = np.zeros(self._size, dtype=complex)
+
+        def add(entries, row, column, value):
+            if row is not None and column is not None:
+                entries[0].append(row)
+                entries[1].append(column)
+                entries[2].append(value)
+
+        def add_admittance(entries, n1, n2, value):
+            add(entries, n1, n1, value)
+            add(entries, n2, n2, value)
+            add(entries, n1, n2, -value)
+            add(entries, n2, n1, -value)
+
+        def add_transconductance(entries, n1, n2, nc1, nc2, value):
+            add(entries, n1, nc1, value)
+            add(entries, n1, nc2, -value)
+            add(entries, n2, nc1, -value)
+            add(entries, n2, nc2, value)
+
+        def add_incidence(k, n1, n2):
+            add(g_entries, n1, k, 1)
+            add(g_entries, n2, k, -1)
+            add(g_entries, k, n1, 1)
+            add(g_entries, k, n2, -1)
+
+        # The resistors and the capacitors are stamped in bulk
+        resistors = []
+        capacitors = []
+
+        for element in self._elements:
+            if isinstance(element, Resistor):
+                resistors.append(element)
+                continue
+            elif isinstance(element, Capacitor):
+                capacitors.append(element)
+                continue
+            n1, n2 = [self._index(node) for node in element.nodes[:2]]
+            if isinstance(element, Inductor):
+                k = self._branch_index[element.name]
+                inductance = _to_float(element.inductance, element)
+                multiplier = getattr(element, 'multiplier', None)
+                if multiplier is not None:
+                    inductance /= _to_float(multiplier, element)
+                add_incidence(k, n1, n2)
+                add(c_entries, k, k, -inductance)
+            elif isinstance(element, VoltageSource):
+                k = self._branch_index[element.name]
+                add_incidence(k, n1, n2)
+                dc_rhs[k], ac_rhs[k] = _source_values(element)
+            elif isinstance(element, CurrentSource):
+                dc_value, ac_value = _source_values(element)
+                for n, sign in ((n1, -1), (n2, 1)):
+                    if n is not None:
+                        dc_rhs[n] += sign * dc_value
+                        ac_rhs[n] += sign * ac_value
+            elif isinstance(element, VoltageControlledVoltageSource):
+                k = self._branch_index[element.name]
+                nc1, nc2 = [self._index(node) for node in element.nodes[2:]]
+                gain = _to_float(element.voltage_gain, element)
+                add_incidence(k, n1, n2)
+                add(g_entries, k, nc1, -gain)
+                add(g_entries, k, nc2, gain)
+            elif isinstance(element, VoltageControlledCurrentSource):
+                nc1, nc2 = [self._index(node) for node in element.nodes[2:]]
+                transconductance = _to_float(element.transconductance, element)
+                multiplier = getattr(element, 'multiplier', None)
+                if multiplier is not None:
+                    transconductance *= _to_float(multiplier, element)
+                add_transconductance(g_entries, n1, n2, nc1, nc2, transconductance)
+            elif isinstance(element, CurrentControlledCurrentSource):
+                kc = self._branch(element, element.source)
+                gain = _to_float(element.current_gain, element)
+                multiplier = getattr(element, 'multiplier', None)
+                if multiplier is not None:
+                    gain *= _to_float(multiplier, element)
+                add(g_entries, n1, kc, gain)
+                add(g_entries, n2, kc, -gain)
+            elif isinstance(element, CurrentControlledVoltageSource):
+                k = self._branch_index[element.name]
+                kc = self._branch(element, element.source)
+                transresistance = _to_float(element.transresistance, element)
+                add_incidence(k, n1, n2)
+                add(g_entries, k, kc, -transresistance)
+
+        if self._gmin:
+            for n in range(len(self._node_index)):
+                add(g_entries, n, n, self._gmin)
+
+        resistances, multipliers = _passive_values(resistors, 'resistance')
+        if not resistances.all():
+            raise ZeroDivisionError("Resistor {} has a null resistance".format(resistors[int(np.argmin(resistances != 0))].name))
+        g_entries = self._add_admittances(g_entries, resistors, multipliers / resistances)
+        capacitances, multipliers = _passive_values(capacitors, 'capacitance')
+        c_entries = self._add_admittances(c_entries, capacitors, capacitances * multipliers)
+
+        shape = (self._size, self._size)
+        self._G = sparse.csc_matrix((g_entries[2], (g_entries[0], g_entries[1])), shape=shape, dtype=float)
+        self._C = sparse.csc_matrix((c_entries[2], (c_entries[0], c_entries[1])), shape=shape, dtype=float)
+        self._dc_rhs = dc_rhs
+        self._ac_rhs = ac_rhs
+
+    ##############################################
+
+    def _add_admittances(self, entries, elements, values):
+
+        """Stamp the admittances of two-terminal elements and return the entries as arrays."""
+
+        # -1 is the ground node
+        indexes = np.array([[-1 if node.is_ground_node else self._node_index[node.name]
+                             for node in element.nodes[:2]]
+                            for element in elements], dtype=int).reshape(-1, 2)
+        n1, n2 = indexes[:, 0], indexes[:, 1]
+        rows = np.concatenate((np.asarray(entries[0], dtype=int), n1, n2, n1, n2))
+        columns = np.concatenate((np.asarray(entries[1], dtype=int), n1, n2, n2, n1))
+        values = np.concatenate((np.asarray(entries[2], dtype=float), values, values, -values, -values))
+        is_stamped = (rows >= 0) & (columns >= 0)
+        return rows[is_stamped], columns[is_stamped], values[is_stamped]
+
+    ##############################################
+
+    def _singular_matrix_error(self):
+        return SingularMatrixError(
+            "Singular MNA matrix, check the circuit topology with check_topology() or set gmin")
+
+    ##############################################
+
+    def solve_operating_point(self):
+
+        """Solve the DC operating point, capacitors are open and inductors are shorted.
+
+        Return the solution vector.
+
+        """
+
+        if not self._size:
+            return np.zeros(0)
+        try:
+            lu = sparse_linalg.splu(self._G)
+        except RuntimeError:
+            raise self._singular_matrix_error()
+        x = lu.solve(self._dc_rhs)
+        if not np.all(np.isfinite(x)):
+            raise self._singular_matrix_error()
+        return x
+
+    ##############################################
+
+    def solve_ac(self, frequencies):
+
+        """Solve the small-signal AC system for an array of frequencies.
+
+        Return an array of shape (number of frequencies, size).
+
+        """
+
+        frequencies = np.asarray(frequencies, dtype=float)
+        omegas = 2 * np.pi * frequencies
+        size = self._size
+
+        if size <= self.DENSE_MAX_SIZE:
+            # Batched dense solver: each call solves a batch of at most DENSE_BATCH_BYTES of matrices
+            G = self._G.toarray()
+            C = self._C.toarray()
+            batch_size = max(1, self.DENSE_BATCH_BYTES // (size * size * np.dtype(complex).itemsize))
+            x = np.empty((len(omegas), size), dtype=complex)
+            for start in range(0, len(omegas), batch_size):
+                batch = omegas[start:start + batch_size]
+                A = G[np.newaxis, :, :] + 1j * batch[:, np.newaxis, np.newaxis] * C[np.newaxis, :, :]
+                b = np.broadcast_to(self._ac_rhs, (len(batch), size))[..., np.newaxis]
+                try:
+                    x[start:start + batch_size] = np.linalg.solve(A, b)[..., 0]
+                except np.linalg.LinAlgError:
+                    raise self._singular_matrix_error()
+        else:
+            G = self._G.astype(complex)
+            C = self._C.astype(complex)
+            x = np.empty((len(omegas), size), dtype=complex)
+            for i, omega in enumerate(omegas):
+                try:
+                    lu = sparse_linalg.splu((G + 1j * omega * C).tocsc())
+                except RuntimeError:
+                    raise self._singular_matrix_error()
+                x[i] = lu.solve(self._ac_rhs)
+
+        return x
+
+    ##############################################
+
+    def port_incidence(self, port_names):
+        """Return the incidence matrix of the ports, a port is a node referenced to the ground."""
+        node_index = {name: i for i, name in enumerate(self.node_names)}
+        B = np.zeros((self._size, len(port_names)))
+        for p, name in enumerate(port_names):
+            B[node_index[str(name)], p] = 1
+        return B
+
+    ##############################################
+
+    def port_impedance(self, port_names, frequencies):
+
+        """Return the impedance matrices seen from the given nodes for an array of frequencies, the
+        sources are ignored.
+
+        Return an array of shape (number of frequencies, number of ports, number of ports).
+
+        """
+
+        B = self.port_incidence(port_names)
+        omegas = 2 * np.pi * np.asarray(frequencies, dtype=float)
+        Z = np.empty((len(omegas), len(port_names), len(port_names)), dtype=complex)
+        for i, omega in enumerate(omegas):
+            try:
+                lu = sparse_linalg.splu((self._G + 1j * omega * self._C).tocsc())
+            except RuntimeError:
+                raise self._singular_matrix_error()
+            Z[i] = B.T @ lu.solve(B.astype(complex))
+        return Z
+
+####################################################################################################
+
+def ac_frequencies(variation, number_of_points, start_frequency, stop_frequency):
+
+    """Return the frequency array of an AC analysis using the SPICE conventions."""
+
+    start_frequency = float(start_frequency)
+    stop_frequency = float(stop_frequency)
+    number_of_points = int(number_of_points)
+    if variation == 'lin':
+        return np.linspace(start_frequency, stop_frequency, number_of_points)
+    elif variation in ('dec', 'oct'):
+        base = 10 if variation == 'dec' else 2
+        number_of_intervals = int(np.floor(np.log(stop_frequency / start_frequency) / np.log(base) * number_of_points
+                                           + 1e-9))
+        return start_frequency * base ** (np.arange(number_of_intervals + 1) / number_of_points)
+    else:
+        raise ValueError("Incorrect variation type")
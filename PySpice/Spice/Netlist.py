@@ -94,6 +94,7 @@ from .ElementParameter import (
     FlagParameter, KeyValueParameter,
 )
 from .Simulation import CircuitSimulator
+from .Topology import ConnectivityIndex, TopologyError, check_topology
 
 ####################################################################################################
 
@@ -186,12 +187,15 @@ class DeviceModel:
     ##############################################
 
     def __getattr__(self, name):
+        if name.startswith('_'):
+            # e.g. copy and pickle look up __deepcopy__ before the attributes are set
+            raise AttributeError(name)
         try:
             return self._parameters[name]
         except KeyError:
-            if name.endswith('_'):
+            if name.endswith('_') and name[:-1] in self._parameters:
                 return self._parameters[name[:-1]]
-            # Fixme: else
+            raise AttributeError(name)
 
     ##############################################
 
@@ -297,6 +301,15 @@ class Pin(PinDefinition):
 
     ##############################################
 
+    def connect(self, node):
+        """Move the pin to another node."""
+        if self._node is not None:
+            self._node.disconnect(self)
+        self._node = node
+        node.connect(self)
+
+    ##############################################
+
     def add_current_probe(self, circuit):
 
         """Add a current probe between the node and the pin.
@@ -593,6 +606,10 @@ class Element(metaclass=ElementParameterMetaClass):
             object.__setattr__(self, parameter.attribute_name, value)
         else:
             object.__setattr__(self, name, value)
+        # Invalidate the rendered text of the netlist
+        netlist = self.__dict__.get('_netlist')
+        if netlist is not None:
+            netlist._revision += 1
 
     ##############################################
 
@@ -792,6 +809,8 @@ class Node:
     def connect(self, pin):
         if pin not in self._pins:
             self._pins.add(pin)
+            self._netlist._connectivity.connect(pin)
+            self._netlist._revision += 1
         else:
             raise ValueError("Pin {} is already connected to node {}".format(pin, self))
 
@@ -799,6 +818,8 @@ class Node:
 
     def disconnect(self, pin):
         self._pins.remove(pin)
+        self._netlist._connectivity.disconnect(pin)
+        self._netlist._revision += 1
 
 ####################################################################################################
 
@@ -806,25 +827,35 @@ class Netlist:
 
     """This class implements a base class for a netlist.
 
-    .. note:: This class is completed with element shortcuts when the module is loaded.
+    .. note:: This class is completed with element shortcuts when the module is loaded, cf.
+       :func:`PySpice.Spice.add_element_shortcuts`.
 
     """
 
     _logger = _module_logger.getChild('Netlist')
 
+    # Set by PySpice.Spice.add_element_shortcuts
+    _has_element_shortcuts = False
+
     ##############################################
 
     def __init__(self):
 
+        # Revision number incremented on each modification, used to cache the rendered text
+        self._revision = 0
+
         self._ground_name = 0
         self._nodes = {}
+        self._connectivity = ConnectivityIndex(self)
         self._ground_node = self._add_node(self._ground_name)
 
         self._subcircuits = OrderedDict()   # to keep the declaration order
         self._elements = OrderedDict()   # to keep the declaration order
         self._models = {}
 
-        self.raw_spice = ''
+        self._raw_spice = ''
+
+        self._deduplicate_subcircuits = False
 
         # self._graph = networkx.Graph()
 
@@ -842,11 +873,38 @@ class Netlist:
             netlist._models[name] = model.clone()
 
         netlist.raw_spice = str(self.raw_spice)
+        netlist.deduplicate_subcircuits = self._deduplicate_subcircuits
 
         return netlist
 
     ##############################################
 
+    @property
+    def raw_spice(self):
+        return self._raw_spice
+
+    @raw_spice.setter
+    def raw_spice(self, value):
+        self._raw_spice = value
+        self._revision += 1
+
+    ##############################################
+
+    @property
+    def deduplicate_subcircuits(self):
+        """If set, the structurally identical sub-circuits are emitted once, cf. :meth:`_str_subcircuits`,
+        it is not set by default.
+
+        """
+        return self._deduplicate_subcircuits
+
+    @deduplicate_subcircuits.setter
+    def deduplicate_subcircuits(self, value):
+        self._deduplicate_subcircuits = bool(value)
+        self._revision += 1
+
+    ##############################################
+
     @property
     def gnd(self):
         return self._ground
@@ -883,6 +941,11 @@ class Netlist:
     def subcircuit_names(self):
         return self._subcircuits.keys()
 
+    @property
+    def connectivity(self):
+        """Connectivity index over the nodes, cf. :class:`PySpice.Spice.Topology.ConnectivityIndex`"""
+        return self._connectivity
+
     ##############################################
 
     def element(self, name):
@@ -911,6 +974,9 @@ class Netlist:
     ##############################################
 
     def __getattr__(self, attribute_name):
+        if attribute_name.startswith('_'):
+            # e.g. copy and pickle look up __setstate__ before the attributes are set
+            raise AttributeError(attribute_name)
         try:
             return self.__getitem__(attribute_name)
         except IndexError:
@@ -929,12 +995,22 @@ class Netlist:
 
     ##############################################
 
+    def _remove_node(self, node):
+        if node.pins:
+            raise ValueError("Node {} is connected".format(node))
+        if node is self._ground_node:
+            raise ValueError("Cannot remove the ground node")
+        del self._nodes[node.name]
+
+    ##############################################
+
     def _update_node_name(self, node, new_name):
         if node.name not in self._nodes:
             # should not happen
             raise ValueError("Unknown node")
         del self._nodes[node.name]
         self._nodes[new_name] = node
+        self._revision += 1
 
     ##############################################
 
@@ -957,16 +1033,84 @@ class Netlist:
 
     ##############################################
 
+    def _anchored_nodes(self):
+        """Return the nodes which are connected to the ground outside the netlist."""
+        return ()
+
+    ##############################################
+
+    def check_topology(self, raise_exception=False):
+
+        """Check the netlist for floating nodes, nodes without DC path to ground, voltage source loops
+        and nodes with a single connection.
+
+        Return a :class:`PySpice.Spice.Topology.TopologyReport` instance, or raise a
+        :class:`PySpice.Spice.Topology.TopologyError` if *raise_exception* is set and the check fails.
+
+        """
+
+        report = check_topology(self, self._anchored_nodes())
+        if raise_exception and not report.is_valid:
+            raise TopologyError(str(report))
+        return report
+
+    ##############################################
+
+    def reduce(self, preserved_nodes=(), recurse=False, **kwargs):
+
+        """Reduce the netlist in place, e.g. merge series resistors and parallel capacitors.
+
+        The nodes listed in *preserved_nodes* are never removed.  If *recurse* is set, then the
+        sub-circuit definitions are also reduced.  The other keyword parameters are passed to
+        :class:`PySpice.Spice.Reduction.NetlistReducer`.
+
+        Return a :class:`PySpice.Spice.Reduction.ReductionReport` instance, or a list of reports
+        if *recurse* is set.
+
+        """
+
+        from .Reduction import NetlistReducer
+        report = NetlistReducer(preserved_nodes=preserved_nodes, **kwargs).reduce(self)
+        if recurse:
+            reports = [report]
+            for subcircuit in self.subcircuits:
+                reports.extend(subcircuit.reduce(recurse=True, **kwargs))
+            return reports
+        return report
+
+    ##############################################
+
+    def reduce_order(self, preserved_nodes=(), **kwargs):
+
+        """Replace in place the linear RC/RLC networks by a reduced-order sub-circuit computed using
+        the PRIMA algorithm.
+
+        The nodes listed in *preserved_nodes* are kept as ports.  The other keyword parameters are
+        passed to :class:`PySpice.Spice.Mna.Prima.PrimaReducer`.
+
+        Return the list of the :class:`PySpice.Spice.Mna.Prima.ReducedOrderModel` instances.  Raise a
+        :class:`PySpice.Spice.Mna.Solver.SingularMatrixError` if a model cannot be computed, the
+        netlist is then left unchanged.
+
+        """
+
+        from .Mna.Prima import PrimaReducer
+        return PrimaReducer(preserved_nodes=preserved_nodes, **kwargs).reduce(self)
+
+    ##############################################
+
     def _add_element(self, element):
         """Add an element."""
         if element.name not in self._elements:
             self._elements[element.name] = element
+            self._revision += 1
         else:
             raise NameError("Element name {} is already defined".format(element.name))
 
     ##############################################
 
     def _remove_element(self, element):
+        self._revision += 1
         try:
             del self._elements[element.name]
         except KeyError:
@@ -979,6 +1123,7 @@ class Netlist:
         model = DeviceModel(name, modele_type, **parameters)
         if model.name not in self._models:
             self._models[model.name] = model
+            self._revision += 1
         else:
             raise NameError("Model name {} is already defined".format(name))
 
@@ -990,6 +1135,7 @@ class Netlist:
         """Add a sub-circuit."""
         # Fixme: subcircuit is a class
         self._subcircuits[str(subcircuit.name)] = subcircuit
+        self._revision += 1
 
     ##############################################
 
@@ -1019,8 +1165,32 @@ class Netlist:
     ##############################################
 
     def _str_subcircuits(self):
-        if self._subcircuits:
+
+        """Return the sub-circuit definitions.
+
+        If :attr:`deduplicate_subcircuits` is set, the structurally identical sub-circuits, i.e.
+        having the same nodes, parameter names and body, are emitted once, the duplicates are
+        emitted as an alias which instantiates the first definition and forwards the parameters.
+
+        """
+
+        if self._subcircuits and not self._deduplicate_subcircuits:
             return join_lines(self.subcircuits)
+        elif self._subcircuits:
+            definitions = {}
+            subcircuits = []
+            for subcircuit in self.subcircuits:
+                key = (
+                    tuple([str(node) for node in subcircuit.external_nodes]),
+                    tuple(subcircuit.parameters.keys()),
+                    subcircuit._str_body(),
+                )
+                definition = definitions.setdefault(key, subcircuit)
+                if definition is subcircuit:
+                    subcircuits.append(str(subcircuit))
+                else:
+                    subcircuits.append(subcircuit._str_alias(definition))
+            return join_lines(subcircuits)
         else:
             return ''
 
@@ -1057,6 +1227,8 @@ class SubCircuit(Netlist):
 
         self._parameters = kwargs
 
+        self._str_cache = None   # (cache key, body)
+
     ##############################################
 
     def clone(self, name=None):
@@ -1088,6 +1260,11 @@ class SubCircuit(Netlist):
 
     ##############################################
 
+    def _anchored_nodes(self):
+        return self._external_nodes
+
+    ##############################################
+
     def check_nodes(self):
 
         """Check for dangling nodes in the subcircuit."""
@@ -1102,13 +1279,48 @@ class SubCircuit(Netlist):
 
     ##############################################
 
-    def __str__(self):
-        """Return the formatted subcircuit definition."""
+    def _cache_key(self):
+        # The models can be edited in place, thus their text is part of the key
+        return (self._revision,
+                tuple([str(model) for model in self.models]),
+                tuple([subcircuit._cache_key() for subcircuit in self.subcircuits]))
+
+    ##############################################
+
+    def _str_body(self):
+        """Return the formatted elements, the text is cached until the sub-circuit or its models are
+        modified.
+
+        """
+        cache_key = self._cache_key()
+        if self._str_cache is None or self._str_cache[0] != cache_key:
+            self._str_cache = (cache_key, super().__str__())
+        return self._str_cache[1]
+
+    ##############################################
+
+    def _str_header(self):
         nodes = join_list(self._external_nodes)
         parameters = join_list(['{}={}'.format(key, value)
                                 for key, value in self._parameters.items()])
-        netlist = '.subckt ' + join_list((self._name, nodes, parameters)) + os.linesep
-        netlist += super().__str__()
+        return '.subckt ' + join_list((self._name, nodes, parameters)) + os.linesep
+
+    ##############################################
+
+    def _str_alias(self, subcircuit):
+        """Return a definition which instantiates *subcircuit*, which must have the same nodes."""
+        parameters = join_list(['{0}={{{0}}}'.format(key) for key in self._parameters])
+        netlist = self._str_header()
+        netlist += join_list(('X1', join_list(self._external_nodes), subcircuit.name, parameters)) + os.linesep
+        netlist += '.ends ' + self._name + os.linesep
+        return netlist
+
+    ##############################################
+
+    def __str__(self):
+        """Return the formatted subcircuit definition."""
+        netlist = self._str_header()
+        netlist += self._str_body()
         netlist += '.ends ' + self._name + os.linesep
         return netlist
 
@@ -1180,6 +1392,11 @@ class Circuit(Netlist):
 
     ##############################################
 
+    def _anchored_nodes(self):
+        return self._global_nodes
+
+    ##############################################
+
     def include(self, path):
         """Include a file."""
         if path not in self._includes:
@@ -1205,6 +1422,18 @@ class Circuit(Netlist):
 
     ##############################################
 
+    def parameter_graph(self):
+
+        """Return the dependency graph of the parameters and the elements, cf.
+        :class:`PySpice.Spice.ParameterGraph.ParameterGraph`.
+
+        """
+
+        from .ParameterGraph import ParameterGraph
+        return ParameterGraph(self._parameters, self.elements)
+
+    ##############################################
+
     def str(self, simulator=None):
         """Return the formatted desk."""
         # if not self.has_ground_node():
@@ -1290,3 +1519,9 @@ class Circuit(Netlist):
 
     def simulator(self, *args, **kwargs):
         return CircuitSimulator.factory(self, *args, **kwargs)
+
+####################################################################################################
+
+# The element modules import this module, the shortcuts are added once they are loaded, cf.
+# PySpice.Spice.add_element_shortcuts
+from . import BasicElement
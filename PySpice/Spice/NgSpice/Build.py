@@ -0,0 +1,114 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2025 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This module builds the compiled CFFI binding of the Ngspice shared library.
+
+By default, :mod:`PySpice.Spice.NgSpice.Shared` parses :file:`api.h` at run time and opens the
+library in the CFFI ABI mode.  This module builds the extension module
+:mod:`PySpice.Spice.NgSpice._ngspice` in the out-of-line API mode: the header is parsed once at
+build time, the calls to the library are compiled and the callbacks are ``extern "Python"``
+functions instead of libffi closures.  When this module is available, it is used by
+:class:`PySpice.Spice.NgSpice.Shared.NgSpiceShared`.
+
+The extension module is linked to :file:`libngspice`, to build it in place, run::
+
+    python -m PySpice.Spice.NgSpice.Build [library_directory]
+
+or add ``cffi_modules=['PySpice/Spice/NgSpice/Build.py:ffibuilder']`` to the setup.
+
+"""
+
+####################################################################################################
+
+__all__ = [
+    'API_PATH',
+    'CALLBACKS',
+    'MODULE_NAME',
+    'make_ffi_builder',
+]
+
+####################################################################################################
+
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+
+from cffi import FFI
+
+####################################################################################################
+
+API_PATH = Path(__file__).parent.joinpath('api.h')
+
+MODULE_NAME = 'PySpice.Spice.NgSpice._ngspice'
+
+# Callbacks of NgSpiceShared implemented as extern "Python" functions, the C name has the prefix
+# "pyspice" to prevent a clash, e.g. with _exit
+CALLBACKS = {
+    '_send_char': 'int (char *, int, void *)',
+    '_send_stat': 'int (char *, int, void *)',
+    '_exit': 'int (int, bool, bool, int, void *)',
+    '_send_data': 'int (pvecvaluesall, int, int, void *)',
+    '_send_init_data': 'int (pvecinfoall, int, void *)',
+    '_background_thread_running': 'int (bool, int, void *)',
+    '_get_vsrc_data': 'int (double *, double, char *, int, void *)',
+    '_get_isrc_data': 'int (double *, double, char *, int, void *)',
+}
+
+####################################################################################################
+
+def make_ffi_builder(library_dirs=()):
+
+    """Return the FFI builder of the extension module, *library_dirs* is a list of directories where
+    to find the Ngspice library.
+
+    """
+
+    with open(API_PATH) as fh:
+        api = fh.read()
+
+    extern_python = ''.join(
+        'extern "Python" {};\n'.format(signature.replace(' (', ' pyspice{}('.format(name), 1))
+        for name, signature in CALLBACKS.items()
+    )
+
+    ffi_builder = FFI()
+    ffi_builder.cdef(api + extern_python)
+    # api.h declares the functions exported by the library
+    ffi_builder.set_source(
+        MODULE_NAME,
+        '#include <stdbool.h>\n' + api,
+        libraries=['ngspice'],
+        library_dirs=[str(_) for _ in library_dirs],
+    )
+    return ffi_builder
+
+####################################################################################################
+
+ffibuilder = make_ffi_builder()
+
+####################################################################################################
+
+if __name__ == '__main__':
+
+    # Build the extension module and copy it in the source tree
+    with tempfile.TemporaryDirectory() as tmpdir:
+        module_path = make_ffi_builder(sys.argv[1:]).compile(tmpdir=tmpdir, verbose=True)
+        shutil.copy(module_path, Path(__file__).parent)
@@ -34,6 +34,10 @@ circuit.
 This interface use the CFFI module to interface with the shared library. It is thus suited to run
 within the Pypy interpreter which implements JIT optimisation for Python.
 
+If the compiled binding built by :mod:`PySpice.Spice.NgSpice.Build` is available, then the library
+is called in the CFFI API mode, else the header is parsed at run time and the library is opened in
+the ABI mode.
+
 It can also be used to experiment parallel simulation as explained in the Ngspice user manual. But
 it seems the Ngspice source code was designed with global variables which imply to use one copy of
 the shared library by worker as explained in the manual.
@@ -82,6 +86,7 @@ __all__ = [
 ####################################################################################################
 
 from pathlib import Path
+import functools
 import logging
 import os
 import platform
@@ -108,6 +113,13 @@ from .SimulationType import SIMULATION_TYPE
 ####################################################################################################
 
 ffi = FFI()
+_api_is_parsed = False
+
+try:
+    from . import _ngspice
+except ImportError:
+    # the binding is not built or the library is not found
+    _ngspice = None
 
 ####################################################################################################
 
@@ -123,7 +135,7 @@ class NgSpiceCommandError(NameError):
 
 ####################################################################################################
 
-def ffi_string_utf8(_):
+def ffi_string_utf8(_, ffi=ffi):
     _ = ffi.string(_)
     try:
         return _.decode('utf8')
@@ -165,6 +177,15 @@ class Vector:
 
     ##############################################
 
+    @property
+    def prefixed_unit(self):
+        if self._unit is not None:
+            return self._unit.prefixed_unit
+        else:
+            return None
+
+    ##############################################
+
     @property
     def is_interval_parameter(self):
         return self._name.startswith('@')
@@ -212,6 +233,22 @@ class Vector:
         else:
             return WaveForm.from_array(self.simplified_name, data, abscissa=abscissa)
 
+    ##############################################
+
+    def to_array(self, to_real=False, to_float=False):
+
+        """ Return the data as a Numpy array, it is a view on the simulator data.
+
+        If *to_float* is set and the vector has a single value, then return this value.
+        """
+
+        data = self._data
+        if to_real:
+            data = data.real
+        if to_float and data.size == 1:
+            return data[0]
+        return data
+
 ####################################################################################################
 
 class Plot(dict):
@@ -235,30 +272,58 @@ class Plot(dict):
 
     ##############################################
 
+    @property
+    def _with_units(self):
+        # cf. CircuitSimulation.units
+        return getattr(self._simulation, 'units', True)
+
+    ##############################################
+
+    def _to_waveforms(self, variables, abscissa=None, to_float=False):
+        if self._with_units:
+            return [variable.to_waveform(abscissa, to_float=to_float) for variable in variables]
+        else:
+            return {variable.simplified_name:variable.to_array(to_float=to_float) for variable in variables}
+
+    ##############################################
+
+    def _to_abscissa(self, variable, to_real=False):
+        if self._with_units:
+            return variable.to_waveform(to_real=to_real)
+        else:
+            return variable.to_array(to_real)
+
+    ##############################################
+
+    def _unit_table(self):
+        """Return the units of the vectors if the waveforms are unit-free, else None."""
+        if self._with_units:
+            return None
+        else:
+            return {variable.simplified_name:variable.prefixed_unit for variable in self.values()}
+
+    ##############################################
+
     def nodes(self, to_float=False, abscissa=None):
-        return [variable.to_waveform(abscissa, to_float=to_float)
-                for variable in self.values()
-                if variable.is_voltage_node]
+        return self._to_waveforms([variable for variable in self.values() if variable.is_voltage_node],
+                                  abscissa, to_float)
 
     ##############################################
 
     def branches(self, to_float=False, abscissa=None):
-        return [variable.to_waveform(abscissa, to_float=to_float)
-                for variable in self.values()
-                if variable.is_branch_current]
+        return self._to_waveforms([variable for variable in self.values() if variable.is_branch_current],
+                                  abscissa, to_float)
 
     ##############################################
 
     def internal_parameters(self, to_float=False, abscissa=None):
-        return [variable.to_waveform(abscissa, to_float=to_float)
-                for variable in self.values()
-                if variable.is_interval_parameter]
+        return self._to_waveforms([variable for variable in self.values() if variable.is_interval_parameter],
+                                  abscissa, to_float)
 
     ##############################################
 
     def elements(self, abscissa=None):
-        return [variable.to_waveform(abscissa, to_float=True)
-                for variable in self.values()]
+        return self._to_waveforms(self.values(), abscissa, to_float=True)
 
     ##############################################
 
@@ -293,6 +358,7 @@ class Plot(dict):
             nodes=self.nodes(to_float=True),
             branches=self.branches(to_float=True),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
@@ -303,6 +369,7 @@ class Plot(dict):
             simulation=self._simulation,
             elements=self.elements(),  # Fixme: internal parameters ???
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
@@ -314,38 +381,41 @@ class Plot(dict):
                 break
         else:
             raise NotImplementedError(str(self))
-        sweep = sweep_variable.to_waveform()
+        sweep = self._to_abscissa(sweep_variable)
         return DcAnalysis(
             simulation=self._simulation,
             sweep=sweep,
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
 
     def _to_ac_analysis(self):
-        frequency = self['frequency'].to_waveform(to_real=True)
+        frequency = self._to_abscissa(self['frequency'], to_real=True)
         return AcAnalysis(
             simulation=self._simulation,
             frequency=frequency,
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
 
     def _to_transient_analysis(self):
 
-        time = self['time'].to_waveform(to_real=True)
+        time = self._to_abscissa(self['time'], to_real=True)
         return TransientAnalysis(
             simulation=self._simulation,
             time=time,
             nodes=self.nodes(abscissa=time),
             branches=self.branches(abscissa=time),
             internal_parameters=self.internal_parameters(abscissa=time),
+            units=self._unit_table(),
         )
 
     ##############################################
@@ -356,6 +426,7 @@ class Plot(dict):
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
@@ -366,18 +437,20 @@ class Plot(dict):
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
 
     def _to_distortion_analysis(self):
-        frequency = self['frequency'].to_waveform(to_real=True)
+        frequency = self._to_abscissa(self['frequency'], to_real=True)
         return DistortionAnalysis(
             simulation=self._simulation,
             frequency=frequency,
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
@@ -388,6 +461,7 @@ class Plot(dict):
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
 ####################################################################################################
@@ -399,6 +473,9 @@ class NgSpiceShared:
     NGSPICE_PATH = None
     LIBRARY_PATH = None
 
+    # Use the compiled binding if available
+    USE_COMPILED_BINDING = True
+
     MAX_COMMAND_LENGTH = 1023
     NUMBER_OF_EXEC_CALLS_TO_RELEASE_MEMORY = 10_000
 
@@ -502,6 +579,13 @@ class NgSpiceShared:
 
     ##############################################
 
+    @property
+    def use_compiled_binding(self):
+        """Return True if the library is called through the compiled binding."""
+        return self._use_compiled_binding
+
+    ##############################################
+
     def _load_library(self, verbose):
 
         if ConfigInstall.OS.on_windows:
@@ -528,15 +612,29 @@ class NgSpiceShared:
             import locale
             locale.setlocale(locale.LC_NUMERIC, 'C')
 
-        api_path = Path(__file__).parent.joinpath('api.h')
-        with open(api_path) as fh:
-            ffi.cdef(fh.read())
-
-        message = 'Load library {}'.format(self.library_path)
+        # The compiled binding is linked to the default library, it is not used for a parallel
+        # instance or if the environment variable NGSPICE_LIBRARY_PATH is set.
+        self._use_compiled_binding = (
+            self.USE_COMPILED_BINDING and _ngspice is not None and
+            not self._ngspice_id and 'NGSPICE_LIBRARY_PATH' not in os.environ
+        )
+        if self._use_compiled_binding:
+            message = 'Use the compiled binding {}'.format(_ngspice.__file__)
+            self._ffi = _ngspice.ffi
+            self._ngspice_shared = _ngspice.lib
+        else:
+            global _api_is_parsed
+            if not _api_is_parsed:
+                api_path = Path(__file__).parent.joinpath('api.h')
+                with open(api_path) as fh:
+                    ffi.cdef(fh.read())
+                _api_is_parsed = True
+            message = 'Load library {}'.format(self.library_path)
+            self._ffi = ffi
+            self._ngspice_shared = ffi.dlopen(self.library_path)
         self._logger.debug(message)
         if verbose:
             print(message)
-        self._ngspice_shared = ffi.dlopen(self.library_path)
 
         # Note: cannot yet execute command
 
@@ -546,21 +644,28 @@ class NgSpiceShared:
 
         # Ngspice API: ngSpice_Init ngSpice_Init_Sync
 
-        self._send_char_c = ffi.callback('int (char *, int, void *)', self._send_char)
-        self._send_stat_c = ffi.callback('int (char *, int, void *)', self._send_stat)
-        self._exit_c = ffi.callback('int (int, bool, bool, int, void *)', self._exit)
-        self._send_init_data_c = ffi.callback('int (pvecinfoall, int, void *)', self._send_init_data)
-        self._background_thread_running_c = ffi.callback('int (bool, int, void *)', self._background_thread_running)
+        if self._use_compiled_binding:
+            def callback(signature, function):
+                # extern "Python" function, see the end of this module
+                return getattr(_ngspice.lib, 'pyspice' + function.__name__)
+        else:
+            callback = ffi.callback
+
+        self._send_char_c = callback('int (char *, int, void *)', self._send_char)
+        self._send_stat_c = callback('int (char *, int, void *)', self._send_stat)
+        self._exit_c = callback('int (int, bool, bool, int, void *)', self._exit)
+        self._send_init_data_c = callback('int (pvecinfoall, int, void *)', self._send_init_data)
+        self._background_thread_running_c = callback('int (bool, int, void *)', self._background_thread_running)
 
         if send_data:
-            self._send_data_c = ffi.callback('int (pvecvaluesall, int, int, void *)', self._send_data)
+            self._send_data_c = callback('int (pvecvaluesall, int, int, void *)', self._send_data)
         else:
             self._send_data_c = FFI.NULL
 
-        self._get_vsrc_data_c = ffi.callback('int (double *, double, char *, int, void *)', self._get_vsrc_data)
-        self._get_isrc_data_c = ffi.callback('int (double *, double, char *, int, void *)', self._get_isrc_data)
+        self._get_vsrc_data_c = callback('int (double *, double, char *, int, void *)', self._get_vsrc_data)
+        self._get_isrc_data_c = callback('int (double *, double, char *, int, void *)', self._get_isrc_data)
 
-        self_c = ffi.new_handle(self)
+        self_c = self._ffi.new_handle(self)
         self._self_c = self_c  # To prevent garbage collection
 
         rc = self._ngspice_shared.ngSpice_Init(self._send_char_c,
@@ -573,7 +678,7 @@ class NgSpiceShared:
         if rc:
             raise NameError("Ngspice_Init returned {}".format(rc))
 
-        ngspice_id_c = ffi.new('int *', self._ngspice_id)
+        ngspice_id_c = self._ffi.new('int *', self._ngspice_id)
         self._ngspice_id = ngspice_id_c  # To prevent garbage collection
         rc = self._ngspice_shared.ngSpice_Init_Sync(self._get_vsrc_data_c,
                                                     self._get_isrc_data_c,
@@ -606,13 +711,13 @@ class NgSpiceShared:
     ##############################################
 
     @staticmethod
-    def _send_char(message_c, ngspice_id, user_data):
+    def _send_char(message_c, ngspice_id, user_data, ffi=ffi):
 
         """Callback for sending output from stdout, stderr to caller"""
 
         self = ffi.from_handle(user_data)
         _module_logger.debug(str(ffi.string(message_c)))
-        message = ffi_string_utf8(message_c)
+        message = ffi_string_utf8(message_c, ffi)
 
         # split message in "<prefix><match = ' '><content>"
         prefix, _, content = message.partition(' ')
@@ -642,15 +747,15 @@ class NgSpiceShared:
     ##############################################
 
     @staticmethod
-    def _send_stat(message, ngspice_id, user_data):
+    def _send_stat(message, ngspice_id, user_data, ffi=ffi):
         """Callback for simulation status to caller"""
         self = ffi.from_handle(user_data)
-        return self.send_stat(ffi_string_utf8(message), ngspice_id)
+        return self.send_stat(ffi_string_utf8(message, ffi), ngspice_id)
 
     ##############################################
 
     @staticmethod
-    def _exit(exit_status, immediate_unloding, quit_exit, ngspice_id, user_data):
+    def _exit(exit_status, immediate_unloding, quit_exit, ngspice_id, user_data, ffi=ffi):
         """Callback for asking for a reaction after controlled exit"""
         self = ffi.from_handle(user_data)
         self._logger.debug('ngspice_id-{} exit status={} immediate_unloding={} quit_exit={}'.format(
@@ -663,14 +768,14 @@ class NgSpiceShared:
     ##############################################
 
     @staticmethod
-    def _send_data(data, number_of_vectors, ngspice_id, user_data):
+    def _send_data(data, number_of_vectors, ngspice_id, user_data, ffi=ffi):
         """Callback to send back actual vector data"""
         self = ffi.from_handle(user_data)
         # self._logger.debug('ngspice_id-{} send_data [{}]'.format(ngspice_id, data.vecindex))
         actual_vector_values = {}
         for i in range(int(number_of_vectors)):
             actual_vector_value = data.vecsa[i]
-            vector_name = ffi_string_utf8(actual_vector_value.name)
+            vector_name = ffi_string_utf8(actual_vector_value.name, ffi)
             value = complex(actual_vector_value.creal, actual_vector_value.cimag)
             actual_vector_values[vector_name] = value
             # self._logger.debug('    Vector: {} {}'.format(vector_name, value))
@@ -679,7 +784,7 @@ class NgSpiceShared:
     ##############################################
 
     @staticmethod
-    def _send_init_data(data, ngspice_id, user_data):
+    def _send_init_data(data, ngspice_id, user_data, ffi=ffi):
         """Callback to send back initialization vector data"""
         self = ffi.from_handle(user_data)
         # if self._logger.isEnabledFor(logging.DEBUG):
@@ -692,7 +797,7 @@ class NgSpiceShared:
     ##############################################
 
     @staticmethod
-    def _background_thread_running(is_running, ngspice_id, user_data):
+    def _background_thread_running(is_running, ngspice_id, user_data, ffi=ffi):
         """Callback to indicate if background thread is runnin"""
         self = ffi.from_handle(user_data)
         self._logger.debug('ngspice_id-{} background_thread_running {}'.format(ngspice_id, is_running))
@@ -701,18 +806,18 @@ class NgSpiceShared:
     ##############################################
 
     @staticmethod
-    def _get_vsrc_data(voltage, time, node, ngspice_id, user_data):
+    def _get_vsrc_data(voltage, time, node, ngspice_id, user_data, ffi=ffi):
         """FFI Callback"""
         self = ffi.from_handle(user_data)
-        return self.get_vsrc_data(voltage, time, ffi_string_utf8(node), ngspice_id)
+        return self.get_vsrc_data(voltage, time, ffi_string_utf8(node, ffi), ngspice_id)
 
     ##############################################
 
     @staticmethod
-    def _get_isrc_data(current, time, node, ngspice_id, user_data):
+    def _get_isrc_data(current, time, node, ngspice_id, user_data, ffi=ffi):
         """FFI Callback"""
         self = ffi.from_handle(user_data)
-        return self.get_isrc_data(current, time, ffi_string_utf8(node), ngspice_id)
+        return self.get_isrc_data(current, time, ffi_string_utf8(node, ffi), ngspice_id)
 
     ##############################################
 
@@ -756,14 +861,13 @@ class NgSpiceShared:
 
     ##############################################
 
-    @staticmethod
-    def _convert_string_array(array):
+    def _convert_string_array(self, array):
         strings = []
         i = 0
         while True:
             if array[i] == FFI.NULL:
                 break
-            strings.append(ffi_string_utf8(array[i]))
+            strings.append(ffi_string_utf8(array[i], self._ffi))
             i += 1
         return strings
 
@@ -1153,10 +1257,10 @@ class NgSpiceShared:
         # ngspice 33 requires an empty line at the end
         circuit_lines.append("")
 
-        circuit_lines_keepalive = [ffi.new("char[]", line.encode('utf8'))
+        circuit_lines_keepalive = [self._ffi.new("char[]", line.encode('utf8'))
                                    for line in circuit_lines]
         circuit_lines_keepalive += [FFI.NULL]
-        circuit_array = ffi.new("char *[]", circuit_lines_keepalive)
+        circuit_array = self._ffi.new("char *[]", circuit_lines_keepalive)
         self.clear_output()
         rc = self._ngspice_shared.ngSpice_Circ(circuit_array)
 
@@ -1281,7 +1385,7 @@ class NgSpiceShared:
             if all_vectors_c[i] == FFI.NULL:
                 break
 
-            vector_name = ffi_string_utf8(all_vectors_c[i])
+            vector_name = ffi_string_utf8(all_vectors_c[i], self._ffi)
             name = '.'.join((plot_name, vector_name))
             vector_info = self._ngspice_shared.ngGet_Vec_Info(name.encode('utf8'))
             vector_type = self._simulation_type[vector_info.v_type]
@@ -1297,7 +1401,7 @@ class NgSpiceShared:
             if vector_info.v_compdata == FFI.NULL:
                 # for k in range(length):
                 #     print("  [{}] {}".format(k, vector_info.v_realdata[k]))
-                tmp_array = np.frombuffer(ffi.buffer(vector_info.v_realdata, length*8), dtype=np.float64)
+                tmp_array = np.frombuffer(self._ffi.buffer(vector_info.v_realdata, length*8), dtype=np.float64)
                 array = np.array(tmp_array, dtype=tmp_array.dtype)  # copy data
                 # import json
                 # with open(name + '.json', 'w') as fh:
@@ -1307,7 +1411,7 @@ class NgSpiceShared:
                 #     value = vector_info.v_compdata[k]
                 #     print(ffi.addressof(value, field='cx_real'), ffi.addressof(value, field='cx_imag'))
                 #     print("  [{}] {} + i {}".format(k, value.cx_real, value.cx_imag))
-                tmp_array = np.frombuffer(ffi.buffer(vector_info.v_compdata, length*8*2), dtype=np.float64)
+                tmp_array = np.frombuffer(self._ffi.buffer(vector_info.v_compdata, length*8*2), dtype=np.float64)
                 array = np.array(tmp_array[0::2], dtype=np.complex128)
                 array.imag = tmp_array[1::2]
             plot[vector_name] = Vector(self, vector_name, vector_type, array)
@@ -1322,3 +1426,22 @@ class NgSpiceShared:
 #
 
 NgSpiceShared.setup_platform()
+
+####################################################################################################
+#
+# Compiled binding callbacks
+#
+
+if _ngspice is not None:
+    for _ in (
+            '_send_char',
+            '_send_stat',
+            '_exit',
+            '_send_data',
+            '_send_init_data',
+            '_background_thread_running',
+            '_get_vsrc_data',
+            '_get_isrc_data',
+    ):
+        # the handles and the strings of the compiled binding are converted by its ffi
+        _ngspice.ffi.def_extern(name='pyspice' + _)(functools.partial(getattr(NgSpiceShared, _), ffi=_ngspice.ffi))
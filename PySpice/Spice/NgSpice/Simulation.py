@@ -28,8 +28,6 @@ import logging
 ####################################################################################################
 
 from ..Simulation import CircuitSimulator
-from .Server import SpiceServer
-from .Shared import NgSpiceShared
 
 ####################################################################################################
 
@@ -63,6 +61,8 @@ class NgSpiceSubprocessCircuitSimulator(NgSpiceCircuitSimulator):
 
         super().__init__(circuit, pipe=True, **kwargs)
 
+        from .Server import SpiceServer
+
         # Fixme: to func ?
         server_kwargs = {x:kwargs[x] for x in ('spice_command',) if x in kwargs}
         self._spice_server = SpiceServer(**server_kwargs)
@@ -96,6 +96,8 @@ class NgSpiceSharedCircuitSimulator(NgSpiceCircuitSimulator):
 
         ngspice_shared = kwargs.get('ngspice_shared', None)
         if ngspice_shared is None:
+            # import CFFI and load the library on first use
+            from .Shared import NgSpiceShared
             self._ngspice_shared = NgSpiceShared.new_instance()
         else:
             self._ngspice_shared = ngspice_shared
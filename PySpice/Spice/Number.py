@@ -0,0 +1,226 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This module implements the conversion of SPICE numbers to Python.
+
+A SPICE number is a float followed by an optional scale factor and an optional unit, the letters
+which follow the scale factor are ignored, e.g. ``10``, ``1k``, ``10meg``, ``4.7uF``, ``2.2e-12F``.
+
++--------+--------+
+| Suffix | Scale  |
++--------+--------+
+| T      | 1e12   |
++--------+--------+
+| G      | 1e9    |
++--------+--------+
+| Meg    | 1e6    |
++--------+--------+
+| K      | 1e3    |
++--------+--------+
+| mil    | 25.4e-6|
++--------+--------+
+| m      | 1e-3   |
++--------+--------+
+| u      | 1e-6   |
++--------+--------+
+| n      | 1e-9   |
++--------+--------+
+| p      | 1e-12  |
++--------+--------+
+| f      | 1e-15  |
++--------+--------+
+
+The scale is applied to the decimal exponent of the number, thus ``10u`` is converted to the float
+``10e-6`` and not to ``10 * 1e-6``.
+
+A sequence of SPICE numbers can be converted to an array in bulk using
+:func:`spice_numbers_to_array`.
+
+"""
+
+####################################################################################################
+
+from operator import methodcaller
+import re
+
+import numpy as np
+
+####################################################################################################
+
+from ..Unit.Unit import UnitValue
+
+####################################################################################################
+
+# prefix, power of ten, factor as a fraction
+SPICE_SCALES = (
+    # order matters: meg and mil before m
+    ('meg', 6, 1),
+    ('mil', 0, (254, 10**7)),
+    ('t', 12, 1),
+    ('g', 9, 1),
+    ('k', 3, 1),
+    ('m', -3, 1),
+    ('u', -6, 1),
+    ('μ', -6, 1),
+    ('n', -9, 1),
+    ('p', -12, 1),
+    ('f', -15, 1),
+)
+
+NUMBER_RE = re.compile(r'^\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)([a-zμ]*)\s*$', re.IGNORECASE)
+
+# Match one value per line, the second alternative matches the values which are not a number
+_BULK_NUMBER_RE = re.compile(r'^[ \t]*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)([a-zA-Zμ]*)[ \t]*$|^.*$',
+                             re.MULTILINE)
+
+_SUFFIX_LETTERS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZμ'
+
+####################################################################################################
+
+def is_spice_number(value):
+    """Return True if *value* is a SPICE number string."""
+    return NUMBER_RE.match(str(value)) is not None
+
+####################################################################################################
+
+def spice_number_to_float(value):
+
+    """Convert a SPICE number or a :class:`PySpice.Unit.Unit.UnitValue` to float.
+
+    Raise a :class:`ValueError` if the value cannot be converted, e.g. an expression.
+
+    """
+
+    if isinstance(value, (UnitValue, int, float)):
+        return float(value)
+    match = NUMBER_RE.match(str(value))
+    if match is None:
+        raise ValueError("Cannot convert '{}' to a number".format(value))
+    number, suffix = match.groups()
+    prefix, power, factor, unit = _split_suffix(suffix)
+    number = float(_shift_exponent(number, power))
+    if factor != 1:
+        numerator, denominator = factor
+        number = number * numerator / denominator
+    return number
+
+####################################################################################################
+
+def _split_suffix(suffix):
+
+    """Return the scale prefix, the power of ten, the factor and the unit of a suffix, e.g. ``uF``."""
+
+    lower_suffix = suffix.lower()
+    for prefix, power, factor in SPICE_SCALES:
+        if lower_suffix.startswith(prefix):
+            return suffix[:len(prefix)], power, factor, suffix[len(prefix):]
+    return '', 0, 1, suffix
+
+####################################################################################################
+
+def _shift_exponent(number, power):
+
+    """Add *power* to the decimal exponent of the number string *number*."""
+
+    if not power:
+        return number
+    mantissa, _, exponent = number.lower().partition('e')
+    return '{}e{}'.format(mantissa, int(exponent or 0) + power)
+
+####################################################################################################
+
+def spice_numbers_to_array(values, strict=True):
+
+    """Convert a sequence of SPICE numbers to a float64 array.
+
+    The suffixes are stripped in bulk, the numbers are converted by Numpy and the scales are looked
+    up once per distinct suffix.  If a value is not a plain number, the values are matched by a
+    single regular expression pass over the joined text.  The
+    :class:`PySpice.Unit.Unit.UnitValue` and the numbers are converted using :func:`float`.
+
+    Return a tuple ``(values, prefixes, units)``, *prefixes* and *units* are string arrays which give
+    the scale prefix and the unit of each value, e.g. ``'u'`` and ``'F'`` for ``4.7uF``.
+
+    If *strict* is set, raise a :class:`ValueError` if a value cannot be converted, else the value
+    is NaN.
+
+    """
+
+    texts = []
+    for value in values:
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, (UnitValue, int, float)):
+            texts.append(repr(float(value)))
+        else:
+            texts.append(str(value))
+    if not texts:
+        empty = np.zeros(0, dtype=str)
+        return np.zeros(0), empty, empty
+
+    stripped_texts = list(map(methodcaller('rstrip', _SUFFIX_LETTERS), texts))
+    try:
+        if any('_' in text for text in stripped_texts):
+            # accepted by float() but not by SPICE
+            raise ValueError
+        suffixes = [text[len(number):] for text, number in zip(texts, stripped_texts)]
+        return _scale_numbers(stripped_texts, suffixes)
+    except ValueError:
+        return _scale_numbers(*_match_numbers(texts, strict))
+
+####################################################################################################
+
+def _scale_numbers(numbers, suffixes):
+
+    """Return the float64 array of the scaled number strings, the prefixes and the units."""
+
+    suffix_indexes = {}
+    inverse = np.fromiter((suffix_indexes.setdefault(suffix, len(suffix_indexes)) for suffix in suffixes),
+                          dtype=np.intp, count=len(suffixes))
+    prefixes, powers, factors, units = zip(*[_split_suffix(suffix) for suffix in suffix_indexes])
+    if any(powers):
+        numbers = [_shift_exponent(number, powers[i]) for number, i in zip(numbers, inverse)]
+    numbers = np.array(numbers, dtype=np.float64)
+    if any(factor != 1 for factor in factors):
+        fractions = np.array([(1, 1) if factor == 1 else factor for factor in factors], dtype=np.float64)[inverse]
+        numbers = numbers * fractions[:, 0] / fractions[:, 1]
+    return numbers, np.array(prefixes)[inverse], np.array(units)[inverse]
+
+####################################################################################################
+
+def _match_numbers(texts, strict):
+
+    """Match the SPICE numbers and return the number strings and the suffixes."""
+
+    text = '\n'.join(texts)
+    matches = _BULK_NUMBER_RE.findall(text)
+    if len(matches) != len(texts):
+        # a value spans several lines
+        invalid = [x for x in texts if '\n' in x or '\r' in x]
+        raise ValueError("Cannot convert '{}' to a number".format(invalid[0] if invalid else text))
+    numbers, suffixes = zip(*matches)
+
+    numbers = np.array(numbers)
+    is_number = numbers != ''
+    if not is_number.all():
+        if strict:
+            raise ValueError("Cannot convert '{}' to a number".format(texts[np.argmin(is_number)]))
+        numbers = np.where(is_number, numbers, 'nan')
+    return list(numbers), suffixes
@@ -0,0 +1,355 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This module implements the dependency graph of the circuit parameters.
+
+The ``.param`` expressions are parsed by the expression parser so as to:
+
+* fold the parameters which only depend on constants,
+* sort the parameters in the order of their dependencies and detect the cycles,
+* find the elements which depend on a parameter, i.e. whose values contain a ``{ expression }``.
+
+A sweep can then evaluate only the parameters affected by a change and alter only the affected
+devices instead of reloading the deck::
+
+    graph = circuit.parameter_graph()
+    values = graph.evaluate()
+    for rload in (1e3, 2e3, 5e3):
+        names = graph.update(values, rload=rload)
+        for element, parameters in graph.alterations(values, names).items():
+            simulator.alter_device(element, **parameters)
+
+The expressions are evaluated by :mod:`PySpice.Spice.Expression.Compiler`, thus a value can be an
+array, e.g. to evaluate the parameters on Monte Carlo samples.
+
+Like in SPICE, the names are case-insensitive, they are returned in lower case.
+
+"""
+
+####################################################################################################
+
+from collections import deque
+import logging
+import re
+
+####################################################################################################
+
+from .ElementParameter import KeyValueParameter
+from .Expression.Compiler import compile_expression, iter_variables, parse_expression
+
+####################################################################################################
+
+_module_logger = logging.getLogger(__name__)
+
+####################################################################################################
+
+class ParameterCycleError(ValueError):
+    pass
+
+####################################################################################################
+
+_EXPRESSION_RE = re.compile(r'\{([^{}]*)\}')
+
+def _strip_expression(text):
+    """Remove the braces or the quotes around an expression."""
+    text = str(text).strip()
+    if len(text) >= 2 and (text[0], text[-1]) in (('{', '}'), ("'", "'")):
+        text = text[1:-1].strip()
+    return text
+
+def _variables(expression):
+    """Return the variables of an expression in lower case and in the order of appearance."""
+    return list(dict.fromkeys([name.lower() for name in iter_variables(parse_expression(expression))]))
+
+def _evaluate(expression, values):
+    """Evaluate an expression, *values* is a dictionary whose keys are in lower case."""
+    compiled_expression = compile_expression(expression)
+    try:
+        variables = {name: values[name.lower()] for name in compiled_expression.variables}
+    except KeyError as e:
+        raise NameError("Undefined variable {} in {}".format(e.args[0], expression))
+    return compiled_expression(variables)
+
+def _lower_keys(mapping):
+    return {name.lower(): value for name, value in mapping.items()}
+
+####################################################################################################
+
+# The names of the positional parameters used by the ngspice alter command, None if the parameter
+# cannot be altered.  The other parameters have the same name, e.g. resistance.
+ALTER_NAMES = {
+    'dc_value': 'dc',
+    'voltage_gain': 'gain',
+    'transconductance': 'gain',
+    'current_gain': 'gain',
+    'transresistance': 'gain',
+    'coupling_factor': 'k',
+    'resistance_expression': None,
+    'capacitance_expression': None,
+    'inductance_expression': None,
+}
+
+####################################################################################################
+
+class ParameterGraph:
+
+    """This class implements the dependency graph of a set of parameters.
+
+    *parameters* is a dictionary of expressions.  The names used in the expressions which are not
+    parameters, e.g. ``temp``, are free variables whose values must be provided on evaluation.  The
+    dependencies of the *elements* are computed from the parameter values which contain a
+    ``{ expression }``.
+
+    """
+
+    _logger = _module_logger.getChild('ParameterGraph')
+
+    ##############################################
+
+    def __init__(self, parameters, elements=()):
+
+        self._expressions = {}
+        self._dependencies = {}
+        for name, expression in parameters.items():
+            expression = _strip_expression(expression)
+            try:
+                variables = _variables(expression)
+            except NameError as e:
+                raise ValueError("Cannot parse parameter {} = {}".format(name, expression)) from e
+            name = name.lower()
+            self._expressions[name] = expression
+            self._dependencies[name] = variables
+
+        self._dependents = {}
+        free_variables = {}
+        for name, variables in self._dependencies.items():
+            for variable in variables:
+                self._dependents.setdefault(variable, []).append(name)
+                if variable not in self._expressions:
+                    free_variables[variable] = None
+        self._free_variables = list(free_variables)
+
+        self._order = self._sort()
+
+        # element name -> list of (key, expression, variables)
+        self._element_expressions = {}
+        for element in elements:
+            self._add_element(element)
+
+    ##############################################
+
+    @property
+    def parameters(self):
+        """Names of the parameters in the order of their dependencies"""
+        return list(self._order)
+
+    @property
+    def free_variables(self):
+        """Names of the variables which are not parameters"""
+        return list(self._free_variables)
+
+    def expression(self, name):
+        return self._expressions[name.lower()]
+
+    def dependencies(self, name):
+        """Return the names the parameter depends on directly."""
+        return list(self._dependencies[name.lower()])
+
+    ##############################################
+
+    def _sort(self):
+
+        """Sort the parameters so as a parameter follows its dependencies, the declaration order is
+        kept otherwise.
+
+        """
+
+        number_of_dependencies = {
+            name: len([variable for variable in variables if variable in self._expressions])
+            for name, variables in self._dependencies.items()
+        }
+        queue = deque([name for name, number in number_of_dependencies.items() if not number])
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for dependent in self._dependents.get(name, ()):
+                number_of_dependencies[dependent] -= 1
+                if not number_of_dependencies[dependent]:
+                    queue.append(dependent)
+
+        if len(order) != len(self._expressions):
+            remaining = [name for name in self._expressions if number_of_dependencies[name]]
+            raise ParameterCycleError("Cyclic parameter dependency: {}".format(' -> '.join(self._find_cycle(remaining))))
+
+        return order
+
+    ##############################################
+
+    def _find_cycle(self, remaining):
+
+        # Each remaining parameter depends on a remaining parameter, thus a walk ends in a cycle
+        remaining = set(remaining)
+        name = min(remaining)
+        path = []
+        while name not in path:
+            path.append(name)
+            name = next(variable for variable in self._dependencies[name] if variable in remaining)
+        return path[path.index(name):] + [name]
+
+    ##############################################
+
+    def _add_element(self, element):
+
+        expressions = []
+        for parameter in element.parameter_iterator():
+            value = parameter.__get__(element)
+            if not isinstance(value, str) or '{' not in value:
+                continue
+            variables = []
+            for match in _EXPRESSION_RE.finditer(value):
+                variables.extend(_variables(match.group(1)))
+            if isinstance(parameter, KeyValueParameter):
+                key = parameter.spice_name
+            else:
+                key = ALTER_NAMES.get(parameter.attribute_name, parameter.attribute_name)
+            # only a value which is a single expression can be evaluated
+            match = _EXPRESSION_RE.fullmatch(value.strip())
+            expression = match.group(1) if match is not None else None
+            if key is None:
+                key, expression = parameter.attribute_name, None
+            expressions.append((key, expression, list(dict.fromkeys(variables))))
+        if expressions:
+            self._element_expressions[element.name] = expressions
+
+    ##############################################
+
+    def affected_parameters(self, names):
+
+        """Return the parameters which depend on the parameters or the free variables *names*,
+        including them, in the order of their dependencies.
+
+        """
+
+        affected = set()
+        queue = deque([name.lower() for name in names])
+        while queue:
+            name = queue.popleft()
+            if name not in affected:
+                affected.add(name)
+                queue.extend(self._dependents.get(name, ()))
+        return [name for name in self._order if name in affected]
+
+    ##############################################
+
+    def affected_elements(self, names):
+
+        """Return the names of the elements which depend on the parameters or the free variables
+        *names*.
+
+        """
+
+        affected = set([name.lower() for name in names]) | set(self.affected_parameters(names))
+        return [element_name
+                for element_name, expressions in self._element_expressions.items()
+                if any(affected.intersection(variables) for key, expression, variables in expressions)]
+
+    ##############################################
+
+    def fold(self):
+
+        """Return a dictionary of the values of the parameters which only depend on constants."""
+
+        values = {}
+        for name in self._order:
+            if all(variable in values for variable in self._dependencies[name]):
+                try:
+                    values[name] = _evaluate(self._expressions[name], values)
+                except NameError:
+                    # e.g. a statistical function
+                    self._logger.debug("Cannot fold parameter {}".format(name))
+        return values
+
+    ##############################################
+
+    def evaluate(self, variables=None, **kwargs):
+
+        """Evaluate the parameters and return a dictionary of the values.
+
+        The values of the free variables are passed as keyword arguments or as a mapping, a
+        parameter passed this way overrides its expression, e.g. a parameter which calls a
+        statistical function like ``agauss``.
+
+        """
+
+        values = _lower_keys(dict(variables or {}, **kwargs))
+        for name in self._order:
+            if name not in values:
+                values[name] = _evaluate(self._expressions[name], values)
+        return values
+
+    ##############################################
+
+    def update(self, values, **kwargs):
+
+        """Update in place the dictionary *values* returned by :meth:`evaluate` for the new values of
+        parameters or free variables passed as keyword arguments.
+
+        Only the affected parameters are evaluated.  Return the names of the updated parameters and
+        variables.
+
+        """
+
+        kwargs = _lower_keys(kwargs)
+        values.update(kwargs)
+        names = self.affected_parameters(kwargs)
+        for name in names:
+            if name not in kwargs:
+                values[name] = _evaluate(self._expressions[name], values)
+        return list(kwargs) + [name for name in names if name not in kwargs]
+
+    ##############################################
+
+    def alterations(self, values, names):
+
+        """Return a dictionary ``{element name: {parameter: value}}`` of the element parameters
+        affected by the parameters or the free variables *names*, the values are computed from
+        *values*.
+
+        The keys of the parameters are the names used by the ngspice ``alter`` command, cf.
+        :data:`ALTER_NAMES`.  The parameters whose value is not a single expression, or which cannot
+        be altered, are skipped.
+
+        """
+
+        affected = set([name.lower() for name in names]) | set(self.affected_parameters(names))
+        alterations = {}
+        for element_name in self.affected_elements(names):
+            parameters = {}
+            for key, expression, variables in self._element_expressions[element_name]:
+                if not affected.intersection(variables):
+                    continue
+                elif expression is None:
+                    self._logger.warning("Cannot alter {} {}".format(element_name, key))
+                else:
+                    parameters[key] = _evaluate(expression, values)
+            if parameters:
+                alterations[element_name] = parameters
+        return alterations
@@ -30,14 +30,21 @@ It would be difficult to implement a full parser for Ngspice since the syntax is
 
 ####################################################################################################
 
+import hashlib
+import io
+import itertools
 import logging
+import math
 import os
+import pickle
 
 ####################################################################################################
 
 from .BasicElement import SubCircuitElement
 from .ElementParameter import FlagParameter
 from .Netlist import ElementParameterMetaClass, Circuit, SubCircuit
+from .Number import spice_numbers_to_array
+from .Tokenizer import split_parameters, tokenize
 
 ####################################################################################################
 
@@ -170,15 +177,31 @@ class Statement:
 
     ##############################################
 
+    @property
+    def line(self):
+        return self._line
+
+    ##############################################
+
     def value_to_python(self, x):
 
-        if x:
-            if str(x)[0].isdigit():
-                return str(x)
-            else:
-                return "'{}'".format(x)
-        else:
+        # the ground node is the integer 0
+        if x is None or x == '':
             return ''
+        elif str(x)[0].isdigit() and self._is_number(str(x)):
+            return str(x)
+        else:
+            return "'{}'".format(x)
+
+    ##############################################
+
+    @staticmethod
+    def _is_number(x):
+        try:
+            float(x)
+            return True
+        except ValueError:
+            return False
 
     ##############################################
 
@@ -188,9 +211,26 @@ class Statement:
 
     ##############################################
 
+    def numbers_to_python(self, values):
+
+        """Convert the values to Python, the SPICE numbers are recognised in bulk.  The numbers without
+        suffix are converted to float, the integers are kept as is and the numbers with a scale or a
+        unit, e.g. ``4.7uF``, are kept in this form.
+
+        """
+
+        values = list(values)
+        numbers, prefixes, units = spice_numbers_to_array([x if isinstance(x, str) else '' for x in values],
+                                                          strict=False)
+        return [repr(float(number)) if not (math.isnan(number) or x.isdigit() or prefix or unit)
+                else self.value_to_python(x)
+                for x, number, prefix, unit in zip(values, numbers, prefixes, units)]
+
+    ##############################################
+
     def kwargs_to_python(self, kwargs):
-        return ['{}={}'.format(key, self.value_to_python(value))
-                for key, value in kwargs.items()]
+        values = self.numbers_to_python(kwargs.values())
+        return ['{}={}'.format(key, value) for key, value in zip(kwargs, values)]
 
     ##############################################
 
@@ -229,7 +269,16 @@ class Title(Statement):
 
 class Lib(Statement):
 
-    """ This class implements a library definition. """
+    """ This class implements a library definition.
+
+    Spice syntax::
+
+        .lib libname
+        .lib filename libname
+
+    The second form is a reference to the section *libname* of the file *filename*.
+
+    """
 
     ##############################################
 
@@ -237,6 +286,24 @@ class Lib(Statement):
 
         super().__init__(line, statement='lib')
         self._lib = self._line.right_of('.lib')
+        words = self._lib.split()
+        if len(words) >= 2:
+            self._path = words[0].strip('"\'')
+            self._section = words[1]
+        else:
+            self._path = self._section = None
+
+    ##############################################
+
+    @property
+    def path(self):
+        """Path of the referenced file, None for a section definition"""
+        return self._path
+
+    @property
+    def section(self):
+        """Name of the referenced section, None for a section definition"""
+        return self._section
 
     ##############################################
 
@@ -308,6 +375,8 @@ class Model(Statement):
         self._model_type = mtch[2]
         params = mtch[3]
         params = params.strip('() ')
+        # the parameters can be separated by commas, except within an expression
+        params = re.sub(r',(?![^{]*\})', ' ', params)
         self._parameters = Line.get_kwarg(params)
 
     ##############################################
@@ -428,15 +497,21 @@ class Element(Statement):
         line_str = str(line)
         # self._logger.debug(os.linesep + line_str)
 
+        # Tokenize the line in one pass, cf. Tokenizer
+        if line_str[:1] in 'VvIi':
+            # the end offsets are used to merge the remaining tokens of a source
+            tokens, token_ends = tokenize(line_str, ends=True)
+        else:
+            tokens = tokenize(line_str)
+        number_of_tokens = len(tokens)
+
         # Retrieve device prefix
         self._prefix = line_str[0]
         prefix_data = _prefix_cache[self._prefix]
 
         # Retrieve device name
-        start_location = 1
-        stop_location = line_str.find(' ')
-        # Fixme: if stop_location == -1:
-        self._name = line_str[start_location:stop_location]
+        self._name = tokens[0][0][1:]
+        location = 1   # index of the next token
 
         self._nodes = []
         self._parameters = []
@@ -446,42 +521,39 @@ class Element(Statement):
         if not prefix_data.has_variable_number_of_pins:
             number_of_pins = prefix_data.number_of_pins
             if number_of_pins:
-                self._nodes, stop_location = self._line.read_words(stop_location, number_of_pins)
+                self._nodes, location = self._read_tokens(tokens, location, number_of_pins, line_str)
         else: # Q or X
             if prefix_data.prefix == 'Q':
-                self._nodes, stop_location = self._line.read_words(stop_location, 3)
+                self._nodes, location = self._read_tokens(tokens, location, 3, line_str)
                 # Fixme: optional node
             else: # X
-                args, stop_location = self._line.split_words(stop_location, until='=')
+                args, location = self._read_tokens_until_kwarg(tokens, location)
                 self._nodes = args[:-1]
                 self._parameters.append(args[-1]) # model name
 
         # Read positionals
         number_of_positionals = prefix_data.number_of_positionals_min
-        if number_of_positionals and stop_location is not None: # model is optional
-            self._parameters, stop_location = self._line.read_words(stop_location, number_of_positionals)
-        if prefix_data.multi_devices and stop_location is not None:
-            remaining, stop_location = self._line.split_words(stop_location, until='=')
+        if number_of_positionals and location < number_of_tokens: # model is optional
+            self._parameters, location = self._read_tokens(tokens, location, number_of_positionals, line_str)
+        if prefix_data.multi_devices and location < number_of_tokens:
+            remaining, location = self._read_tokens_until_kwarg(tokens, location)
             self._parameters.extend(remaining)
 
-        if prefix_data.prefix in ('V', 'I') and stop_location is not None:
+        if prefix_data.prefix in ('V', 'I') and location < number_of_tokens:
             # merge remaining
-            self._parameters[-1] += line_str[stop_location:]
+            self._parameters[-1] += line_str[token_ends[location - 1]:]
 
         # Read optionals
-        if prefix_data.has_optionals and stop_location is not None:
-            kwargs, stop_location = self._line.split_words(stop_location)
-            for kwarg in kwargs:
-                try:
-                    key, value = kwarg.split('=')
+        if prefix_data.has_optionals and location < number_of_tokens:
+            for token, key, value in tokens[location:]:
+                if key:
                     self._dict_parameters[key.lower()] = value
-                except ValueError:
-                    if kwarg in ('off',) and prefix_data.has_flag:
-                        self._dict_parameters['off'] = True
-                    else:
-                        # Fixme: warning -> debug due to spam ...
-                        self._logger.debug(line_str)
-                        # raise NameError('Bad element line:', line_str)
+                elif token in ('off',) and prefix_data.has_flag:
+                    self._dict_parameters['off'] = True
+                else:
+                    # Fixme: warning -> debug due to spam ...
+                    self._logger.debug(line_str)
+                    # raise NameError('Bad element line:', line_str)
 
         if prefix_data.multi_devices:
             for element_class in prefix_data:
@@ -505,6 +577,37 @@ class Element(Statement):
 
     ##############################################
 
+    def _read_tokens(self, tokens, location, number_of_words, line_str):
+
+        """Read a fixed number of tokens from *location* and return the words and the next location."""
+
+        stop = location + number_of_words
+        if stop > len(tokens):
+            template = 'Bad element line, looking for word {}/{}:' + os.linesep
+            message = template.format(len(tokens) - location, number_of_words) + line_str
+            self._logger.warning(message)
+            raise ParseError(message)
+        return [token for token, key, value in tokens[location:stop]], stop
+
+    ##############################################
+
+    @staticmethod
+    def _read_tokens_until_kwarg(tokens, location):
+
+        """Read the tokens from *location* until the first ``key=value`` and return the words and the
+        location of the key.
+
+        """
+
+        words = []
+        for token, key, value in tokens[location:]:
+            if key:
+                break
+            words.append(token)
+        return words, location + len(words)
+
+    ##############################################
+
     @property
     def name(self):
         """ Name of the element """
@@ -532,12 +635,10 @@ class Element(Statement):
     def to_python(self, netlist_name, ground=0):
 
         nodes = self.translate_ground_node(ground)
-        args = [self._name]
         if self._prefix != 'X':
-            args += nodes + self._parameters
+            args = self.values_to_python([self._name] + nodes) + self.numbers_to_python(self._parameters)
         else: # != Spice
-            args += self._parameters + nodes
-        args = self.values_to_python(args)
+            args = self.values_to_python([self._name] + self._parameters + nodes)
         kwargs = self.kwargs_to_python(self._dict_parameters)
         return '{}.{}({})'.format(netlist_name, self._prefix, self.join_args(args + kwargs)) + os.linesep
 
@@ -590,6 +691,10 @@ class Line:
 
     ##############################################
 
+    @property
+    def line_range(self):
+        return self._line_range
+
     @property
     def comment(self):
         return self._comment
@@ -726,28 +831,9 @@ class Line:
     @staticmethod
     def get_kwarg(text):
 
-        dict_parameters = {}
-
-        parts = []
-        for part in text.split():
-            if '=' in part and part != '=':
-                left, right = [x for x in part.split('=')]
-                parts.append(left)
-                parts.append('=')
-                if right:
-                    parts.append(right)
-            else:
-                parts.append(part)
-
-        i = 0
-        i_stop = len(parts)
-        while i < i_stop:
-            if i + 1 < i_stop and parts[i + 1] == '=':
-                key, value = parts[i], parts[i + 2]
-                dict_parameters[key] = value
-                i += 3
-            else:
-                raise ParseError("Bad kwarg: {}".format(text))
+        parameters, dict_parameters = split_parameters(text)
+        if parameters:
+            raise ParseError("Bad kwarg: {}".format(text))
 
         return dict_parameters
 
@@ -763,36 +849,82 @@ class Line:
 
         """
 
-        # Fixme: cf. get_kwarg
+        return split_parameters(self.right_of(keyword))
 
-        parameters = []
-        dict_parameters = {}
+####################################################################################################
 
-        text = self.right_of(keyword)
+class SpiceDefinition:
 
-        parts = []
-        for part in text.split():
-            if '=' in part and part != '=':
-                left, right = [x for x in part.split('=')]
-                parts.append(left)
-                parts.append('=')
-                if right:
-                    parts.append(right)
-            else:
-                parts.append(part)
-
-        i = 0
-        i_stop = len(parts)
-        while i < i_stop:
-            if i + 1 < i_stop and parts[i + 1] == '=':
-                key, value = parts[i], parts[i + 2]
-                dict_parameters[key] = value
-                i += 3
-            else:
-                parameters.append(parts[i])
-                i += 1
+    """This class stores a sub-circuit or a model definition found by :meth:`SpiceParser.scan`.
+
+    Public Attributes:
+
+      :attr:`kind`
+        'subckt' or 'model'
+
+      :attr:`name`
+
+      :attr:`nodes`
+        the list of nodes of a sub-circuit
+
+      :attr:`start` and :attr:`stop`
+        the byte range of the definition in the file, the *.ends* line is included
+
+    """
+
+    ##############################################
+
+    def __init__(self, kind, name, nodes, start, stop):
+        self.kind = kind
+        self.name = name
+        self.nodes = nodes
+        self.start = start
+        self.stop = stop
 
-        return parameters, dict_parameters
+    ##############################################
+
+    def __repr__(self):
+        return '{0.kind} {0.name} {0.nodes} [{0.start}:{0.stop}]'.format(self)
+
+####################################################################################################
+
+class SpiceScan:
+
+    """This class stores the result of :meth:`SpiceParser.scan`.
+
+    Public Attributes:
+
+      :attr:`has_title`
+        True if the file has a *.title* statement
+
+      :attr:`subcircuits`
+        list of :class:`SpiceDefinition`
+
+      :attr:`models`
+        list of :class:`SpiceDefinition`
+
+      :attr:`includes`
+        list of included paths
+
+    """
+
+    ##############################################
+
+    def __init__(self):
+        self.has_title = False
+        self.subcircuits = []
+        self.models = []
+        self.includes = []
+
+    ##############################################
+
+    def is_only_subcircuit(self):
+        return bool(not self.has_title and self.subcircuits)
+
+    ##############################################
+
+    def is_only_model(self):
+        return bool(not self.has_title and not self.subcircuits and self.models)
 
 ####################################################################################################
 
@@ -810,45 +942,453 @@ class SpiceParser:
 
       :attr:`incl_libs`
 
+    If *cache* is set, the statement tree of a file is stored in a cache, *cache* can be True to use
+    the default cache directory, cf. :meth:`default_cache_directory`, or a directory path.  The
+    cache is keyed by the file path and the parser options, and it is validated using the content
+    hash of the file and :attr:`CACHE_VERSION`.  The included files are not cached.
+
+    If *section* is set, the byte ranges of the library sections of the file are indexed, cf.
+    :meth:`_section_index`, and only the lines outside the sections and the lines of the requested
+    section are read and parsed.  The *.lib filename libname* references are replaced by the
+    statements of the referenced sections, the reference cycles are skipped.  The stream mode
+    doesn't follow the references.
+
+    If *stream* is set, the file is not parsed when the instance is created, but :meth:`build_circuit`
+    reads, parses and builds the file in a single pass without storing the statements, so as to
+    bound the memory for very large netlists.  Only :meth:`build_circuit` is available in this mode.
+
+    If *recurse* is set, the included files are resolved using *include_resolver*, cf.
+    :class:`PySpice.Spice.Library.IncludeResolver`, so as to scan each file once and to skip the
+    include cycles.
+
     """
 
     _logger = _module_logger.getChild('SpiceParser')
 
+    # Increment when the statement classes change
+    CACHE_VERSION = 1
+
+    # (real path, end of line comment) -> (mtime, size, sections)
+    _section_indexes = {}
+
     ##############################################
 
-    def __init__(self, path=None, source=None, end_of_line_comment=('$', '//', ';'), recurse=False, section=None):
+    def __init__(self, path=None, source=None, end_of_line_comment=('$', '//', ';'), recurse=False, section=None,
+                 cache=False, include_resolver=None, stream=False):
 
         # Fixme: empty source
 
-        self._path = path  # For use by _parse() when recursing through files.
+        self._path = path  # For use by _include_libraries() when recursing through files.
 
+        self._end_of_line_comment = end_of_line_comment
+        self._title = None
+        self._statements = None
+
+        self._stream = stream
+        if stream:
+            if path is None or cache or recurse:
+                raise ValueError("Stream mode requires a path and doesn't support cache and recurse")
+            self._section = section
+            self.incl_libs = []
+            self.circuit = None
+            self.subcircuits = None
+            self.models = None
+            return
+
+        cache_path = None
+        line_indexes = None
         if path is not None:
-            with open(str(path), 'r') as f:
-                raw_lines = f.readlines()
+            if cache:
+                with open(str(path), 'rb') as f:
+                    data = f.read()
+                cache_path, content_hash = self._cache_key(path, data, cache, section)
+                self._load_cache(cache_path, content_hash)
+                if self._statements is None:
+                    # same decoding as open(path, 'r')
+                    raw_lines = io.TextIOWrapper(io.BytesIO(data)).readlines()
+            elif section:
+                raw_lines, line_indexes = self._read_section(path, section)
+            else:
+                with open(str(path), 'r') as f:
+                    raw_lines = f.readlines()
         elif source is not None:
             raw_lines = source.split(os.linesep)
         else:
             raise ValueError
 
-        self._end_of_line_comment = end_of_line_comment
+        if self._statements is None:
+            lines = self._merge_lines(raw_lines, line_indexes)
+            self._statements = self._parse(lines, section=section)
+            if cache_path is not None:
+                self._save_cache(cache_path, content_hash)
+        if section and path is not None:
+            self._statements = list(self._follow_library_references(self._statements, path, section))
 
-        lines = self._merge_lines(raw_lines)
-        self._title = None
-        self._statements = self._parse(lines=lines, recurse=recurse, section=section)
+        self.incl_libs = self._include_libraries(recurse, include_resolver)
         self._find_sections()
 
     ##############################################
 
-    def _merge_lines(self, raw_lines):
+    @staticmethod
+    def default_cache_directory():
+        """Return the default cache directory, i.e. :file:`$XDG_CACHE_HOME/PySpice/parser`."""
+        cache_home = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+        return os.path.join(cache_home, 'PySpice', 'parser')
+
+    ##############################################
+
+    def _cache_key(self, path, data, cache, section):
+
+        """Return the cache path and the content hash."""
+
+        if cache is True:
+            cache = self.default_cache_directory()
+        options = repr((os.path.abspath(str(path)), self._end_of_line_comment, section))
+        key = hashlib.blake2b(options.encode('utf-8'), digest_size=16).hexdigest()
+        content_hash = hashlib.blake2b(data, digest_size=32).hexdigest()
+        return os.path.join(str(cache), key + '.pickle'), content_hash
+
+    ##############################################
+
+    def _load_cache(self, cache_path, content_hash):
+
+        try:
+            with open(cache_path, 'rb') as f:
+                version, _content_hash, title, statements = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self._logger.warning("Cannot load parser cache {} - {}".format(cache_path, e))
+            return
+        if version == self.CACHE_VERSION and _content_hash == content_hash:
+            self._logger.debug("Load {} from cache".format(self._path))
+            self._title = title
+            self._statements = statements
+
+    ##############################################
+
+    def _save_cache(self, cache_path, content_hash):
+
+        data = (self.CACHE_VERSION, content_hash, self._title, self._statements)
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self._logger.warning("Cannot write parser cache {} - {}".format(cache_path, e))
+
+    ##############################################
+
+    def _section_index(self, path):
+
+        """Return the library sections of a file as a list of ``[name, start offset, start line, stop
+        offset, stop line]``.
+
+        A section starts at a *.lib* statement and stops after the next *.endl* statement, as the
+        lines skipped by :meth:`_parse`, a *.lib filename libname* reference doesn't start a section.
+        The index is cached per real path and validated using the modification time and size of the
+        file.  The file is read line by line.
+
+        """
+
+        real_path = os.path.realpath(str(path))
+        stat = os.stat(real_path)
+        key = (real_path, tuple(self._end_of_line_comment))
+        cached = self._section_indexes.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        with open(real_path, 'rb') as f:
+            sections = self._index_sections(f)
+        self._section_indexes[key] = (stat.st_mtime_ns, stat.st_size, sections)
+        return sections
+
+    ##############################################
+
+    def _index_sections(self, raw_lines):
+
+        """Return the library sections of the binary lines *raw_lines*, cf. :meth:`_section_index`."""
+
+        sections = []
+        section = None
+        is_closed = False
+        first_line = True
+        offset = 0
+        line_index = -1
+        for line_index, raw_line in enumerate(raw_lines):
+            start = offset
+            offset += len(raw_line)
+            content = raw_line.lstrip(b' ')
+            if content.startswith(b'+'):
+                # a continuation of the .endl line belongs to the section
+                if is_closed:
+                    section[3:] = [offset, line_index + 1]
+                continue
+            content = content.rstrip(b'\r\n')
+            if not content:
+                continue
+            if is_closed:
+                section = None
+                is_closed = False
+            if first_line:
+                # title
+                first_line = False
+            elif section is not None:
+                if content[:5].lower() == b'.endl':
+                    section[3:] = [offset, line_index + 1]
+                    is_closed = True
+            elif content[:4].lower() == b'.lib':
+                line = Line(content.decode('utf-8', 'replace'), slice(line_index, line_index + 1),
+                            self._end_of_line_comment)
+                lib = Lib(line)
+                if lib.path is None:
+                    section = [str(lib), start, line_index, None, None]
+                    sections.append(section)
+        if section is not None and section[3] is None:
+            # unterminated section
+            section[3:] = [offset, line_index + 1]
+        return sections
+
+    ##############################################
+
+    def _read_section(self, path, section):
+
+        """Read the lines outside the library sections and the lines of the library section
+        *section*, return the lines and their indexes in the file.
+
+        """
+
+        section = section.lower()
+        ranges = []   # (line index, start offset, stop offset)
+        line_index = offset = 0
+        for name, start, start_line, stop, stop_line in self._section_index(path):
+            if name != section:
+                ranges.append((line_index, offset, start))
+                line_index, offset = stop_line, stop
+        ranges.append((line_index, offset, None))
+        return self._read_ranges(path, ranges)
+
+    ##############################################
+
+    def _read_library_section(self, path, section):
+
+        """Parse the library section *section* of the file *path* and return its statements."""
+
+        section = section.lower()
+        ranges = [(start_line, start, stop)
+                  for name, start, start_line, stop, stop_line in self._section_index(path)
+                  if name == section]
+        if not ranges:
+            self._logger.warning("Library section {} not found in {}".format(section, path))
+        raw_lines, line_indexes = self._read_ranges(path, ranges)
+        lines = self._merge_lines(raw_lines, line_indexes)
+        return self._parse(lines, section=section, has_title=False)
+
+    ##############################################
+
+    def _follow_library_references(self, statements, path, section, stack=()):
+
+        """Replace the *.lib filename libname* references of the library section *section* of the
+        file *path* by the statements of the referenced sections.
+
+        A reference to a section which is being resolved, i.e. a cycle, is skipped with a warning.
+
+        """
+
+        stack = stack + ((os.path.realpath(str(path)), section.lower()),)
+        directory = os.path.dirname(str(path))
+        for statement in statements:
+            if isinstance(statement, Lib) and statement.path is not None:
+                lib_path = os.path.join(directory, os.path.expandvars(os.path.expanduser(statement.path)))
+                key = (os.path.realpath(lib_path), statement.section.lower())
+                if key in stack:
+                    cycle = stack[stack.index(key):] + (key,)
+                    self._logger.warning("Library cycle {}".format(
+                        ' -> '.join('{} {}'.format(*item) for item in cycle)))
+                    continue
+                yield from self._follow_library_references(
+                    self._read_library_section(lib_path, statement.section), lib_path, statement.section, stack)
+            else:
+                yield statement
+
+    ##############################################
+
+    @staticmethod
+    def _read_ranges(path, ranges):
+
+        """Read the lines of the byte ranges ``(line index, start offset, stop offset)`` of a file,
+        return the lines and their indexes in the file.
+
+        """
+
+        raw_lines = []
+        line_indexes = []
+        with open(os.path.realpath(str(path)), 'rb') as f:
+            for line_index, start, stop in ranges:
+                f.seek(start)
+                data = f.read() if stop is None else f.read(stop - start)
+                # same decoding as open(path, 'r')
+                lines = io.TextIOWrapper(io.BytesIO(data)).readlines()
+                raw_lines.extend(lines)
+                line_indexes.extend(range(line_index, line_index + len(lines)))
+        return raw_lines, line_indexes
 
-        """Merge broken lines and return a new list of lines.
+    ##############################################
+
+    def _include_libraries(self, recurse, include_resolver=None):
+
+        """Return the libraries of the included files if *recurse* is set."""
+
+        libraries = []
+        if recurse:
+            if include_resolver is None:
+                from .Library import IncludeResolver
+                include_resolver = IncludeResolver()
+            directory = os.path.dirname(str(self._path)) if self._path is not None else ''
+            with include_resolver.scope(self._path):
+                for include in self._iter_includes(self._statements):
+                    library = include_resolver.resolve(os.path.join(directory, str(include)))
+                    if library is not None and library not in libraries:
+                        libraries.append(library)
+        return libraries
+
+    ##############################################
+
+    @classmethod
+    def _iter_includes(cls, statements):
+        for statement in statements:
+            if isinstance(statement, Include):
+                yield statement
+            elif isinstance(statement, SubCircuitStatement):
+                yield from cls._iter_includes(statement)
+
+    ##############################################
+
+    @classmethod
+    def scan(cls, path, end_of_line_comment=('$', '//', ';'), section=None):
+
+        """Scan a file for sub-circuit and model definitions and return a :class:`SpiceScan` instance.
+
+        This fast mode only recognises the *.subckt*, *.ends*, *.model*, *.include*, *.lib* and
+        *.endl* statements, the other lines are skipped without being decoded.  The rules are the
+        same as the parser, e.g. for the title line and the library sections.
 
-        A line starting with "+" continues the preceding line.
         """
 
-        lines = []
+        with open(str(path), 'rb') as f:
+            data = f.read()
+
+        scan = SpiceScan()
+        skip_lines = [False]
+        subcircuit = None
+        statement = None   # current dot statement: [line, start, stop]
+        first_line = True
+
+        def flush(statement):
+            line, start, stop = statement
+            text = str(line)
+            lower_case_text = text.lower()
+            if lower_case_text.startswith('.subckt'):
+                try:
+                    parameters, dict_parameters = line.split_line('.subckt')
+                except (ValueError, IndexError):
+                    return None
+                if not parameters:
+                    return None
+                nodes = [node for node in parameters[1:] if node.lower() != 'params:']
+                definition = SpiceDefinition('subckt', parameters[0], nodes, start, None)
+                scan.subcircuits.append(definition)
+                return definition
+            elif lower_case_text.startswith('.model') and subcircuit is None:
+                # models defined in a sub-circuit are local
+                words = line.right_of('.model').replace('(', ' ').split()
+                if len(words) >= 2:
+                    scan.models.append(SpiceDefinition('model', words[0], [], start, stop))
+            return None
+
+        offset = 0
+        for raw_line in data.splitlines(keepends=True):
+            start = offset
+            offset += len(raw_line)
+            content = raw_line.lstrip(b' ')
+            if content.startswith(b'+'):
+                if statement is not None:
+                    statement[0].append(content[1:].rstrip(b'\r\n').decode('utf-8', 'replace'))
+                    statement[2] = offset
+                continue
+            content = content.rstrip(b'\r\n')
+            if not content:
+                continue
+            lower_case_content = content[:7].lower()
+            if first_line:
+                # the first line is the title, even if it is a comment
+                first_line = False
+                if not lower_case_content.startswith((b'.model', b'.subckt')):
+                    continue
+            if content.startswith(b'*'):
+                # a continuation can follow a comment
+                continue
+            if statement is not None:
+                definition = flush(statement)
+                if definition is not None:
+                    subcircuit = definition
+                statement = None
+
+            if not content.startswith(b'.'):
+                continue
+
+            if skip_lines[-1]:
+                if lower_case_content.startswith(b'.endl'):
+                    skip_lines.pop()
+            elif lower_case_content.startswith((b'.subckt', b'.model')):
+                line = Line(content.decode('utf-8', 'replace'), slice(0, 1), end_of_line_comment)
+                statement = [line, start, offset]
+            elif lower_case_content.startswith(b'.ends'):
+                if subcircuit is not None:
+                    subcircuit.stop = offset
+                subcircuit = None
+            elif lower_case_content.startswith(b'.title'):
+                scan.has_title = True
+            elif lower_case_content.startswith((b'.end', b'.param', b'.option')):
+                pass
+            elif lower_case_content.startswith(b'.includ'):
+                line = Line(content.decode('utf-8', 'replace'), slice(0, 1), end_of_line_comment)
+                scan.includes.append(str(Include(line)))
+            elif lower_case_content.startswith(b'.lib'):
+                line = Line(content.decode('utf-8', 'replace'), slice(0, 1), end_of_line_comment)
+                lib = Lib(line)
+                if section and lib.path is None and str(lib) != section.lower():
+                    skip_lines.append(True)
+
+        if statement is not None:
+            definition = flush(statement)
+            if definition is not None:
+                subcircuit = definition
+        if subcircuit is not None:
+            subcircuit.stop = offset
+
+        return scan
+
+    ##############################################
+
+    def _merge_lines(self, raw_lines, line_indexes=None):
+
+        """Merge broken lines and yield the lines.
+
+        A line starting with "+" continues the preceding line.  *line_indexes* gives the indexes of
+        the lines in the file, by default the lines are numbered from 0.  *raw_lines* can be any
+        iterable, e.g. a file, a line is yielded once the next line which is not a continuation or a
+        comment is read.
+        """
+
+        if line_indexes is None:
+            line_indexes = itertools.count()
+
+        pending_lines = []   # the current line and the following comments
         current_line = None
-        for line_index, line_string in enumerate(raw_lines):
+        for line_string, line_index in zip(raw_lines, line_indexes):
             line_string = line_string.lstrip(' ')
             if line_string.startswith('+'):
                 current_line.append(line_string[1:].strip('\r\n'))
@@ -857,92 +1397,103 @@ class SpiceParser:
                 if line_string:
                     _slice = slice(line_index, line_index +1)
                     line = Line(line_string, _slice, self._end_of_line_comment)
-                    lines.append(line)
                     # handle case with comment before line continuation
                     if not line_string.startswith('*'):
+                        yield from pending_lines
+                        pending_lines = []
                         current_line = line
+                    pending_lines.append(line)
 
-        return lines
+        yield from pending_lines
 
     ##############################################
 
-    def _parse(self, lines, recurse=False, section=None):
+    def _parse(self, lines, section=None, has_title=True):
 
         """ Parse the lines and return a list of statements. """
 
+        return list(self._iter_statements(lines, section, has_title))
+
+    ##############################################
+
+    def _iter_statements(self, lines, section=None, has_title=True):
+
+        """Parse the lines and yield the top-level statements.
+
+        *lines* can be any iterable, a sub-circuit is yielded when its *.ends* statement is read.  If
+        *has_title* is not set, the first line is not a title line, e.g. for a library section.
+        """
+
         # The first line in the input file must be the title, which is the only comment line that does
         # not need any special character in the first place.
         #
         # The last line must be .end
 
-        if len(lines) <= 1:
-            self._logger.warning('Empty Spice file: {self._path}'.format(**locals()))
-            # raise NameError('Netlist is empty')
-        # if lines[-1] != '.end':
-        #     raise NameError('".end" is expected at the end of the netlist')
-
-        title_statement = '.title '
-        self._title = str(lines[0])
-        if self._title.startswith(title_statement):
-            self._title = self._title[len(title_statement):]
-
-        # SUBCKT and MODEL files often start with their commands as the
-        # first line so they'll parse incorrectly if that line is removed.
-        # For everything else, assume the first line is a TITLE line and
-        # remove it.
-        if str(lines[0]).startswith(('.model', '.subckt')):
-            start_index = 0
-        else:
-            start_index = 1
-
-        statements = []
+        lines = iter(lines)
+        if has_title:
+            first_line = next(lines, None)
+            if first_line is None:
+                self._logger.warning('Empty Spice file: {self._path}'.format(**locals()))
+                # raise NameError('Netlist is empty')
+                return
+            # if lines[-1] != '.end':
+            #     raise NameError('".end" is expected at the end of the netlist')
+
+            title_statement = '.title '
+            self._title = str(first_line)
+            if self._title.startswith(title_statement):
+                self._title = self._title[len(title_statement):]
+
+            # SUBCKT and MODEL files often start with their commands as the
+            # first line so they'll parse incorrectly if that line is removed.
+            # For everything else, assume the first line is a TITLE line and
+            # remove it.
+            if str(first_line).startswith(('.model', '.subckt')):
+                lines = itertools.chain((first_line,), lines)
+
+        number_of_lines = 0
         skip_lines = [False]  # True on top of stack means skip lines.
         sub_circuit = None
-        scope = statements
-        self.incl_libs = []  # Libraries found during recursive descent into includes.
-        for line in lines[start_index:]:
+        for line in lines:
             # print('>', repr(line))
+            number_of_lines += 1
+            statement = None
             text = str(line)
             lower_case_text = text.lower() # !
             if skip_lines[-1]:
                 if lower_case_text.startswith('.endl'):
                     skip_lines.pop()
             elif line.is_comment:
-                scope.append(Comment(line))
+                statement = Comment(line)
             elif lower_case_text.startswith('.'):
                 lower_case_text = lower_case_text[1:]
                 if lower_case_text.startswith('subckt'):
+                    if sub_circuit is not None:
+                        yield sub_circuit
                     sub_circuit = SubCircuitStatement(line)
-                    statements.append(sub_circuit)
-                    scope = sub_circuit
                 elif lower_case_text.startswith('ends'):
+                    if sub_circuit is not None:
+                        yield sub_circuit
                     sub_circuit = None
-                    scope = statements
                 elif lower_case_text.startswith('title'):
                     # override first line
                     self._title = Title(line)
-                    scope.append(self._title)
+                    statement = self._title
                 elif lower_case_text.startswith('end'):
                     pass
                 elif lower_case_text.startswith('model'):
-                    model = Model(line)
-                    scope.append(model)
+                    statement = Model(line)
                 elif lower_case_text.startswith('include'):
-                    incl = Include(line)
-                    scope.append(incl)
-                    if recurse:
-                        from .Library import SpiceLibrary
-                        incl_path = os.path.join(str(self._path.directory_part()), str(incl))
-                        self.incl_libs.append(SpiceLibrary(root_path=incl_path, recurse=recurse))
+                    statement = Include(line)
                 elif lower_case_text.startswith('lib'):
                     lib = Lib(line)
-                    if section and str(lib) != section.lower():
+                    if section and lib.path is None and str(lib) != section.lower():
                         # If the .lib statement is only followed by the name of a section,
                         # then skip any lines in a library section whose name does not match
                         # the library section argument.
                         skip_lines.append(True)
                     else:
-                        scope.append(lib)
+                        statement = lib
                 else:
                     # options param ...
                     # .global
@@ -954,12 +1505,19 @@ class SpiceParser:
                     pass
             else:
                 try:
-                    element = Element(line)
-                    scope.append(element)
+                    statement = Element(line)
                 except ParseError:
                     self._logger.warning('Parse error on:\n{}'.format(line))
+            if statement is not None:
+                if sub_circuit is None:
+                    yield statement
+                else:
+                    sub_circuit.append(statement)
 
-        return statements
+        if sub_circuit is not None:
+            yield sub_circuit
+        if not number_of_lines:
+            self._logger.warning('Empty Spice file: {self._path}'.format(**locals()))
 
     ##############################################
 
@@ -1001,13 +1559,20 @@ class SpiceParser:
                 circuit.include(str(statement))
 
         for statement in statements:
-            if isinstance(statement, Element):
-                statement.build(circuit, ground)
-            elif isinstance(statement, Model):
-                statement.build(circuit)
-            elif isinstance(statement, SubCircuit):
-                subcircuit = statement.build(ground) # Fixme: ok ???
-                circuit.subcircuit(subcircuit)
+            SpiceParser._build_statement(circuit, statement, ground)
+
+    ##############################################
+
+    @staticmethod
+    def _build_statement(circuit, statement, ground):
+
+        if isinstance(statement, Element):
+            statement.build(circuit, ground)
+        elif isinstance(statement, Model):
+            statement.build(circuit)
+        elif isinstance(statement, SubCircuit):
+            subcircuit = statement.build(ground) # Fixme: ok ???
+            circuit.subcircuit(subcircuit)
 
     ##############################################
 
@@ -1019,6 +1584,20 @@ class SpiceParser:
 
         """
 
+        if self._stream:
+            circuit = Circuit('')
+            with open(str(self._path), 'r') as f:
+                for statement in self._iter_statements(self._merge_lines(f), self._section):
+                    # the includes are stored apart from the elements
+                    if isinstance(statement, Include):
+                        circuit.include(str(statement))
+                    elif isinstance(statement, Lib) and statement.path is not None:
+                        self._logger.warning("Library reference {} is not followed in stream mode".format(statement))
+                    else:
+                        self._build_statement(circuit, statement, ground)
+            circuit.title = str(self._title)
+            return circuit
+
         circuit = Circuit(str(self._title))
         self._build_circuit(circuit, self._statements, ground)
         return circuit
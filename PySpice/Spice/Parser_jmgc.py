@@ -35,12 +35,12 @@ SPICE is case insensitive.
 from collections import OrderedDict
 import logging
 import os
-import regex
 
 ####################################################################################################
 
 from .ElementParameter import FlagParameter
 from .Netlist import ElementParameterMetaClass, Circuit, SubCircuit
+from .Tokenizer import iter_groups, split_parameters, tokenize
 
 ####################################################################################################
 
@@ -1056,28 +1056,9 @@ class Line:
     @staticmethod
     def get_kwarg(text):
 
-        dict_parameters = {}
-
-        parts = []
-        for part in text.split():
-            if '=' in part and part != '=':
-                left, right = [x for x in part.split('=')]
-                parts.append(left)
-                parts.append('=')
-                if right:
-                    parts.append(right)
-            else:
-                parts.append(part)
-
-        i = 0
-        i_stop = len(parts)
-        while i < i_stop:
-            if i + 1 < i_stop and parts[i + 1] == '=':
-                key, value = parts[i], parts[i + 2]
-                dict_parameters[key] = value
-                i += 3
-            else:
-                raise ParseError("Bad kwarg: {}".format(text))
+        parameters, dict_parameters = split_parameters(text)
+        if parameters:
+            raise ParseError("Bad kwarg: {}".format(text))
 
         return dict_parameters
 
@@ -1086,29 +1067,23 @@ class Line:
     @staticmethod
     def _partition(text):
         parts = []
-        values = text.replace(',', ' ')
-        for part in values.split():
-            if '=' in part and part != '=':
-                left, right = [x for x in part.split('=')]
-                parts.append(left)
-                parts.append('=')
-                if right:
-                    parts.append(right)
+        for token, key, value in tokenize(text.replace(',', ' ')):
+            if key:
+                parts.extend((key, '=', value))
             else:
-                parts.append(part)
+                parts.append(token)
         return parts
 
     ##############################################
 
     @staticmethod
     def _partition_parentheses(text):
-        p = regex.compile(r'\(([^\(\)]|(?R))*?\)')
         parts = []
         previous_start = 0
-        for m in regex.finditer(p, text):
-            parts.extend(Line._partition(text[previous_start:m.start()]))
-            parts.append(m.group())
-            previous_start = m.end()
+        for start, end in iter_groups(text, '()'):
+            parts.extend(Line._partition(text[previous_start:start]))
+            parts.append(text[start:end])
+            previous_start = end
         parts.extend(Line._partition(text[previous_start:]))
         return parts
 
@@ -1116,13 +1091,12 @@ class Line:
 
     @staticmethod
     def _partition_braces(text):
-        p = regex.compile(r'\{([^\{\}]|(?R))*?\}')
         parts = []
         previous_start = 0
-        for m in regex.finditer(p, text):
-            parts.extend(Line._partition_parentheses(text[previous_start:m.start()]))
-            parts.append(m.group())
-            previous_start = m.end()
+        for start, end in iter_groups(text, '{}'):
+            parts.extend(Line._partition_parentheses(text[previous_start:start]))
+            parts.append(text[start:end])
+            previous_start = end
         parts.extend(Line._partition_parentheses(text[previous_start:]))
         return parts
 
@@ -1161,18 +1135,17 @@ class Line:
 
         text = self.right_of(keyword)
 
-        p = regex.compile(r'\(([^\(\)]|(?R))*?\)')
-        b = regex.compile(r'\{([^\{\}]|(?R))*?\}')
         parts = []
 
-        mp = regex.search(p, text)
-        mb = regex.search(b, text)
+        # the first balanced groups
+        mp = next(iter_groups(text, '()'), None)
+        mb = next(iter_groups(text, '{}'), None)
         if mb is not None:
             if mp is not None:
-                if (mb.start() > mp.start()) and (mb.end() < mp.end()):
-                    parts.extend(Line._partition(text[:mp.start()]))
-                    parts.extend(Line._partition_braces(mp.group()[1:-1]))
-                elif (mb.start() < mp.start()) and (mb.end() > mp.end()):
+                if (mb[0] > mp[0]) and (mb[1] < mp[1]):
+                    parts.extend(Line._partition(text[:mp[0]]))
+                    parts.extend(Line._partition_braces(text[mp[0]+1:mp[1]-1]))
+                elif (mb[0] < mp[0]) and (mb[1] > mp[1]):
                     parts.extend(Line._partition_braces(text))
                 else:
                     raise ValueError("Incorrect format {}".format(text))
@@ -1180,8 +1153,8 @@ class Line:
                 parts.extend(Line._partition_braces(text))
         else:
             if mp is not None:
-                parts.extend(Line._partition(text[:mp.start()]))
-                parts.extend(Line._partition(mp.group()[1:-1]))
+                parts.extend(Line._partition(text[:mp[0]]))
+                parts.extend(Line._partition(text[mp[0]+1:mp[1]-1]))
             else:
                 parts.extend(Line._partition(text))
         return Line._check_parameters(parts)
@@ -80,6 +80,13 @@ class VariableAbc:
     def index(self):
         return self._index
 
+    @property
+    def prefixed_unit(self):
+        if self._unit is not None:
+            return self._unit.prefixed_unit
+        else:
+            return None
+
     # @property
     # def name(self):
     #     return self._name
@@ -158,6 +165,22 @@ class VariableAbc:
         else:
             return WaveForm.from_array(self.simplified_name, data, abscissa=abscissa)
 
+    ##############################################
+
+    def to_array(self, to_real=False, to_float=False):
+
+        """ Return the data as a Numpy array, it is a view on the raw data.
+
+        If *to_float* is set and the vector has a single value, then return this value.
+        """
+
+        data = self.data
+        if to_real:
+            data = data.real
+        if to_float and data.size == 1:
+            return data[0]
+        return data
+
 ####################################################################################################
 
 class RawFileAbc:
@@ -189,6 +212,38 @@ class RawFileAbc:
 
     ##############################################
 
+    @property
+    def _with_units(self):
+        # cf. CircuitSimulation.units
+        return getattr(self._simulation, 'units', True)
+
+    ##############################################
+
+    def _to_waveforms(self, variables, abscissa=None, to_float=False):
+        if self._with_units:
+            return [variable.to_waveform(abscissa, to_float=to_float) for variable in variables]
+        else:
+            return {variable.simplified_name:variable.to_array(to_float=to_float) for variable in variables}
+
+    ##############################################
+
+    def _to_abscissa(self, variable, to_real=False):
+        if self._with_units:
+            return variable.to_waveform(to_real=to_real)
+        else:
+            return variable.to_array(to_real)
+
+    ##############################################
+
+    def _unit_table(self):
+        """Return the units of the variables if the waveforms are unit-free, else None."""
+        if self._with_units:
+            return None
+        else:
+            return {variable.simplified_name:variable.prefixed_unit for variable in self.variables.values()}
+
+    ##############################################
+
     _name_to_unit = {
         'time': u_s,
         'voltage': u_V,
@@ -309,32 +364,28 @@ class RawFileAbc:
 
     def nodes(self, to_float=False, abscissa=None):
 
-        return [variable.to_waveform(abscissa, to_float=to_float)
-                for variable in self.variables.values()
-                if variable.is_voltage_node()]
+        return self._to_waveforms([variable for variable in self.variables.values() if variable.is_voltage_node()],
+                                  abscissa, to_float)
 
     ##############################################
 
     def branches(self, to_float=False, abscissa=None):
 
-        return [variable.to_waveform(abscissa, to_float=to_float)
-                for variable in self.variables.values()
-                if variable.is_branch_current()]
+        return self._to_waveforms([variable for variable in self.variables.values() if variable.is_branch_current()],
+                                  abscissa, to_float)
 
     ##############################################
 
     def internal_parameters(self, to_float=False, abscissa=None):
 
-        return [variable.to_waveform(abscissa, to_float=to_float)
-                for variable in self.variables.values()
-                if variable.is_interval_parameter]
+        return self._to_waveforms([variable for variable in self.variables.values() if variable.is_interval_parameter],
+                                  abscissa, to_float)
 
     ##############################################
 
     def elements(self, abscissa=None):
 
-        return [variable.to_waveform(abscissa, to_float=True)
-                for variable in self.variables.values()]
+        return self._to_waveforms(self.variables.values(), abscissa, to_float=True)
 
     ##############################################
 
@@ -364,6 +415,7 @@ class RawFileAbc:
             simulation=self.simulation,
             nodes=self.nodes(to_float=True),
             branches=self.branches(to_float=True),
+            units=self._unit_table(),
         )
 
     ##############################################
@@ -375,43 +427,47 @@ class RawFileAbc:
         return SensitivityAnalysis(
             simulation=self.simulation,
             elements=self.elements(),
+            units=self._unit_table(),
         )
 
     ##############################################
 
     def _to_dc_analysis(self, sweep_variable):
 
-        sweep = sweep_variable.to_waveform()
+        sweep = self._to_abscissa(sweep_variable)
         return DcAnalysis(
             simulation=self.simulation,
             sweep=sweep,
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
 
     def _to_ac_analysis(self):
 
-        frequency = self.variables['frequency'].to_waveform(to_real=True)
+        frequency = self._to_abscissa(self.variables['frequency'], to_real=True)
         return AcAnalysis(
             simulation=self.simulation,
             frequency=frequency,
             nodes=self.nodes(),
             branches=self.branches(),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
 
     ##############################################
 
     def _to_transient_analysis(self):
 
-        time = self.variables['time'].to_waveform(to_real=True)
+        time = self._to_abscissa(self.variables['time'], to_real=True)
         return TransientAnalysis(
             simulation=self.simulation,
             time=time,
             nodes=self.nodes(abscissa=time),
             branches=self.branches(abscissa=time),
             internal_parameters=self.internal_parameters(),
+            units=self._unit_table(),
         )
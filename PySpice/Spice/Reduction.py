@@ -0,0 +1,425 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This module implements a reduction pass for netlists made of large RC networks, e.g. extracted
+netlists.
+
+The following reductions are applied until a fixed point is reached:
+
+* disabled elements are removed,
+* resistors, capacitors and inductors having a dangling node, i.e. a node with a single connection,
+  or connected twice to the same node are removed,
+* resistors below a threshold are shorted, capacitors below a threshold are opened,
+* series resistors and series inductors are merged,
+* parallel resistors and parallel capacitors are merged.
+
+The ground, the external nodes of a sub-circuit, the global nodes and the preserved nodes, e.g. the
+probed nodes, are never removed.  The preserved elements, e.g. the elements whose current is probed,
+are never removed nor merged.  Only plain elements are reduced: elements with a model, an
+expression, raw SPICE or a parameter other than the multiplier are left untouched, as well as the
+inductors coupled by a K element.
+
+"""
+
+####################################################################################################
+
+import logging
+import os
+
+####################################################################################################
+
+from ..Unit import u_Ω, u_F, u_H
+from .BasicElement import Resistor, Capacitor, Inductor, CoupledInductor
+from .Number import spice_number_to_float
+
+####################################################################################################
+
+_module_logger = logging.getLogger(__name__)
+
+####################################################################################################
+
+# Passive elements which can be reduced and the name of their value attribute
+PASSIVE_CLASSES = (Resistor, Capacitor, Inductor)
+
+_VALUE_ATTRIBUTE = {
+    Resistor: 'resistance',
+    Capacitor: 'capacitance',
+    Inductor: 'inductance',
+}
+
+####################################################################################################
+
+def coupled_inductor_names(netlist):
+
+    """Return the set of the names of the inductors coupled by a K element."""
+
+    names = set()
+    for element in netlist.elements:
+        if isinstance(element, CoupledInductor):
+            for name in (element.inductor1, element.inductor2):
+                name = str(name)
+                names.add(name)
+                if not name.startswith(Inductor.PREFIX):
+                    names.add(Inductor.PREFIX + name)
+    return names
+
+####################################################################################################
+
+def passive_value(element, coupled_inductors=()):
+
+    """Return the effective value of a plain resistor, capacitor or inductor, else None.
+
+    Elements with a model, an expression, raw SPICE or a parameter other than the multiplier are
+    not plain, as well as the inductors listed in *coupled_inductors*.  The multiplier is folded
+    in the returned value.
+
+    """
+
+    if type(element) not in PASSIVE_CLASSES:
+        return None
+    if not element.enabled or element.raw_spice or element.name in coupled_inductors:
+        return None
+    if len(element.pins) != 2:
+        return None
+    value_attribute = _VALUE_ATTRIBUTE[type(element)]
+    for parameter in element.parameter_iterator():
+        if parameter.attribute_name not in (value_attribute, 'multiplier'):
+            return None
+    try:
+        value = spice_number_to_float(getattr(element, value_attribute))
+        multiplier = element.multiplier
+        if multiplier is not None:
+            multiplier = spice_number_to_float(multiplier)
+            if isinstance(element, Capacitor):
+                value *= multiplier
+            else:
+                value /= multiplier
+    except ValueError:
+        return None
+    return value
+
+####################################################################################################
+
+class ReductionReport:
+
+    """This class stores the list of reductions applied on a netlist.
+
+    Each list stores the names of the removed elements, the :attr:`removed_nodes` list stores the
+    names of the removed nodes.
+
+    """
+
+    CATEGORIES = (
+        ('disabled_elements', 'Disabled elements'),
+        ('dangling_elements', 'Dangling elements'),
+        ('shorted_resistors', 'Shorted resistors'),
+        ('opened_capacitors', 'Opened capacitors'),
+        ('series_resistors', 'Series resistors'),
+        ('series_inductors', 'Series inductors'),
+        ('parallel_resistors', 'Parallel resistors'),
+        ('parallel_capacitors', 'Parallel capacitors'),
+        ('removed_nodes', 'Removed nodes'),
+    )
+
+    ##############################################
+
+    def __init__(self):
+        for attribute, title in self.CATEGORIES:
+            setattr(self, attribute, [])
+
+    ##############################################
+
+    @property
+    def number_of_removed_elements(self):
+        return sum([len(getattr(self, attribute))
+                    for attribute, title in self.CATEGORIES
+                    if attribute != 'removed_nodes'])
+
+    ##############################################
+
+    def __bool__(self):
+        return bool(self.number_of_removed_elements or self.removed_nodes)
+
+    ##############################################
+
+    def __str__(self):
+        return os.linesep.join(['{}: {}'.format(title, len(getattr(self, attribute)))
+                                for attribute, title in self.CATEGORIES])
+
+####################################################################################################
+
+class NetlistReducer:
+
+    """This class implements the reduction of a netlist.
+
+    Parameters:
+
+      *preserved_nodes*
+        list of nodes which must not be removed, e.g. the probed nodes
+
+      *preserved_elements*
+        list of the names of the elements which must not be removed nor merged, e.g. the elements
+        whose current is probed, the names are case insensitive
+
+      *short_resistance*
+        resistors with a resistance lower or equal to this value are shorted when one of their nodes
+        can be removed, default is 0 (only null resistors)
+
+      *open_capacitance*
+        capacitors with a capacitance lower or equal to this value are removed, default is 0
+
+      *remove_dangling*
+        remove the elements having a dangling node
+
+      *merge_series*
+        merge series resistors and inductors
+
+      *merge_parallel*
+        merge parallel resistors and capacitors
+
+    """
+
+    _logger = _module_logger.getChild('NetlistReducer')
+
+    _value_unit = {
+        Resistor: u_Ω,
+        Capacitor: u_F,
+        Inductor: u_H,
+    }
+
+    ##############################################
+
+    def __init__(self,
+                 preserved_nodes=(),
+                 preserved_elements=(),
+                 short_resistance=0,
+                 open_capacitance=0,
+                 remove_dangling=True,
+                 merge_series=True,
+                 merge_parallel=True,
+                 ):
+
+        self._preserved_node_names = set([str(node) for node in preserved_nodes])
+        self._preserved_element_names = set([str(name).lower() for name in preserved_elements])
+        self._short_resistance = spice_number_to_float(short_resistance)
+        self._open_capacitance = spice_number_to_float(open_capacitance)
+        self._remove_dangling = remove_dangling
+        self._merge_series = merge_series
+        self._merge_parallel = merge_parallel
+
+    ##############################################
+
+    def _value(self, element):
+        if element.name.lower() in self._preserved_element_names:
+            return None
+        return passive_value(element, self._coupled_inductors)
+
+    ##############################################
+
+    def _set_value(self, element, value):
+        element.multiplier = None
+        setattr(element, _VALUE_ATTRIBUTE[type(element)], self._value_unit[type(element)](value))
+
+    ##############################################
+
+    def _is_removable(self, node):
+        return not (node.is_ground_node or
+                    node is self._netlist._ground_node or
+                    node.name in self._netlist_preserved_node_names)
+
+    ##############################################
+
+    def _other_node(self, element, node):
+        node1, node2 = element.nodes
+        return node2 if node1 is node else node1
+
+    ##############################################
+
+    @staticmethod
+    def _sorted_pins(node):
+        return sorted(node.pins, key=lambda pin: (pin.element.name, pin.position))
+
+    ##############################################
+
+    def _remove_element(self, element, category):
+        nodes = element.nodes
+        element.detach()
+        getattr(self._report, category).append(element.name)
+        self._schedule(*nodes)
+
+    ##############################################
+
+    def _remove_node(self, node):
+        if not node.pins and self._is_removable(node) and node.name in self._netlist._nodes:
+            self._netlist._remove_node(node)
+            self._report.removed_nodes.append(node.name)
+
+    ##############################################
+
+    def _schedule(self, *nodes):
+        for node in nodes:
+            if node not in self._scheduled:
+                self._scheduled.add(node)
+                self._worklist.append(node)
+
+    ##############################################
+
+    def reduce(self, netlist):
+
+        """Reduce the netlist in place and return a :class:`ReductionReport` instance."""
+
+        self._netlist = netlist
+        self._report = ReductionReport()
+        # the anchored nodes of this netlist, e.g. .global, don't leak to the next call
+        self._netlist_preserved_node_names = (
+            self._preserved_node_names | set([str(node) for node in netlist._anchored_nodes()])
+        )
+        self._coupled_inductors = coupled_inductor_names(netlist)
+
+        self._worklist = []
+        self._scheduled = set()
+
+        for element in list(netlist.elements):
+            if not element.enabled:
+                self._remove_element(element, 'disabled_elements')
+
+        for element in list(netlist.elements):
+            if element.netlist is None:
+                continue   # already removed
+            value = self._value(element)
+            if value is None:
+                continue
+            if isinstance(element, Resistor) and value <= self._short_resistance:
+                self._short_resistor(element)
+            elif isinstance(element, Capacitor) and value <= self._open_capacitance:
+                self._remove_element(element, 'opened_capacitors')
+
+        self._schedule(*netlist.nodes)
+        while self._worklist:
+            node = self._worklist.pop()
+            self._scheduled.discard(node)
+            if node.name not in netlist._nodes:
+                continue   # removed
+            self._reduce_node(node)
+            self._remove_node(node)
+
+        self._logger.info('Netlist reduction' + os.linesep + str(self._report))
+        return self._report
+
+    ##############################################
+
+    def _short_resistor(self, resistor):
+
+        node1, node2 = resistor.nodes
+        if self._is_removable(node2):
+            node_to_remove, node_to_keep = node2, node1
+        elif self._is_removable(node1):
+            node_to_remove, node_to_keep = node1, node2
+        else:
+            return
+        self._remove_element(resistor, 'shorted_resistors')
+        if node_to_remove is not node_to_keep:
+            for pin in list(node_to_remove.pins):
+                pin.connect(node_to_keep)
+            self._remove_node(node_to_remove)
+        self._schedule(node_to_keep)
+
+    ##############################################
+
+    def _reduce_node(self, node):
+
+        # sort the pins so as to get a reproducible reduction
+        pins = self._sorted_pins(node)
+
+        if self._remove_dangling:
+            # elements connected twice to the node don't carry any current
+            for pin in pins:
+                element = pin.element
+                if element.netlist is not None and self._value(element) is not None:
+                    node1, node2 = element.nodes
+                    if node1 is node2:
+                        self._remove_element(element, 'dangling_elements')
+            pins = self._sorted_pins(node)
+
+        if self._remove_dangling and len(pins) == 1 and self._is_removable(node):
+            element = pins[0].element
+            if self._value(element) is not None:
+                self._remove_element(element, 'dangling_elements')
+                return
+
+        if self._merge_series and len(pins) == 2 and self._is_removable(node):
+            element1, element2 = [pin.element for pin in pins]
+            if (element1 is not element2
+                and type(element1) is type(element2)
+                and type(element1) in (Resistor, Inductor)):
+                value1 = self._value(element1)
+                value2 = self._value(element2)
+                if value1 is not None and value2 is not None:
+                    # element1 now connects the outer nodes
+                    outer_node = self._other_node(element2, node)
+                    for pin in element1.pins:
+                        if pin.node is node:
+                            pin.connect(outer_node)
+                    self._set_value(element1, value1 + value2)
+                    category = 'series_resistors' if isinstance(element1, Resistor) else 'series_inductors'
+                    self._remove_element(element2, category)
+                    self._schedule(*element1.nodes)
+                    return
+
+        if self._merge_parallel:
+            self._merge_parallel_elements(node)
+
+    ##############################################
+
+    def _merge_parallel_elements(self, node):
+
+        # Group the reducible resistors and capacitors of this node by other node
+        groups = {}
+        for pin in self._sorted_pins(node):
+            element = pin.element
+            if type(element) not in (Resistor, Capacitor):
+                continue
+            value = self._value(element)
+            if value is None:
+                continue
+            key = (type(element), self._other_node(element, node))
+            groups.setdefault(key, []).append((element, value))
+
+        for (cls, other_node), elements in groups.items():
+            if len(elements) < 2:
+                continue
+            element, value = elements[0]
+            if cls is Resistor:
+                if any(value == 0 for element, value in elements):
+                    # a null resistor shorts the other ones
+                    merged_value = 0
+                else:
+                    conductance = sum([1 / value for element, value in elements])
+                    if conductance == 0:
+                        continue   # e.g. R and -R, an open circuit is not a resistor
+                    merged_value = 1 / conductance
+                category = 'parallel_resistors'
+            else:
+                merged_value = sum([value for element, value in elements])
+                category = 'parallel_capacitors'
+            self._set_value(element, merged_value)
+            for other_element, value in elements[1:]:
+                self._remove_element(other_element, category)
+            self._schedule(node, other_node)
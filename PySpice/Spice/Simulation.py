@@ -23,6 +23,7 @@
 
 ####################################################################################################
 
+import copy
 import logging
 import os
 
@@ -528,6 +529,7 @@ class CircuitSimulation:
     def __init__(self, circuit, **kwargs):
 
         self._circuit = circuit
+        self._simulated_circuit = circuit   # reduced copy, cf. CircuitSimulator._reduce_circuit
 
         self._options = {}   # .options
         self._measures = []   # .measure
@@ -536,6 +538,16 @@ class CircuitSimulation:
         self._saved_nodes = set()
         self._analyses = {}
 
+        # Netlist reduction pass, cf. Netlist.reduce
+        reduction = kwargs.get('reduction', None)
+        if reduction is True:
+            reduction = {}
+        self._reduction = reduction
+        self.reduction_report = None
+
+        # Return plain Numpy arrays, cf. Analysis.units
+        self._units = bool(kwargs.get('units', True))
+
         self.temperature = kwargs.get('temperature', u_Degree(27))
         self.nominal_temperature = kwargs.get('nominal_temperature', u_Degree(27))
 
@@ -545,6 +557,24 @@ class CircuitSimulation:
     def circuit(self):
         return self._circuit
 
+    @property
+    def simulated_circuit(self):
+        """The circuit used to generate the desk, i.e. a reduced copy of the circuit if the
+        *reduction* option is set.
+        """
+        return self._simulated_circuit
+
+    ##############################################
+
+    @property
+    def units(self):
+        """If False, the analyses return Numpy arrays instead of waveforms."""
+        return self._units
+
+    @units.setter
+    def units(self, value):
+        self._units = bool(value)
+
     ##############################################
 
     def options(self, *args, **kwargs):
@@ -1087,7 +1117,7 @@ class CircuitSimulation:
 
     def __str__(self):
 
-        netlist = self._circuit.str(simulator=self.SIMULATOR)
+        netlist = self._simulated_circuit.str(simulator=self.SIMULATOR)
         netlist += self.str_options()
         if self._initial_condition:
             netlist += '.ic ' + join_dict(self._initial_condition) + os.linesep
@@ -1119,6 +1149,18 @@ class CircuitSimulator(CircuitSimulation):
 
     For *ac* and *transient* analyses, the user must specify a list of nodes using the *probes* key
     argument.
+
+    If the keyword parameter *reduction* is set to True or to a dictionary of options for
+    :meth:`PySpice.Spice.Netlist.Netlist.reduce`, then a copy of the circuit is reduced before the
+    desk is generated, the probed nodes and the elements of the current probes, e.g. ``@R1[i]`` or
+    ``Vinput#branch``, are preserved.  The analysis only contains the nodes of the reduced circuit,
+    the removed nodes are logged.  The report is available as :attr:`reduction_report`.
+
+    If the keyword parameter *units* is set to False, then the analyses return the vectors as plain
+    float or complex Numpy arrays, which are views on the simulator output, instead of
+    :obj:`PySpice.Probe.WaveForm.WaveForm`.  The units are only kept in the
+    :attr:`PySpice.Probe.WaveForm.Analysis.units` table.  The values of an operating point are
+    then scalars.
     """
 
     _logger = _module_logger.getChild('CircuitSimulator')
@@ -1141,6 +1183,11 @@ class CircuitSimulator(CircuitSimulation):
         value of the *simulator* parameter: ``subprocess`` or ``shared``, respectively. If this
         parameter is not specified then a subprocess simulator is returned.
 
+        The ``mna`` simulator is a built-in solver for linear circuits, cf.
+        :obj:`PySpice.Spice.Mna.Simulation.MnaCircuitSimulator`.  It raises a
+        :obj:`PySpice.Spice.Mna.Solver.UnsupportedElementError` if the circuit contains an
+        unsupported element.
+
         """
 
         if 'simulator' in kwargs:
@@ -1162,6 +1209,9 @@ class CircuitSimulator(CircuitSimulation):
             sub_cls = XyceCircuitSimulator
             if simulator == 'xyce-parallel':
                 kwargs['parallel'] = True
+        elif simulator == 'mna':
+            from .Mna.Simulation import MnaCircuitSimulator
+            sub_cls = MnaCircuitSimulator
 
         if sub_cls is not None:
             return sub_cls(circuit, *args, **kwargs)
@@ -1170,11 +1220,67 @@ class CircuitSimulator(CircuitSimulation):
 
     ##############################################
 
+    def _probed_nodes(self):
+
+        """Return the names of the nodes and the names of the elements used by the *.save*, *.ic* and
+        *.nodeset* statements.
+
+        The elements are the ones of the current probes, i.e. ``i(name)``, ``name#branch`` and
+        ``@name[parameter]``.
+
+        """
+
+        nodes = set()
+        elements = set()
+        names = list(self._saved_nodes) + list(self._initial_condition) + list(self._node_set)
+        for name in names:
+            name = str(name)
+            lower_case_name = name.lower()
+            if lower_case_name.startswith('@'):
+                elements.add(name[1:].split('[', 1)[0])
+            elif lower_case_name.endswith('#branch'):
+                elements.add(name[:-len('#branch')])
+            elif lower_case_name.startswith('i(') and name.endswith(')'):
+                elements.add(name[2:-1])
+            elif lower_case_name.startswith('v(') and name.endswith(')'):
+                # v(node) or v(node1, node2)
+                nodes.update([node.strip() for node in name[2:-1].split(',')])
+            else:
+                nodes.add(name)
+        return nodes, elements
+
+    ##############################################
+
+    def _reduce_circuit(self):
+
+        """Reduce a copy of the circuit if the *reduction* option is set, the probed nodes and the
+        elements of the current probes are preserved.  The circuit itself is left unchanged.
+
+        """
+
+        if self._reduction is not None:
+            reduction = dict(self._reduction)
+            probed_nodes, probed_elements = self._probed_nodes()
+            preserved_nodes = set(reduction.pop('preserved_nodes', ())) | probed_nodes
+            preserved_elements = set(reduction.pop('preserved_elements', ())) | probed_elements
+            circuit = copy.deepcopy(self._circuit)
+            self.reduction_report = circuit.reduce(preserved_nodes=preserved_nodes,
+                                                   preserved_elements=preserved_elements,
+                                                   **reduction)
+            self._simulated_circuit = circuit
+            if self.reduction_report.removed_nodes:
+                self._logger.warning("Reduction removed the nodes {}".format(
+                    ', '.join(self.reduction_report.removed_nodes)))
+
+    ##############################################
+
     def _run(self, analysis_method, *args, **kwargs):
 
         self.reset_analysis()
         if 'probes' in kwargs:
-            self.save(* kwargs.pop('probes'))
+            self.save(kwargs.pop('probes'))
+
+        self._reduce_circuit()
 
         _kwargs = dict(kwargs)
         _kwargs.pop('log_desk', None)
@@ -1182,11 +1288,11 @@ class CircuitSimulator(CircuitSimulation):
         method = getattr(CircuitSimulation, analysis_method)
         method(self, *args, **_kwargs)
 
-        message = 'desk' + os.linesep + str(self)
+        # Don't format the desk if it is not logged
         if kwargs.get('log_desk', False):
-            self._logger.info(message)
-        else:
-            self._logger.debug(message)
+            self._logger.info('desk' + os.linesep + str(self))
+        elif self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug('desk' + os.linesep + str(self))
 
     ##############################################
 
@@ -0,0 +1,184 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This module implements the tokenizer shared by the SPICE parsers.
+
+A line is split in a single pass into words and ``key=value`` pairs, the spaces around the equal sign
+are allowed and a ``{ expression }`` is part of a word, the braces can be nested.  The common lines
+are split by :meth:`str.split`, the other lines by :func:`iter_tokens`.
+
+The balanced ``{ ... }`` and ``( ... )`` groups of a line are found by :func:`iter_groups`.
+
+"""
+
+####################################################################################################
+
+import re
+
+####################################################################################################
+
+_SPACES_RE = re.compile(r'\s*')
+_NON_SPACES_RE = re.compile(r'\S+')
+_PLAIN_RE = re.compile(r'[^\s={}]+')
+_BRACKET_RES = {
+    '{}': re.compile(r'[{}]'),
+    '()': re.compile(r'[()]'),
+}
+
+####################################################################################################
+
+def _group_end(text, start, brackets='{}'):
+
+    """Return the end of the balanced group which starts at *start*, or -1 if it is not closed."""
+
+    opening = brackets[0]
+    depth = 0
+    for match in _BRACKET_RES[brackets].finditer(text, start):
+        depth += 1 if match.group() == opening else -1
+        if not depth:
+            return match.end()
+    return -1
+
+####################################################################################################
+
+def iter_groups(text, brackets='{}'):
+
+    """Yield the ``(start, end)`` spans of the successive balanced groups of *text*, *brackets* is
+    ``'{}'`` or ``'()'``.  An opening bracket which is not closed is skipped.
+
+    """
+
+    opening = brackets[0]
+    start = text.find(opening)
+    while start >= 0:
+        end = _group_end(text, start, brackets)
+        if end < 0:
+            start = text.find(opening, start + 1)
+        else:
+            yield start, end
+            start = text.find(opening, end)
+
+####################################################################################################
+
+def _word_end(text, start):
+
+    """Return the end of the word at *start*, a ``{ expression }`` must have balanced braces."""
+
+    i = start
+    while i < len(text):
+        match = _PLAIN_RE.match(text, i)
+        if match is not None:
+            i = match.end()
+        elif text[i] == '{':
+            end = _group_end(text, i)
+            if end < 0:
+                break
+            i = end
+        else:
+            break
+    return i
+
+####################################################################################################
+
+def iter_tokens(text):
+
+    """Yield the tokens of *text* as ``(token, key, value, end)``, *end* is the position after the
+    token in *text*.  A stray "=", "{" or "}" is a token of one character.
+
+    """
+
+    i = 0
+    while True:
+        i = _SPACES_RE.match(text, i).end()
+        if i == len(text):
+            return
+        end = _word_end(text, i)
+        if end == i:
+            yield text[i], '', '', i + 1
+            i += 1
+            continue
+        word = text[i:end]
+        i = _SPACES_RE.match(text, end).end()
+        if text.startswith('=', i):
+            value_start = _SPACES_RE.match(text, i + 1).end()
+            value_end = _word_end(text, value_start)
+            if value_end > value_start:
+                value = text[value_start:value_end]
+                yield word + '=' + value, word, value, value_end
+                i = value_end
+                continue
+        yield word, '', '', end
+        i = end
+
+####################################################################################################
+
+def tokenize(text, ends=False):
+
+    """Return the tokens of *text* as a list of ``(token, key, value)``, *key* and *value* are empty
+    for a word.
+
+    If *ends* is set, return the tuple ``(tokens, ends)`` where *ends* is the list of the positions
+    after the tokens in *text*.
+
+    """
+
+    if '{' not in text and '}' not in text:
+        # fast path
+        if ends:
+            matches = list(_NON_SPACES_RE.finditer(text))
+            words = [match.group() for match in matches]
+        else:
+            words = text.split()
+        tokens = []
+        for word in words:
+            if '=' in word:
+                key, _, value = word.partition('=')
+                if not key or not value or '=' in value:
+                    break
+                tokens.append((word, key, value))
+            else:
+                tokens.append((word, '', ''))
+        else:
+            if ends:
+                return tokens, [match.end() for match in matches]
+            return tokens
+
+    if ends:
+        tokens = list(iter_tokens(text))
+        return [token[:3] for token in tokens], [token[3] for token in tokens]
+    return [(token, key, value) for token, key, value, end in iter_tokens(text)]
+
+####################################################################################################
+
+def split_parameters(text):
+
+    """Split *text* according to the pattern ``parameter1 parameter2 ... key1=value1 key2=value2 ...``
+    and return the list of parameters and the dictionary.
+
+    """
+
+    parameters = []
+    dict_parameters = {}
+    for token, key, value in tokenize(text):
+        if key:
+            dict_parameters[key] = value
+        else:
+            parameters.append(token)
+    return parameters, dict_parameters
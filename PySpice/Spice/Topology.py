@@ -0,0 +1,357 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""This module implements a connectivity index and topology checks for netlists.
+
+The checks are run before the netlist is sent to the simulator so as to reject decks which would
+fail at the simulator level, e.g. due to a singular matrix:
+
+* floating nodes: nodes which are not connected to the ground by any element,
+* nodes without a DC path to ground, e.g. a node only connected through capacitors or current sources,
+* loops of voltage sources and inductors,
+* nodes with a single connection.
+
+All the checks are done in linear time using union-find data structures.
+
+"""
+
+####################################################################################################
+
+import logging
+import os
+
+####################################################################################################
+
+_module_logger = logging.getLogger(__name__)
+
+####################################################################################################
+
+class TopologyError(ValueError):
+    pass
+
+####################################################################################################
+
+class UnionFind:
+
+    """This class implements a union-find (disjoint set) data structure with path compression and
+    union by size.
+
+    """
+
+    ##############################################
+
+    def __init__(self):
+        self._parent = {}
+        self._size = {}
+
+    ##############################################
+
+    def __contains__(self, item):
+        return item in self._parent
+
+    ##############################################
+
+    def add(self, item):
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
+
+    ##############################################
+
+    def find(self, item):
+
+        parent = self._parent
+        if item not in parent:
+            self.add(item)
+            return item
+
+        root = item
+        while parent[root] is not root:
+            root = parent[root]
+        # path compression
+        while parent[item] is not root:
+            parent[item], item = root, parent[item]
+        return root
+
+    ##############################################
+
+    def union(self, item1, item2):
+
+        """Merge the sets of *item1* and *item2*, return False if they were already merged."""
+
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 is root2:
+            return False
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size[root2]
+        return True
+
+    ##############################################
+
+    def connected(self, item1, item2):
+        return self.find(item1) is self.find(item2)
+
+####################################################################################################
+
+class ConnectivityIndex:
+
+    """This class implements an incrementally maintained connectivity index over the nodes of a
+    netlist.
+
+    Nodes are merged when a pin is connected, since all the nodes of an element belong to the same
+    net component.  A disconnection cannot be handled by a union-find, thus the index is marked as
+    dirty and is rebuilt from the node pins on the next query.
+
+    """
+
+    _logger = _module_logger.getChild('ConnectivityIndex')
+
+    ##############################################
+
+    def __init__(self, netlist):
+        self._netlist = netlist
+        self._union_find = UnionFind()
+        self._element_anchors = {}   # element -> first connected node
+        self._dirty = False
+
+    ##############################################
+
+    def connect(self, pin):
+        if self._dirty:
+            return
+        node = pin.node
+        self._union_find.add(node)
+        element = pin.element
+        anchor = self._element_anchors.setdefault(element, node)
+        if anchor is not node:
+            self._union_find.union(anchor, node)
+
+    ##############################################
+
+    def disconnect(self, pin):
+        self._dirty = True
+
+    ##############################################
+
+    def _rebuild(self):
+        self._logger.debug('Rebuild connectivity index')
+        self._union_find = UnionFind()
+        self._element_anchors = {}
+        self._dirty = False
+        for node in self._netlist.nodes:
+            for pin in node.pins:
+                self.connect(pin)
+
+    ##############################################
+
+    def find(self, node):
+        """Return the representative node of the component containing *node*."""
+        if self._dirty:
+            self._rebuild()
+        return self._union_find.find(self._netlist.get_node(node))
+
+    ##############################################
+
+    def connected(self, node1, node2):
+        """Return True if the two nodes are connected through elements."""
+        return self.find(node1) is self.find(node2)
+
+    ##############################################
+
+    def components(self):
+        """Return the list of the connected components as sets of nodes."""
+        components = {}
+        for node in self._netlist.nodes:
+            components.setdefault(self.find(node), set()).add(node)
+        return list(components.values())
+
+####################################################################################################
+
+# Element prefixes without DC path between their pins
+_DC_OPEN_PREFIXES = ('C', 'F', 'G', 'I', 'K')
+
+# Element prefixes which impose a voltage (or a DC short) between their two first pins
+_VOLTAGE_BRANCH_PREFIXES = ('E', 'H', 'L', 'V')
+
+# Element prefixes where only the two first pins are DC connected, the others are control pins
+_OUTPUT_PORT_PREFIXES = ('E', 'S')
+
+def _dc_pin_groups(element):
+
+    """Return the list of pin groups which are DC connected through the element and the pair of pins
+    of the voltage branch or None.
+
+    """
+
+    prefix = element.PREFIX
+    pins = element.pins
+    if prefix in _DC_OPEN_PREFIXES:
+        return (), None
+    elif prefix == 'B':
+        if element.voltage_expression is not None:
+            return (pins,), pins
+        else:
+            return (), None
+    elif prefix == 'M':
+        # the gate is insulated
+        return ([pin for position, pin in enumerate(pins) if position != 1],), None
+    elif prefix in _OUTPUT_PORT_PREFIXES:
+        port = pins[:2]
+        voltage_branch = port if prefix in _VOLTAGE_BRANCH_PREFIXES else None
+        return (port,), voltage_branch
+    elif prefix in _VOLTAGE_BRANCH_PREFIXES:
+        return (pins,), pins[:2]
+    else:
+        # subcircuits, semiconductors, transmission lines ... are assumed to be conducting
+        return (pins,), None
+
+####################################################################################################
+
+class TopologyReport:
+
+    """This class stores the result of a topology check.
+
+    Public Attributes:
+
+      :attr:`floating_nodes`
+        nodes which are not connected to the ground
+
+      :attr:`no_dc_path_nodes`
+        nodes connected to the ground but without a DC path
+
+      :attr:`voltage_loops`
+        voltage sources or inductors which close a loop of such elements
+
+      :attr:`single_connection_nodes`
+        nodes connected to only one pin
+
+    """
+
+    ##############################################
+
+    def __init__(self):
+        self.floating_nodes = []
+        self.no_dc_path_nodes = []
+        self.voltage_loops = []
+        self.single_connection_nodes = []
+
+    ##############################################
+
+    @property
+    def is_valid(self):
+        return not (self.floating_nodes or
+                    self.no_dc_path_nodes or
+                    self.voltage_loops or
+                    self.single_connection_nodes)
+
+    def __bool__(self):
+        return self.is_valid
+
+    ##############################################
+
+    def __str__(self):
+        lines = []
+        for title, items in (
+                ('Floating nodes', self.floating_nodes),
+                ('Nodes without DC path to ground', self.no_dc_path_nodes),
+                ('Voltage source / inductor loops', self.voltage_loops),
+                ('Nodes with a single connection', self.single_connection_nodes),
+        ):
+            if items:
+                lines.append('{}: {}'.format(title, ' '.join([str(x) for x in items])))
+        if not lines:
+            lines.append('Topology is valid')
+        return os.linesep.join(lines)
+
+####################################################################################################
+
+def check_topology(netlist, anchored_nodes=()):
+
+    """Check the topology of a netlist and return a :class:`TopologyReport` instance.
+
+    *anchored_nodes* are nodes which are considered as connected to the ground, e.g. the external
+    nodes of a sub-circuit or the global nodes.
+
+    """
+
+    anchors = [netlist._ground_node]
+    for node in netlist.nodes:
+        if node.is_ground_node:
+            anchors.append(node)
+    for node in anchored_nodes:
+        try:
+            anchors.append(netlist.get_node(node))
+        except KeyError:
+            pass
+
+    elements = netlist.elements
+    all_enabled = all(element.enabled for element in elements)
+    if all_enabled:
+        connectivity = netlist.connectivity
+    else:
+        connectivity = UnionFind()
+
+    dc_union_find = UnionFind()
+    voltage_union_find = UnionFind()
+    report = TopologyReport()
+
+    for element in elements:
+        if not element.enabled:
+            continue
+        pins = element.pins
+        if not all_enabled and pins:
+            anchor = pins[0].node
+            for pin in pins[1:]:
+                connectivity.union(anchor, pin.node)
+        groups, voltage_branch = _dc_pin_groups(element)
+        for group in groups:
+            if group:
+                anchor = group[0].node
+                for pin in group[1:]:
+                    dc_union_find.union(anchor, pin.node)
+        if voltage_branch is not None and len(voltage_branch) == 2:
+            node1, node2 = [pin.node for pin in voltage_branch]
+            if not voltage_union_find.union(node1, node2):
+                report.voltage_loops.append(element.name)
+
+    anchor_set = set(anchors)
+    grounded_roots = {connectivity.find(node) for node in anchor_set}
+    dc_grounded_roots = {dc_union_find.find(node) for node in anchor_set}
+
+    for node in netlist.nodes:
+        if node in anchor_set:
+            continue
+        if not all_enabled:
+            pins = [pin for pin in node.pins if pin.element.enabled]
+        else:
+            pins = node.pins
+        if not pins:
+            continue
+        if connectivity.find(node) not in grounded_roots:
+            report.floating_nodes.append(node)
+        elif dc_union_find.find(node) not in dc_grounded_roots:
+            report.no_dc_path_nodes.append(node)
+        if len(pins) == 1:
+            report.single_connection_nodes.append(node)
+
+    return report
@@ -18,13 +18,18 @@
 #
 ####################################################################################################
 
+"""The element shortcuts of the :class:`PySpice.Spice.Netlist.Netlist` class, e.g. ``circuit.R(...)``,
+are added when the element modules are loaded by the :mod:`PySpice.Spice.Netlist` module, cf.
+:func:`add_element_shortcuts`, thus importing a module like :mod:`PySpice.Spice.Number` doesn't
+import them, except with Python 3.6 which doesn't support a module ``__getattr__``.
+
+"""
+
 ####################################################################################################
 
+import importlib
 import logging
-
-from . import BasicElement
-from . import HighLevelElement
-from .Netlist import Netlist, ElementParameterMetaClass
+import sys
 
 ####################################################################################################
 
@@ -33,6 +38,7 @@ _module_logger = logging.getLogger(__name__)
 ####################################################################################################
 
 def _get_elements(module):
+    from .Netlist import ElementParameterMetaClass
     element_classes = []
     for item  in module.__dict__.values():
         if (type(item) is ElementParameterMetaClass
@@ -42,34 +48,62 @@ def _get_elements(module):
     return element_classes
 
 ####################################################################################################
-#
-# Add a method to create elements to the Netlist class
-#
 
-spice_elements = _get_elements(BasicElement)
-high_level_elements = _get_elements(HighLevelElement)
+def add_element_shortcuts():
+
+    """Add a method to create elements to the Netlist class.
+
+    This function is called at the end of the :mod:`PySpice.Spice.HighLevelElement` module, which is
+    imported with :mod:`PySpice.Spice.BasicElement` by :mod:`PySpice.Spice.Netlist`.
 
-for element_class in spice_elements + high_level_elements:
+    """
 
-    def _make_function(element_class):
-        def function(self, *args, **kwargs):
-            return element_class(self, *args, **kwargs)
-        # Preserve docstrings for element shortcuts
-        function.__doc__ = element_class.__doc__
-        return function
+    from . import BasicElement
+    from . import HighLevelElement
+    from .Netlist import Netlist
 
-    func = _make_function(element_class)
+    if Netlist._has_element_shortcuts:
+        return
 
-    def _set(name):
-        # _module_logger.debug("Add device shortcut {} for class {}".format(name, element_class))
-        setattr(Netlist, name, func)
+    global spice_elements, high_level_elements
+    spice_elements = _get_elements(BasicElement)
+    high_level_elements = _get_elements(HighLevelElement)
 
-    _set(element_class.__name__)
+    for element_class in spice_elements + high_level_elements:
 
-    if element_class in spice_elements:
-        if hasattr(element_class, 'ALIAS'):
-            _set(element_class.ALIAS)
-        if hasattr(element_class, 'LONG_ALIAS'):
-            _set(element_class.LONG_ALIAS)
+        def _make_function(element_class):
+            def function(self, *args, **kwargs):
+                return element_class(self, *args, **kwargs)
+            # Preserve docstrings for element shortcuts
+            function.__doc__ = element_class.__doc__
+            return function
 
+        func = _make_function(element_class)
+
+        def _set(name):
+            # _module_logger.debug("Add device shortcut {} for class {}".format(name, element_class))
+            setattr(Netlist, name, func)
+
+        _set(element_class.__name__)
+
+        if element_class in spice_elements:
+            if hasattr(element_class, 'ALIAS'):
+                _set(element_class.ALIAS)
+            if hasattr(element_class, 'LONG_ALIAS'):
+                _set(element_class.LONG_ALIAS)
+
+    Netlist._has_element_shortcuts = True
+
+####################################################################################################
 
+def __getattr__(name):
+    if name in ('BasicElement', 'HighLevelElement'):
+        return importlib.import_module('.' + name, __name__)
+    elif name in ('spice_elements', 'high_level_elements'):
+        add_element_shortcuts()
+        return globals()[name]
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
+
+if sys.version_info < (3, 7):
+    # a module __getattr__ requires Python 3.7, cf. PEP 562
+    add_element_shortcuts()
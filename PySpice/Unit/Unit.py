@@ -196,6 +196,10 @@ class SiDerivedUnit:
         'cd',
     )
 
+    # Results of the products, quotients and powers indexed by the operation and the operand
+    # hashes, the instances are thus shared and must not be modified.
+    _table = {}
+
     ##############################################
 
     def __init__(self, string=None, powers=None):
@@ -316,41 +320,56 @@ class SiDerivedUnit:
     ##############################################
 
     def __mul__(self, other):
-        powers = {unit: self._powers[unit] + other._powers[unit]
-                  for unit in self.BASE_UNITS}
-        return self.__class__(powers=powers)
+        key = ('*', self._hash, other._hash)
+        si_unit = self._table.get(key)
+        if si_unit is None:
+            powers = {unit: self._powers[unit] + other._powers[unit]
+                      for unit in self.BASE_UNITS}
+            si_unit = self._table[key] = self.__class__(powers=powers)
+        return si_unit
 
     ##############################################
 
     def __imul__(self, other):
-        for unit in self.BASE_UNITS:
-            self._powers[unit] += other.powers[unit]
-        self._hash = self.to_hash(self._powers)
-        self._string = self.to_string(self._powers)
-        return self
+        # don't modify self since it can be shared
+        return self * other
 
     ##############################################
 
     def __truediv__(self, other):
-        powers = {unit: self._powers[unit] - other._powers[unit]
-                  for unit in self.BASE_UNITS}
-        return self.__class__(powers=powers)
+        key = ('/', self._hash, other._hash)
+        si_unit = self._table.get(key)
+        if si_unit is None:
+            powers = {unit: self._powers[unit] - other._powers[unit]
+                      for unit in self.BASE_UNITS}
+            si_unit = self._table[key] = self.__class__(powers=powers)
+        return si_unit
 
     ##############################################
 
     def __itruediv__(self, other):
-        for unit in self.BASE_UNITS:
-            self._powers[unit] -= other.powers[unit]
-        self._hash = self.to_hash(self._powers)
-        self._string = self.to_string(self._powers)
-        return self
+        return self / other
+
+    ##############################################
+
+    @staticmethod
+    def _multiply_power(power, value):
+        power *= value
+        if isinstance(power, float) and power.is_integer():
+            # e.g. sqrt of a square
+            return int(power)
+        return power
 
     ##############################################
 
     def power(self, value):
-        powers = {unit: self._powers[unit] * value
-                  for unit in self.BASE_UNITS}
-        return self.__class__(powers=powers)
+        key = ('**', self._hash, value)
+        si_unit = self._table.get(key)
+        if si_unit is None:
+            powers = {unit: self._multiply_power(self._powers[unit], value)
+                      for unit in self.BASE_UNITS}
+            si_unit = self._table[key] = self.__class__(powers=powers)
+        return si_unit
 
     ##############################################
 
@@ -380,6 +399,12 @@ class UnitMetaclass(type):
 
     _units = {}
     _hash_map = {}
+    _si_unit_map = {} # from_si_unit results, cleared when a unit is registered
+
+    # Unit algebra table, cf. Unit._equivalent: (operation, operand hashes, prefixed_unit) -> Unit
+    # or PrefixedUnit.  It is filled on first use and cleared when a unit or a prefixed unit is
+    # registered.
+    _algebra_table = {}
 
     ##############################################
 
@@ -418,6 +443,9 @@ class UnitMetaclass(type):
             else:
                 meta._hash_map[hash_] = [obj]
 
+        meta._si_unit_map.clear()
+        meta._algebra_table.clear()
+
     ##############################################
 
     @classmethod
@@ -447,18 +475,26 @@ class UnitMetaclass(type):
         #      define unit, format as V^2
         #  - complex unit
 
-        units = meta._hash_map.get(si_unit.hash, None)
-        if unique and units is not None:
+        if not unique:
+            return meta._hash_map.get(si_unit.hash, None)
+
+        hash_ = si_unit.hash
+        try:
+            return meta._si_unit_map[hash_]
+        except KeyError:
+            pass
+        units = meta._hash_map.get(hash_, None)
+        if units is not None:
             if len(units) > 1:
                 units = [unit for unit in units if unit.is_default_unit()]
                 if len(units) == 1:
-                    return units[0]
+                    units = units[0]
                 else:
                     raise NameError("Unit clash", units)
             else:
-                return units[0]
-        else:
-            return units
+                units = units[0]
+        meta._si_unit_map[hash_] = units
+        return units
 
 ####################################################################################################
 
@@ -501,6 +537,16 @@ class Unit(metaclass=UnitMetaclass):
 
     ##############################################
 
+    # A unit is immutable, a copy of a circuit shares its units
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    ##############################################
+
     @property
     def unit_name(self):
         return self._unit_name
@@ -576,45 +622,58 @@ class Unit(metaclass=UnitMetaclass):
 
     ##############################################
 
+    def _equivalent(self, key, si_unit_function, prefixed_unit):
+
+        """Return the unit or the prefixed unit for the SI unit computed by *si_unit_function*, the
+        result is memoized in the unit algebra table using *key*.
+
+        """
+
+        key += (prefixed_unit,)
+        try:
+            return UnitMetaclass._algebra_table[key]
+        except KeyError:
+            equivalent_unit = self._equivalent_unit_or_power(si_unit_function(), prefixed_unit)
+            UnitMetaclass._algebra_table[key] = equivalent_unit
+            return equivalent_unit
+
+    ##############################################
+
     def multiply(self, other, prefixed_unit=False):
-        si_unit = self._si_unit * other.si_unit
-        return self._equivalent_unit_or_power(si_unit, prefixed_unit)
+        key = ('*', self._si_unit.hash, other.si_unit.hash)
+        return self._equivalent(key, lambda: self._si_unit * other.si_unit, prefixed_unit)
 
     ##############################################
 
     def divide(self, other, prefixed_unit=False):
-        si_unit = self._si_unit / other.si_unit
-        return self._equivalent_unit_or_power(si_unit, prefixed_unit)
+        key = ('/', self._si_unit.hash, other.si_unit.hash)
+        return self._equivalent(key, lambda: self._si_unit / other.si_unit, prefixed_unit)
 
     ##############################################
 
     def power(self, exponent, prefixed_unit=False):
-        si_unit = self._si_unit.power(exponent)
-        return self._equivalent_unit_or_power(si_unit, prefixed_unit)
+        key = ('**', self._si_unit.hash, exponent)
+        return self._equivalent(key, lambda: self._si_unit.power(exponent), prefixed_unit)
 
     ##############################################
 
     def reciprocal(self, prefixed_unit=False):
-        si_unit = self._si_unit.reciprocal()
-        return self._equivalent_unit_or_power(si_unit, prefixed_unit)
+        return self.power(-1, prefixed_unit)
 
     ##############################################
 
     def sqrt(self, prefixed_unit=False):
-        si_unit = self._si_unit.sqrt()
-        return self._equivalent_unit_or_power(si_unit, prefixed_unit)
+        return self.power(1/2, prefixed_unit)
 
     ##############################################
 
     def square(self, prefixed_unit=False):
-        si_unit = self._si_unit.square()
-        return self._equivalent_unit_or_power(si_unit, prefixed_unit)
+        return self.power(2, prefixed_unit)
 
     ##############################################
 
     def cbrt(self, prefixed_unit=False):
-        si_unit = self._si_unit.cbrt()
-        return self._equivalent_unit_or_power(si_unit, prefixed_unit)
+        return self.power(1/3, prefixed_unit)
 
     ##############################################
 
@@ -671,14 +730,44 @@ class PrefixedUnit:
 
     _unit_map = {} # Prefixed unit singletons
     _prefixed_unit_map = {}
+    _loader = None
+
+    _default_value_ctor = None
+    _default_values_ctor = None
 
-    _value_ctor = None
-    _values_ctor = None
+    __slots__ = ('_unit', '_power', '_value_ctor', '_values_ctor')
+
+    ##############################################
+
+    # A prefixed unit is immutable, cf. Unit.__copy__
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    ##############################################
+
+    @classmethod
+    def set_loader(cls, loader):
+        """Set a function which registers the prefixed units, it is called on the first lookup."""
+        cls._loader = loader
+
+    @classmethod
+    def load(cls):
+        """Call the loader if it was not called."""
+        loader = cls._loader
+        if loader is not None:
+            cls._loader = None
+            loader()
 
     ##############################################
 
     @classmethod
     def register(cls, prefixed_unit):
+        UnitMetaclass._algebra_table.clear()
+        UnitValues._unit_cache.clear()
         unit = prefixed_unit.unit
         unit_prefix = prefixed_unit.power
         if unit_prefix.is_unit and unit.is_default_unit():
@@ -699,6 +788,8 @@ class PrefixedUnit:
 
     @classmethod
     def from_si_unit(cls, si_unit):
+        if cls._loader is not None:
+            cls.load()
         return cls._unit_map.get(si_unit.hash, None)
 
     ##############################################
@@ -706,6 +797,8 @@ class PrefixedUnit:
     @classmethod
     def from_prefixed_unit(cls, unit, power=0):
 
+        if cls._loader is not None:
+            cls.load()
         if unit.unit_suffix:
             unit_key = str(unit)
         else:
@@ -732,9 +825,13 @@ class PrefixedUnit:
 
         if value_ctor is not None:
             self._value_ctor = value_ctor
+        else:
+            self._value_ctor = self._default_value_ctor
 
         if values_ctor is not None:
             self._values_ctor = values_ctor
+        else:
+            self._values_ctor = self._default_values_ctor
 
     ##############################################
 
@@ -769,7 +866,8 @@ class PrefixedUnit:
     ##############################################
 
     def is_same_unit(self, other):
-        return self._unit == other.unit
+        unit = other.unit
+        return self._unit is unit or self._unit == unit
 
     ##############################################
 
@@ -848,7 +946,9 @@ class PrefixedUnit:
     ##############################################
 
     def new_value(self, value):
-        if isinstance(value, np.ndarray):
+        if isinstance(value, float): # fast path
+            return self._value_ctor(self, value)
+        elif isinstance(value, np.ndarray):
             return self._values_ctor.from_ndarray(value, self)
         elif isinstance(value, collections.Iterable):
             return [self._value_ctor(self, x) for x in value]
@@ -866,6 +966,8 @@ class UnitValue: # numbers.Real
 
     _logger = _module_logger.getChild('UnitValue')
 
+    __slots__ = ('_prefixed_unit', '_value')
+
     ##############################################
 
     @classmethod
@@ -920,8 +1022,18 @@ class UnitValue: # numbers.Real
 
     ##############################################
 
+    def _new_value(self, value):
+        """Return a new value having the same prefixed unit, *value* must be an int or a float."""
+        cls = self.__class__
+        new_obj = cls.__new__(cls)
+        new_obj._prefixed_unit = self._prefixed_unit
+        new_obj._value = value
+        return new_obj
+
+    ##############################################
+
     def clone(self):
-        return self.__class__(self._prefixed_unit, self._value)
+        return self._new_value(self._value)
 
     ##############################################
 
@@ -974,6 +1086,8 @@ class UnitValue: # numbers.Real
 
     def _convert_value(self, other):
         """Convert the value of other to the power of self."""
+        if other._prefixed_unit is self._prefixed_unit: # fast path
+            return other._value
         self._check_unit(other)
         if self.is_same_power(other):
             return other.value
@@ -993,7 +1107,7 @@ class UnitValue: # numbers.Real
     ##############################################
 
     def __float__(self):
-        return float(self._value * self.scale)
+        return float(self._value * self._prefixed_unit.scale)
 
     ##############################################
 
@@ -1029,11 +1143,10 @@ class UnitValue: # numbers.Real
 
     def __add__(self, other):
         """self + other"""
+        if isinstance(other, UnitValues):
+            return NotImplemented # let UnitValues.__array_ufunc__ handle the unit
         if (isinstance(other, UnitValue)):
-            self._check_unit(other)
-            new_obj = self.clone()
-            new_obj._value += self._convert_value(other)
-            return new_obj
+            return self._new_value(self._value + self._convert_value(other))
         else:
             return float(self) + other
 
@@ -1041,7 +1154,6 @@ class UnitValue: # numbers.Real
 
     def __iadd__(self, other):
         """self += other"""
-        self._check_unit(other)
         self._value += self._convert_value(other)
         return self
 
@@ -1055,7 +1167,7 @@ class UnitValue: # numbers.Real
 
     def __neg__(self):
         """-self"""
-        return self.clone_prefixed_unit(-self._value)
+        return self._new_value(-self._value)
 
     ##############################################
 
@@ -1067,11 +1179,10 @@ class UnitValue: # numbers.Real
 
     def __sub__(self, other):
         """self - other"""
+        if isinstance(other, UnitValues):
+            return NotImplemented
         if (isinstance(other, UnitValue)):
-            self._check_unit(other)
-            new_obj = self.clone()
-            new_obj._value -= self._convert_value(other)
-            return new_obj
+            return self._new_value(self._value - self._convert_value(other))
         else:
             return float(self) - other
 
@@ -1079,7 +1190,6 @@ class UnitValue: # numbers.Real
 
     def __isub__(self, other):
         """self -= other"""
-        self._check_unit(other)
         self._value -= self._convert_value(other)
         return self
 
@@ -1093,6 +1203,8 @@ class UnitValue: # numbers.Real
 
     def __mul__(self, other):
         """self * other"""
+        if isinstance(other, UnitValues):
+            return NotImplemented
         if (isinstance(other, UnitValue)):
             equivalent_unit = self.unit.multiply(other.unit, True)
             value = float(self) * float(other)
@@ -1100,9 +1212,7 @@ class UnitValue: # numbers.Real
         else:
             try: # scale value
                 scalar = float(other)
-                new_obj = self.clone()
-                new_obj._value *= scalar
-                return new_obj
+                return self._new_value(self._value * scalar)
             except (ValueError, TypeError): # Numpy raises TypeError
                 return float(self) * other
 
@@ -1132,6 +1242,8 @@ class UnitValue: # numbers.Real
 
         """self // other """
 
+        if isinstance(other, UnitValues):
+            return NotImplemented
         if (isinstance(other, UnitValue)):
             equivalent_unit = self.unit.divide(other.unit, True)
             value = float(self) // float(other)
@@ -1139,9 +1251,7 @@ class UnitValue: # numbers.Real
         else:
             try: # scale value
                 scalar = float(other)
-                new_obj = self.clone()
-                new_obj._value //= scalar
-                return new_obj
+                return self._new_value(self._value // scalar)
             except (ValueError, TypeError): # Numpy raises TypeError
                 return float(self) // other
 
@@ -1170,6 +1280,8 @@ class UnitValue: # numbers.Real
 
         """self / other"""
 
+        if isinstance(other, UnitValues):
+            return NotImplemented
         if (isinstance(other, UnitValue)):
             equivalent_unit = self.unit.divide(other.unit, True)
             value = float(self) / float(other)
@@ -1177,9 +1289,7 @@ class UnitValue: # numbers.Real
         else:
             try: # scale value
                 scalar = float(other)
-                new_obj = self.clone()
-                new_obj._value /= scalar
-                return new_obj
+                return self._new_value(self._value / scalar)
             except (ValueError, TypeError): # Numpy raises TypeError
                 return float(self) / other
 
@@ -1206,9 +1316,7 @@ class UnitValue: # numbers.Real
 
     def __pow__(self, exponent):
         """self**exponent; should promote to float or complex when necessary."""
-        new_obj = self.clone()
-        new_obj._value **= float(exponent)
-        return new_obj
+        return self._new_value(self._value ** float(exponent))
 
     ##############################################
 
@@ -1226,7 +1334,7 @@ class UnitValue: # numbers.Real
 
     def __abs__(self):
         """Returns the Real distance from 0. Called for abs(self)."""
-        return self.clone_prefixed_unit(abs(self._value))
+        return self._new_value(abs(self._value))
 
     ##############################################
 
@@ -1606,97 +1714,23 @@ class UnitValues(np.ndarray):
         # method=reduce
         # inputs=(WaveForm  [10 12 14 16 18 20 22 24 26 28]@mV,)
 
-        prefixed_unit = self._prefixed_unit
-
-        conversion = self.UFUNC_MAP[ufunc]
-        self._logger.debug("Conversion for {} is {}".format(ufunc, conversion))
-
-        # e.g. np.mean do an internal call to reduce
-        if method != '__call__':
-            conversion = self.CONVERSION.NO_CONVERSION
-
-        # Cast inputs to ndarray
-        args = []
-        if conversion == self.CONVERSION.NO_CONVERSION:
-            # should be 1 arg
-            args = [( input_.as_ndarray(False) if isinstance(input_, UnitValues) else input_ )
-                    for input_ in inputs]
-        #
-        elif conversion == self.CONVERSION.FLOAT:
-            if not prefixed_unit.is_unit_less:
-                # raise ValueError("Must be unit less")
-                self._logger.warning("Should be unit less")
-            args = [( input_.as_ndarray(True) if isinstance(input_, UnitValues) else input_ )
-                    for input_ in inputs]
-        #
-        elif conversion in (self.CONVERSION.UNIT_MATCH, self.CONVERSION.UNIT_MATCH_NO_OUT_CAST):
-            # len(inputs) == 2
-            other = inputs[1]
-            if isinstance(other, (UnitValues, UnitValue)):
-                self._check_unit(other)
-                args.append(self.as_ndarray())
-                nd_other = self._convert_value(other)
-                if isinstance(other, UnitValues):
-                    nd_other = nd_other.as_ndarray()
-                elif isinstance(other, UnitValue):
-                    nd_other = float(nd_other)
-                args.append(nd_other)
-            else:
-                raise ValueError
-        #
-        elif conversion == self.CONVERSION.NEW_UNIT:
-            if len(inputs) == 1:
-                #! Fixme: power
-                if ufunc == np.sqrt:
-                    prefixed_unit = self.unit.sqrt(True)
-                elif ufunc == np.square:
-                    prefixed_unit = self.unit.square(True)
-                elif ufunc == np.cbrt:
-                    prefixed_unit = self.unit.cbrt(True)
-                elif ufunc == np.reciprocal:
-                    prefixed_unit = self.unit.reciprocal(True)
-                else:
-                    raise NotImplementedError
-                args.append(self.as_ndarray(True))
-            elif len(inputs) == 2:
-                other = inputs[1]
-                if isinstance(other, (UnitValues, UnitValue)):
-                    if ufunc == np.multiply:
-                        prefixed_unit = self.unit.multiply(other.unit, True)
-                    elif ufunc in (np.divide, np.true_divide, np.floor_divide):
-                        prefixed_unit = self.unit.divide(other.unit, True)
-                    else:
-                        raise NotImplementedError
-                    args.append(self.as_ndarray(True))
-                    if isinstance(other, UnitValue):
-                        args.append(float(other))
-                    else:
-                        args.append(other.as_ndarray(True))
-                elif ufunc in (np.multiply, np.divide, np.true_divide, np.floor_divide, np.power):
-                    if ufunc == np.power:
-                        prefixed_unit = self.unit.power(other, True)
-                    args.append(self.as_ndarray())
-                    args.append(other)
-                else:
-                    raise NotImplementedError
-            else:
-                raise NotImplementedError
-        #
-        else: # self.CONVERSION.NOT_IMPLEMENTED
-            raise NotImplementedError
-
-        # self._logger.debug("Output unit is {}".format(prefixed_unit))
+        if method == '__call__':
+            try:
+                handler = self._UFUNC_HANDLERS[ufunc]
+            except KeyError:
+                raise NotImplementedError(ufunc)
+        else:
+            # e.g. np.mean do an internal call to reduce
+            handler = UnitValues._no_conversion
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Handler for %s.%s is %s", ufunc, method, handler.__name__)
+        args, prefixed_unit = handler(self, ufunc, inputs)
 
         # Cast outputs to ndarray
         outputs = kwargs.pop('out', None)
         if outputs:
-            out_args = []
-            for output in outputs:
-                if isinstance(output, UnitValues):
-                    out_args.append(output.as_ndarray())
-                else:
-                    out_args.append(output)
-            kwargs['out'] = tuple(out_args)
+            kwargs['out'] = tuple(( output.as_ndarray() if isinstance(output, UnitValues) else output )
+                                  for output in outputs)
         else:
             outputs = (None,) * ufunc.nout
 
@@ -1705,21 +1739,192 @@ class UnitValues(np.ndarray):
         if results is NotImplemented:
             return NotImplemented
 
-        # ensure results is a tuple
         if ufunc.nout == 1:
-            results = (results,)
+            if outputs[0] is not None:
+                return outputs[0]
+            elif prefixed_unit is None:
+                return results
+            else:
+                return self._wrap_result(np.asarray(results), prefixed_unit)
 
         # Cast results
-        if conversion in (self.CONVERSION.FLOAT, self.CONVERSION.UNIT_MATCH_NO_OUT_CAST):
-            # Fixme: ok ???
+        if prefixed_unit is None:
             results = tuple(( result if output is None else output )
                             for result, output in zip(results, outputs))
         else:
-            results = tuple(( UnitValues.from_ndarray(np.asarray(result), prefixed_unit) if output is None else output )
+            results = tuple(( self._wrap_result(np.asarray(result), prefixed_unit) if output is None else output )
                             for result, output in zip(results, outputs))
+        return results
+
+    ##############################################
+
+    def _wrap_result(self, array, prefixed_unit):
+        """Cast the ndarray result of an ufunc."""
+        obj = array.view(UnitValues)
+        obj._prefixed_unit = prefixed_unit
+        return obj
+
+    ##############################################
+
+    # The ufunc handlers return the arguments to pass to the ufunc and the prefixed unit of the
+    # results, None if the results are not cast to UnitValues.
+
+    @staticmethod
+    def _scaled_input(input_):
+        if isinstance(input_, UnitValues):
+            scale = input_.scale
+            array = input_.as_ndarray()
+            return array if scale == 1 else array * scale
+        elif isinstance(input_, UnitValue):
+            return float(input_)
+        else:
+            return input_
+
+    ##############################################
+
+    @staticmethod
+    def _converted_input(input_, prefixed_unit):
+        """Return the value of *input_* at the power of *prefixed_unit*."""
+        if isinstance(input_, UnitValues):
+            value = input_.as_ndarray()
+        else:
+            value = input_.value
+        if input_.prefixed_unit is not prefixed_unit and not input_.prefixed_unit.is_same_power(prefixed_unit):
+            value = value * (input_.scale / prefixed_unit.scale) # for numerical precision
+        return value
+
+    ##############################################
+
+    @classmethod
+    def _cached_unit(cls, key, function):
+        try:
+            return cls._unit_cache[key]
+        except KeyError:
+            prefixed_unit = function()
+            cls._unit_cache[key] = prefixed_unit
+            return prefixed_unit
+
+    ##############################################
+
+    def _no_conversion(self, ufunc, inputs):
+        # should be 1 arg
+        args = [( input_.as_ndarray() if isinstance(input_, UnitValues) else input_ )
+                for input_ in inputs]
+        return args, self._prefixed_unit
+
+    ##############################################
+
+    def _float_conversion(self, ufunc, inputs):
+        if not self._prefixed_unit.is_unit_less:
+            # raise ValueError("Must be unit less")
+            self._logger.warning("Should be unit less")
+        args = [( input_.as_ndarray(True) if isinstance(input_, UnitValues) else input_ )
+                for input_ in inputs]
+        return args, None
+
+    ##############################################
+
+    def _unit_match(self, ufunc, inputs):
+        if len(inputs) != 2:
+            raise NotImplementedError
+        first, second = inputs
+        if not (isinstance(first, _UNIT_VALUE_TYPES) and isinstance(second, _UNIT_VALUE_TYPES)):
+            raise ValueError
+        prefixed_unit = first.prefixed_unit
+        if not (second.prefixed_unit is prefixed_unit or prefixed_unit.is_same_unit(second.prefixed_unit)):
+            raise UnitError
+        args = [self._converted_input(first, prefixed_unit), self._converted_input(second, prefixed_unit)]
+        return args, prefixed_unit
+
+    ##############################################
+
+    def _unit_match_no_out_cast(self, ufunc, inputs):
+        args, prefixed_unit = self._unit_match(ufunc, inputs)
+        return args, None
+
+    ##############################################
+
+    def _new_unit(self, ufunc, inputs):
+
+        if len(inputs) == 1:
+            unit_method = self._UNARY_UNIT_METHODS.get(ufunc)
+            if unit_method is None:
+                raise NotImplementedError
+            unit = self.unit
+            key = (ufunc, unit.si_unit.hash)
+            prefixed_unit = self._cached_unit(key, lambda: unit_method(unit, True))
+            return [self._scaled_input(self)], prefixed_unit
+
+        elif len(inputs) == 2:
+            first, second = inputs
+            first_has_unit = isinstance(first, _UNIT_VALUE_TYPES)
+            second_has_unit = isinstance(second, _UNIT_VALUE_TYPES)
+            if ufunc is np.power:
+                if second_has_unit or not np.isscalar(second):
+                    raise NotImplementedError
+                unit = first.unit
+                key = (ufunc, unit.si_unit.hash, second)
+                prefixed_unit = self._cached_unit(key, lambda: unit.power(second, True))
+                return [first.as_ndarray(), second], prefixed_unit
+            elif ufunc not in self._BINARY_UNIT_METHODS:
+                raise NotImplementedError
+            elif first_has_unit and second_has_unit:
+                first_unit, second_unit = first.unit, second.unit
+                key = (ufunc, first_unit.si_unit.hash, second_unit.si_unit.hash)
+                unit_method = self._BINARY_UNIT_METHODS[ufunc]
+                prefixed_unit = self._cached_unit(key, lambda: unit_method(first_unit, second_unit, True))
+                return [self._scaled_input(first), self._scaled_input(second)], prefixed_unit
+            elif first_has_unit:
+                # scale value
+                return [first.as_ndarray(), second], first.prefixed_unit
+            elif ufunc is np.multiply:
+                return [first, second.as_ndarray()], second.prefixed_unit
+            else:
+                # e.g. 1 / values
+                unit = second.unit
+                key = (ufunc, None, unit.si_unit.hash)
+                prefixed_unit = self._cached_unit(key, lambda: unit.reciprocal(True))
+                return [first, self._scaled_input(second)], prefixed_unit
 
-        # list or scalar
-        return results[0] if len(results) == 1 else results
+        else:
+            raise NotImplementedError
+
+    ##############################################
+
+    def _not_implemented(self, ufunc, inputs):
+        raise NotImplementedError
+
+    ##############################################
+
+    _CONVERSION_HANDLERS = {
+        CONVERSION.NOT_IMPLEMENTED: _not_implemented,
+        CONVERSION.NO_CONVERSION: _no_conversion,
+        CONVERSION.FLOAT: _float_conversion,
+        CONVERSION.UNIT_MATCH: _unit_match,
+        CONVERSION.UNIT_MATCH_NO_OUT_CAST: _unit_match_no_out_cast,
+        CONVERSION.NEW_UNIT: _new_unit,
+    }
+
+    # Handler for each ufunc, precomputed from UFUNC_MAP
+    _UFUNC_HANDLERS = dict(zip(UFUNC_MAP.keys(), map(_CONVERSION_HANDLERS.__getitem__, UFUNC_MAP.values())))
+
+    _UNARY_UNIT_METHODS = {
+        np.sqrt: Unit.sqrt,
+        np.square: Unit.square,
+        np.cbrt: Unit.cbrt,
+        np.reciprocal: Unit.reciprocal,
+    }
+
+    _BINARY_UNIT_METHODS = {
+        np.multiply: Unit.multiply,
+        np.divide: Unit.divide,
+        np.true_divide: Unit.divide,
+        np.floor_divide: Unit.divide,
+    }
+
+    # Prefixed unit of the results for (ufunc, unit hashes of the inputs), it is cleared when a
+    # prefixed unit is registered.
+    _unit_cache = {}
 
     ##############################################
 
@@ -1896,9 +2101,11 @@ class UnitValues(np.ndarray):
 
 ####################################################################################################
 
+_UNIT_VALUE_TYPES = (UnitValues, UnitValue)
+
 # Reset
-PrefixedUnit._value_ctor = UnitValue
-PrefixedUnit._values_ctor = UnitValues
+PrefixedUnit._default_value_ctor = UnitValue
+PrefixedUnit._default_values_ctor = UnitValues
 
 _simple_prefixed_unit = PrefixedUnit()
 
@@ -1908,6 +2115,8 @@ class FrequencyMixin:
 
     """ This class implements a frequency mixin. """
 
+    __slots__ = ()
+
     ##############################################
 
     @property
@@ -1929,6 +2138,8 @@ class PeriodMixin:
 
     """ This class implements a period mixin. """
 
+    __slots__ = ()
+
     ##############################################
 
     @property
@@ -40,6 +40,9 @@ shortcuts return the value if the unit match else it raises the exception *UnitE
 A shortcut is defined to access each unit, e.g. :func:`U_V`, :func:`U_A`, :func:`U_s`, :func:`U_Hz`,
 :func:`U_Ω`, :func:`U_F`, :func:`U_H.`, as well as for prefixes e.g. :func:`U_mV`.
 
+The shortcuts are defined on the first access, a star import defines all of them.  With Python 3.6,
+which doesn't support a module ``__getattr__``, they are defined when the module is imported.
+
 Some shortcuts have Unicode and ASCII variants:
 
  * For micro, we have the prefix *μ* and *u*.
@@ -87,6 +90,7 @@ Some examples of usage:
 
 ####################################################################################################
 
+import functools
 import logging
 import sys
 
@@ -116,6 +120,12 @@ class UnitValueShorcut:
 
     ##############################################
 
+    @property
+    def prefixed_unit(self):
+        return self._prefixed_unit
+
+    ##############################################
+
     def _new_value(self, other):
 
         return self._prefixed_unit.new_value(other)
@@ -160,85 +170,185 @@ def define_shortcut(name, shortcut) :
 
 ####################################################################################################
 
-# Define shortcuts for unit prefixes : ..., micro, milli, kilo, mega, ...
-
-def _build_prefix_shortcut(unit_prefix):
-    unit_cls_name = unit_prefix.__class__.__name__
-    name = unit_cls_name.lower()
-    prefixed_unit = _Unit.PrefixedUnit(power=unit_prefix)
-    _Unit.PrefixedUnit.register(prefixed_unit)
-    shortcut = lambda value: _Unit.UnitValue(prefixed_unit, value)
-    define_shortcut(name, shortcut)
-
-for unit_prefix in _Unit.UnitPrefixMetaclass.prefix_iter():
-    if unit_prefix.__class__ != _Unit.ZeroPower:
-        _build_prefix_shortcut(unit_prefix) # capture unit_prefix
-
-####################################################################################################
-
 # Fixme: better ???
 
 class FrequencyValue(_Unit.UnitValue, _Unit.FrequencyMixin):
-    pass
+    __slots__ = ()
 
 # Fixme:
 class FrequencyValues(_Unit.UnitValues): # , _Unit.FrequencyMixin
     pass
 
 class PeriodValue(_Unit.UnitValue, _Unit.PeriodMixin):
-    pass
+    __slots__ = ()
 
 class PeriodValues(_Unit.UnitValues): # , _Unit.PeriodMixin
     pass
 
+####################################################################################################
+#
+# The shortcuts are defined lazily on the first access, cf. __getattr__, since they are numerous.
+#
+#  * the prefixed units are registered on the first lookup in the PrefixedUnit registry, or on the
+#    first access to a shortcut,
+#  * _iter_shortcuts enumerates the shortcuts and the functions which build them, a shortcut and
+#    its ASCII variant are the same object.
+#
+####################################################################################################
+
+_prefixed_units = {}   # (unit suffix, prefix power) -> PrefixedUnit
+_shortcut_builders = None
+
+def _iter_units():
+    for unit in _Unit.UnitMetaclass.unit_iter():
+        if unit.unit_suffix and unit.__class__ not in (_SiUnits.Kilogram,):
+            # Fixme: kilogram
+            yield unit
+
+def _spice_prefixes():
+    return [unit_prefix for unit_prefix in _Unit.UnitPrefixMetaclass.prefix_iter()
+            if unit_prefix.is_defined_in_spice]
+
+####################################################################################################
+
+# Define the prefixed units : ..., micro, milli, kilo, mega, ... and mV, V, kV, ...
+
+def _register_prefixed_units():
+
+    for unit_prefix in _Unit.UnitPrefixMetaclass.prefix_iter():
+        if unit_prefix.__class__ != _Unit.ZeroPower:
+            prefixed_unit = _Unit.PrefixedUnit(power=unit_prefix)
+            _Unit.PrefixedUnit.register(prefixed_unit)
+            _prefixed_units[('', unit_prefix.power)] = prefixed_unit
+
+    unit_prefixes = _spice_prefixes()
+    for unit in _iter_units():
+        if unit.__class__ == _SiUnits.Hertz:
+            value_ctor = FrequencyValue
+            values_ctor = FrequencyValues
+        elif unit.__class__ == _SiUnits.Second:
+            value_ctor = PeriodValue
+            values_ctor = PeriodValues
+        else:
+            value_ctor = _Unit.UnitValue
+            values_ctor = _Unit.UnitValues
+        for unit_prefix in unit_prefixes:
+            prefixed_unit = _Unit.PrefixedUnit(unit, unit_prefix, value_ctor, values_ctor)
+            _Unit.PrefixedUnit.register(prefixed_unit)
+            _prefixed_units[(unit.unit_suffix, unit_prefix.power)] = prefixed_unit
+
+_Unit.PrefixedUnit.set_loader(_register_prefixed_units)
+
+def _prefixed_unit(unit_suffix, power):
+    _Unit.PrefixedUnit.load()
+    return _prefixed_units[(unit_suffix, power)]
+
+####################################################################################################
+
+# Define shortcuts for unit prefixes : ..., micro, milli, kilo, mega, ...
+
+def _build_prefix_shortcut(unit_prefix):
+    prefixed_unit = _prefixed_unit('', unit_prefix.power)
+    return lambda value: _Unit.UnitValue(prefixed_unit, value)
+
 ####################################################################################################
 
 # Define unit shortcuts
 
 def _build_unit_type_shortcut(unit):
-    name = 'U_' + unit.unit_suffix
-    define_shortcut(name, unit)
+    return unit
 
 def _build_as_unit_shortcut(unit):
-    name = 'as_' + unit.unit_suffix
-    shortcut = unit.validate
-    define_shortcut(name, shortcut)
-
-def _exec_body(ns, unit_prefix):
-    ns['POWER'] = unit_prefix
+    return unit.validate
 
 def _build_unit_prefix_shortcut(unit, unit_prefix):
-    name = 'u_' + str(unit_prefix) + unit.unit_suffix
-    if unit.__class__ == _SiUnits.Hertz:
-        value_ctor = FrequencyValue
-        values_ctor = FrequencyValues
-    elif unit.__class__ == _SiUnits.Second:
-        value_ctor = PeriodValue
-        values_ctor = PeriodValues
-    else:
-        value_ctor = _Unit.UnitValue
-        values_ctor = _Unit.UnitValues
-    prefixed_unit = _Unit.PrefixedUnit(unit, unit_prefix, value_ctor, values_ctor)
-    _Unit.PrefixedUnit.register(prefixed_unit)
-    define_shortcut('U' + name[1:], prefixed_unit)
-    shortcut = UnitValueShorcut(prefixed_unit)
-    define_shortcut(name, shortcut)
-
-def _build_unit_shortcut(unit):
-    _build_as_unit_shortcut(unit)
-    _build_unit_type_shortcut(unit)
+    return UnitValueShorcut(_prefixed_unit(unit.unit_suffix, unit_prefix.power))
+
+def _shortcut_names(name, ascii_name):
+    # ° is illegal in an identifier, cf. define_shortcut
+    names = [] if '°' in name else [name]
+    if ascii_name != name:
+        names.append(ascii_name)
+    return names
+
+def _iter_shortcuts():
+
+    """Yield the shortcuts as tuples of the names of the shortcut, i.e. with its ASCII variant, a
+    function which builds it and its arguments.
+
+    """
+
     for unit_prefix in _Unit.UnitPrefixMetaclass.prefix_iter():
-        if unit_prefix.is_defined_in_spice:
-            _build_unit_prefix_shortcut(unit, unit_prefix)
+        if unit_prefix.__class__ != _Unit.ZeroPower:
+            yield [unit_prefix.__class__.__name__.lower()], _build_prefix_shortcut, (unit_prefix,)
+
+    unit_prefixes = [(unit_prefix, str(unit_prefix), _to_ascii(str(unit_prefix)))
+                     for unit_prefix in _spice_prefixes()]
+    for unit in _iter_units():
+        suffix = unit.unit_suffix
+        ascii_suffix = _to_ascii(suffix)
+        yield _shortcut_names('as_' + suffix, 'as_' + ascii_suffix), _build_as_unit_shortcut, (unit,)
+        yield _shortcut_names('U_' + suffix, 'U_' + ascii_suffix), _build_unit_type_shortcut, (unit,)
+        for unit_prefix, prefix, ascii_prefix in unit_prefixes:
+            name, ascii_name = prefix + suffix, ascii_prefix + ascii_suffix
+            yield _shortcut_names('U_' + name, 'U_' + ascii_name), _prefixed_unit, (suffix, unit_prefix.power)
+            yield _shortcut_names('u_' + name, 'u_' + ascii_name), _build_unit_prefix_shortcut, (unit, unit_prefix)
+
+def _get_shortcut_builders():
+
+    """Return a dictionary mapping the name of the shortcuts to the tuple yielded by
+    :func:`_iter_shortcuts`.
+
+    """
+
+    global _shortcut_builders
+    if _shortcut_builders is None:
+        builders = {name: shortcut for shortcut in _iter_shortcuts() for name in shortcut[0]}
+        builders['Frequency'] = builders['u_Hz']
+        builders['Period'] = builders['u_s']
+        _shortcut_builders = builders
+    return _shortcut_builders
 
-for unit in _Unit.UnitMetaclass.unit_iter():
-    if unit.unit_suffix and unit.__class__ not in (_SiUnits.Kilogram,):
-        # Fixme: kilogram
-        _build_unit_shortcut(unit)
+####################################################################################################
+
+def _define_shortcut(names, builder, args):
+    # the names of a shortcut are defined at once, thus the ASCII variant is the same object
+    _globals = globals()
+    try:
+        return _globals[names[0]]
+    except KeyError:
+        shortcut = builder(*args)
+        for name in names:
+            _globals[name] = shortcut
+        return shortcut
+
+def __getattr__(name):
+
+    _globals = globals()
+
+    if name == '__all__':
+        # star import, define all the shortcuts at once
+        for shortcut in _iter_shortcuts():
+            _define_shortcut(*shortcut)
+        _globals['Frequency'] = _globals['u_Hz']
+        _globals['Period'] = _globals['u_s']
+        _globals['__all__'] = [name for name in _globals if not name.startswith('_')]
+        return _globals['__all__']
+
+    try:
+        shortcut = _get_shortcut_builders()[name]
+    except KeyError:
+        raise AttributeError("module {} has no attribute {}".format(__name__, name))
+    _globals[name] = _define_shortcut(*shortcut)
+    return _globals[name]
+
+def __dir__():
+    return sorted(set(globals()) | set(_get_shortcut_builders()))
+
+if _version_info < (3, 7):
+    # a module __getattr__ requires Python 3.7, cf. PEP 562
+    __getattr__('__all__')
 
 ####################################################################################################
 
 unit_value = _Unit.UnitValue.simple_value
-
-Frequency = u_Hz
-Period = u_s
@@ -0,0 +1,98 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""Benchmark the import time of :mod:`PySpice.Spice`.
+
+Each statement is run in a fresh interpreter using ``python -X importtime``, the time spent in the
+PySpice modules and the total import time are reported.  The optional dependencies which are
+loaded on first use, e.g. CFFI for the shared simulator, are reported if they were imported.
+
+Usage::
+
+    python benchmarks/spice_import.py [number_of_runs]
+
+"""
+
+####################################################################################################
+
+import statistics
+import subprocess
+import sys
+
+####################################################################################################
+
+STATEMENTS = (
+    'import PySpice.Spice.Number',
+    'from PySpice.Spice.Netlist import Circuit',
+    'from PySpice.Spice.Parser import SpiceParser',
+    'from PySpice.Spice.Library import SpiceLibrary',
+    'import PySpice.Spice.NgSpice.Simulation',
+)
+
+# Modules which must be loaded on first use
+LAZY_MODULES = (
+    'PySpice.Spice.BasicElement',
+    'PySpice.Spice.NgSpice.Shared',
+    'cffi',
+    'concurrent.futures',
+    'ply',
+    'scipy',
+)
+
+####################################################################################################
+
+def import_times(statement):
+
+    """Return the self and cumulative times in us of the modules imported by *statement*."""
+
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                             stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith('import time:') and '|' in line:
+            self_time, cumulative_time, module = line[len('import time:'):].split('|')
+            if self_time.strip().isdigit():
+                times[module.strip()] = (int(self_time), int(cumulative_time))
+    return times
+
+####################################################################################################
+
+def run(number_of_runs=20):
+
+    print('median of {} runs'.format(number_of_runs))
+    for statement in STATEMENTS:
+        pyspice_times = []
+        total_times = []
+        for i in range(number_of_runs):
+            times = import_times(statement)
+            pyspice_times.append(sum(self_time for module, (self_time, cumulative_time) in times.items()
+                                     if module.startswith('PySpice')))
+            total_times.append(sum(self_time for self_time, cumulative_time in times.values()))
+        lazy_modules = [module for module in LAZY_MODULES if module in times]
+        print(statement)
+        print('  PySpice modules {:8.0f} us'.format(statistics.median(pyspice_times)))
+        print('  total           {:8.0f} us'.format(statistics.median(total_times)))
+        print('  loaded          {}'.format(', '.join(lazy_modules) or '-'))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    run(*[int(x) for x in sys.argv[1:2]])
@@ -0,0 +1,98 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""Benchmark the element line tokenizer against the word by word tokenization of :class:`Line`.
+
+Usage::
+
+    python benchmarks/tokenizer.py [number_of_lines]
+
+"""
+
+####################################################################################################
+
+import sys
+import timeit
+
+####################################################################################################
+
+from PySpice.Spice.Parser import Element, Line
+from PySpice.Spice.Tokenizer import tokenize
+
+####################################################################################################
+
+END_OF_LINE_COMMENT = ('$', '//', ';')
+
+def make_lines(number_of_lines):
+    templates = (
+        ('R{0} n{0} n{1} 1k', 2, 1),
+        ('C{0} n{0} 0 1p ic=0', 2, 1),
+        ('M{0} n{0} n{1} 0 0 nch w=1u l=180n m=2', 4, 1),
+    )
+    lines = []
+    for i in range(number_of_lines):
+        template, number_of_pins, number_of_positionals = templates[i % len(templates)]
+        text = template.format(i, i + 1)
+        lines.append((Line(text, slice(i, i + 1), END_OF_LINE_COMMENT), number_of_pins, number_of_positionals))
+    return lines
+
+####################################################################################################
+
+def legacy_tokenize(line, number_of_pins, number_of_positionals):
+    # The word by word algorithm used by Element before the tokenizer
+    stop_location = str(line).find(' ')
+    nodes, stop_location = line.read_words(stop_location, number_of_pins)
+    parameters, stop_location = line.read_words(stop_location, number_of_positionals)
+    kwargs = {}
+    if stop_location is not None:
+        words, stop_location = line.split_words(stop_location)
+        for word in words:
+            key, value = word.split('=')
+            kwargs[key] = value
+    return nodes, parameters, kwargs
+
+def run(number_of_lines=100000, repeat=3):
+
+    lines = make_lines(number_of_lines)
+    texts = [str(line) for line, number_of_pins, number_of_positionals in lines]
+
+    def legacy():
+        for line, number_of_pins, number_of_positionals in lines:
+            legacy_tokenize(line, number_of_pins, number_of_positionals)
+
+    def compiled():
+        for text in texts:
+            tokenize(text)
+
+    def element():
+        for line, number_of_pins, number_of_positionals in lines:
+            Element(line)
+
+    print('{} lines, best of {}'.format(number_of_lines, repeat))
+    results = {}
+    for name, function in (('legacy tokenizer', legacy), ('compiled tokenizer', compiled), ('Element', element)):
+        results[name] = min(timeit.repeat(function, number=1, repeat=repeat))
+        print('  {:20} {:8.3f} s  {:6.2f} us/line'.format(name, results[name], results[name] / number_of_lines * 1e6))
+    print('  speedup {:.1f}x'.format(results['legacy tokenizer'] / results['compiled tokenizer']))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    run(*[int(x) for x in sys.argv[1:2]])
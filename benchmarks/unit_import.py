@@ -0,0 +1,90 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""Benchmark the import time of :mod:`PySpice.Unit`.
+
+Each import is run in a fresh interpreter using ``python -X importtime``, the time spent in the
+modules of :mod:`PySpice.Unit` is reported apart from its dependencies, e.g. Numpy.  The time to
+build the shortcuts on the first access is reported as well.
+
+Usage::
+
+    python benchmarks/unit_import.py [number_of_runs]
+
+"""
+
+####################################################################################################
+
+import statistics
+import subprocess
+import sys
+
+####################################################################################################
+
+FIRST_ACCESS = """
+import time
+import PySpice.Unit
+start = time.perf_counter()
+from PySpice.Unit import *
+print((time.perf_counter() - start) * 1e6)
+"""
+
+####################################################################################################
+
+def import_times():
+
+    """Return the self times in us of the modules imported by ``import PySpice.Unit``."""
+
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import PySpice.Unit'],
+                             stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith('import time:') and '|' in line:
+            self_time, cumulative_time, module = line[len('import time:'):].split('|')
+            if self_time.strip().isdigit():
+                times[module.strip()] = (int(self_time), int(cumulative_time))
+    return times
+
+####################################################################################################
+
+def run(number_of_runs=20):
+
+    unit_times = []
+    total_times = []
+    first_access_times = []
+    for i in range(number_of_runs):
+        times = import_times()
+        unit_times.append(sum(self_time for module, (self_time, cumulative_time) in times.items()
+                              if module.startswith('PySpice.Unit')))
+        total_times.append(times['PySpice.Unit'][1])
+        process = subprocess.run([sys.executable, '-c', FIRST_ACCESS],
+                                 stdout=subprocess.PIPE, universal_newlines=True, check=True)
+        first_access_times.append(float(process.stdout))
+
+    print('import PySpice.Unit, median of {} runs'.format(number_of_runs))
+    print('  PySpice.Unit modules  {:8.0f} us'.format(statistics.median(unit_times)))
+    print('  total                 {:8.0f} us'.format(statistics.median(total_times)))
+    print('  star import shortcuts {:8.0f} us'.format(statistics.median(first_access_times)))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    run(*[int(x) for x in sys.argv[1:2]])
@@ -0,0 +1,79 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""Micro benchmarks of the :class:`PySpice.Unit.Unit.UnitValue` arithmetic.
+
+Usage::
+
+    python benchmarks/unit_value.py [number]
+
+"""
+
+####################################################################################################
+
+import sys
+import timeit
+
+####################################################################################################
+
+SETUP = """
+from PySpice.Unit import u_Hz, u_kΩ, u_mA, u_uF, u_Ω
+r1 = 1@u_kΩ
+r2 = 2@u_kΩ
+r3 = 470@u_Ω
+i1 = 10@u_mA
+f1 = 50@u_Hz
+c1 = 1@u_uF
+"""
+
+STATEMENTS = (
+    ('construction', 'u_kΩ(1.)'),
+    ('matmul construction', '1.@u_kΩ'),
+    ('float', 'float(r1)'),
+    ('add same unit', 'r1 + r2'),
+    ('add other power', 'r1 + r3'),
+    ('iadd same unit', 'r = r1.clone(); r += r2'),
+    ('sub same unit', 'r1 - r2'),
+    ('neg', '-r1'),
+    ('mul scalar', 'r1 * 2.'),
+    ('div scalar', 'r1 / 2.'),
+    ('mul unit', 'r1 * i1'),
+    ('div unit', 'r1 / i1'),
+    ('power', 'r1 ** 2'),
+    ('reciprocal', 'f1.period'),
+    ('compare', 'r1 < r2'),
+    ('equal', 'r1 == r2'),
+    ('parallel resistors', '(r1 * r2) / (r1 + r2)'),
+    ('rc time constant', 'r1 * c1'),
+)
+
+####################################################################################################
+
+def run(number=100000):
+
+    print('UnitValue arithmetic, best of 5 x {}'.format(number))
+    for name, statement in STATEMENTS:
+        timings = timeit.repeat(statement, setup=SETUP, number=number, repeat=5)
+        print('  {:24} {:8.0f} ns'.format(name, min(timings) / number * 1e9))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    run(*[int(x) for x in sys.argv[1:2]])
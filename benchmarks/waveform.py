@@ -0,0 +1,101 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+"""Benchmark common waveform expressions, i.e. the Numpy ufunc dispatch of
+:class:`PySpice.Unit.Unit.UnitValues` and :class:`PySpice.Probe.WaveForm.WaveForm`.
+
+Usage::
+
+    python benchmarks/waveform.py [number_of_points]
+
+"""
+
+####################################################################################################
+
+import sys
+import timeit
+
+import numpy as np
+
+####################################################################################################
+
+from PySpice.Probe.WaveForm import WaveForm
+from PySpice.Unit import u_A, u_mA, u_mV, u_V, u_kΩ
+
+####################################################################################################
+
+EXPRESSIONS = (
+    ('gain', 'output / input_'),
+    ('difference', 'output - input_'),
+    ('scale', 'output * 2'),
+    ('reversed scale', '2 * output'),
+    ('offset', 'output + offset'),
+    ('current', '(input_ - output) / resistance'),
+    ('power', 'output * current'),
+    ('absolute', 'np.abs(output)'),
+    ('rms', 'np.sqrt(np.mean(np.square(output)))'),
+    ('threshold', 'output > offset'),
+    ('maximum', 'np.max(output)'),
+    ('decibel', '20 * np.log10(np.abs(output / input_))'),
+)
+
+def make_namespace(number_of_points):
+
+    time = np.linspace(0, 1e-3, number_of_points)
+    def waveform(name, unit, array):
+        return WaveForm.from_unit_values(name, unit(array), abscissa=time)
+
+    return {
+        'np': np,
+        'input_': waveform('in', u_V, 1 + .5*np.sin(2*np.pi*1e3*time)),
+        'output': waveform('out', u_mV, 500*np.sin(2*np.pi*1e3*time + 1)),
+        'current': waveform('Vinput', u_mA, np.cos(2*np.pi*1e3*time)),
+        'offset': u_mV(100),
+        'resistance': u_kΩ(1),
+    }
+
+def make_ndarray_namespace(namespace):
+    ndarray_namespace = {}
+    for key, value in namespace.items():
+        if hasattr(value, 'as_ndarray'):
+            value = value.as_ndarray(True)
+        elif key != 'np':
+            value = float(value)
+        ndarray_namespace[key] = value
+    return ndarray_namespace
+
+def run(number_of_points=100, number=2000, repeat=5):
+
+    namespace = make_namespace(number_of_points)
+    ndarray_namespace = make_ndarray_namespace(namespace)
+
+    print('{} points, best of {} x {}'.format(number_of_points, repeat, number))
+    print('  {:16} {:>12} {:>12} {:>8}'.format('', 'WaveForm', 'ndarray', 'ratio'))
+    for name, expression in EXPRESSIONS:
+        timings = []
+        for globals_ in (namespace, ndarray_namespace):
+            timing = min(timeit.repeat(expression, globals=globals_, number=number, repeat=repeat))
+            timings.append(timing / number * 1e6)
+        print('  {:16} {:9.1f} us {:9.1f} us {:7.1f}x'.format(name, timings[0], timings[1], timings[0]/timings[1]))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    run(*[int(x) for x in sys.argv[1:2]])
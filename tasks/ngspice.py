@@ -192,6 +192,14 @@ def install(ctx):
 
 ####################################################################################################
 
+@task
+def build_binding(ctx, library_path=''):
+    """Build the compiled CFFI binding, *library_path* is the directory of libngspice if not standard"""
+    with ctx.cd(str(PYSPICE_SOURCE_PATH)):
+        ctx.run('{} -m PySpice.Spice.NgSpice.Build {}'.format(sys.executable, library_path))
+
+####################################################################################################
+
 @task(get_last_version)
 def get_manual(ctx):
     url = MANUAL_URL.format(ctx.ngspice_last_version)
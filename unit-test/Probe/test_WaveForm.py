@@ -36,6 +36,7 @@ logger = Logging.setup_logging()
 
 from PySpice.Probe.WaveForm import *
 from PySpice.Unit import *
+from PySpice.Unit.Unit import UnitError
 
 ####################################################################################################
 
@@ -137,6 +138,45 @@ class TestUnits(unittest.TestCase):
         self.assertEqual(waveform_mean.unit, _.unit)
         self.assertEqual(waveform_mean.power, _.power)
 
+    ##############################################
+
+    def test_ufunc(self):
+
+        np_array = np.arange(1, 11)
+        np_raw_array = np_array / 1000
+        abscissa = np.linspace(0, 1, 10)
+        waveform = WaveForm.from_unit_values('out', u_mV(np_array), abscissa=abscissa)
+
+        for result in (waveform * 2, 2 * waveform):
+            self.assertIsInstance(result, WaveForm)
+            self.assertIs(result.abscissa, abscissa)
+            self.assertEqual(result.prefixed_unit, waveform.prefixed_unit)
+            self._test_unit_values(result, np_raw_array * 2)
+
+        self._test_unit_values(waveform + u_mV(1), np_raw_array + 1e-3)
+        self._test_unit_values(waveform - u_V(1), np_raw_array - 1)
+        np_test.assert_array_equal(waveform > u_mV(5), np_array > 5)
+        with self.assertRaises(UnitError):
+            waveform + u_A(1)
+
+        current = waveform / u_kΩ(1)
+        self.assertEqual(current.unit, u_A(1).unit)
+        self._test_unit_values(current, np_raw_array / 1000)
+        self.assertIs(current.prefixed_unit, (waveform / u_kΩ(2)).prefixed_unit)
+        conductance = 1 / u_kΩ(np_array)
+        self.assertEqual(conductance.unit, u_S(1).unit)
+        self._test_unit_values(conductance, 1 / (np_array * 1000))
+
+        # a unit value on the left side
+        for values in (np.array([1., 2., 3.]), np.array([1.])):
+            power = u_mA(2) * u_V(values)
+            self.assertEqual(power.unit, u_W(1).unit)
+            self._test_unit_values(power, values * 2e-3)
+        resistance = u_V(2) / u_mA(np_array)
+        self.assertEqual(resistance.unit, u_Ω(1).unit)
+        self._test_unit_values(resistance, 2 / (np_array / 1000))
+        self._test_unit_values(u_V(1) - waveform, 1 - np_raw_array)
+
 ####################################################################################################
 
 if __name__ == '__main__':
@@ -0,0 +1,112 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+####################################################################################################
+
+from pathlib import Path
+import os
+import tempfile
+import unittest
+
+####################################################################################################
+
+from PySpice.Scripts.cir2py import convert_files, find_netlists
+
+####################################################################################################
+
+divider_cir = """* Divider
+R1 in out 1k
+R2 out 0 2k
+.model 2N2222 NPN (IS=1E-14, BF=200)
+"""
+
+####################################################################################################
+
+class TestCir2py(unittest.TestCase):
+
+    ##############################################
+
+    def setUp(self):
+        self._tmp_directory = tempfile.TemporaryDirectory()
+        self._root = Path(self._tmp_directory.name)
+
+    def tearDown(self):
+        self._tmp_directory.cleanup()
+
+    ##############################################
+
+    def _write(self, filename, text):
+        path = self._root.joinpath(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return path
+
+    ##############################################
+
+    def test_batch(self):
+
+        netlist_directory = self._root.joinpath('netlists')
+        output_directory = self._root.joinpath('python')
+        for i in range(4):
+            self._write('netlists/sub{}/divider{}.cir'.format(i % 2, i), divider_cir.replace('1k', '{}k'.format(i + 1)))
+        self._write('netlists/broken.cir', '* Broken\n.subckt\n')
+        self._write('netlists/readme.txt', 'not a netlist')
+
+        netlists = find_netlists([str(netlist_directory), str(netlist_directory.joinpath('sub*', '*.cir'))])
+        self.assertEqual(len(netlists), 5)
+
+        summary = convert_files(netlists, output_directory, workers=2)
+        self.assertEqual(len(summary['converted']), 4)
+        self.assertEqual(list(summary['failed']), [str(netlist_directory.joinpath('broken.cir'))])
+        code = output_directory.joinpath('sub1', 'divider3.py').read_text()
+        self.assertIn("circuit.R(1, 'in', 'out', '4k')", code)
+        self.assertIn("circuit.R(2, 'out', 0, '2k')", code)
+        self.assertIn("circuit.model('2N2222', 'NPN', IS=1e-14, BF=200)", code)
+
+        # the up to date files are skipped
+        summary = convert_files(netlists, output_directory, workers=1)
+        self.assertEqual(len(summary['skipped']), 4)
+        self.assertEqual(summary['converted'], [])
+
+        path = netlist_directory.joinpath('sub0', 'divider0.cir')
+        stat = path.stat()
+        os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        summary = convert_files(netlists, output_directory, workers=1)
+        self.assertEqual(summary['converted'], [str(path)])
+
+    ##############################################
+
+    def test_collision(self):
+
+        netlist_directory = self._root.joinpath('netlists')
+        cir_path = self._write('netlists/divider.cir', divider_cir)
+        lib_path = self._write('netlists/divider.lib', divider_cir)
+        self._write('netlists/other.lib', divider_cir)
+        netlists = find_netlists([str(netlist_directory)])
+        summary = convert_files(netlists, workers=1)
+        self.assertEqual(sorted(summary['failed']), [str(cir_path), str(lib_path)])
+        self.assertIn('collides with {}'.format(lib_path), summary['failed'][str(cir_path)])
+        self.assertEqual(summary['converted'], [str(netlist_directory.joinpath('other.lib'))])
+        self.assertFalse(netlist_directory.joinpath('divider.py').exists())
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
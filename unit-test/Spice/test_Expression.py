@@ -20,11 +20,17 @@
 
 ####################################################################################################
 
+from pathlib import Path
 import unittest
 
+import numpy as np
+import ply.lex as lex
+
 ####################################################################################################
 
-from PySpice.Spice.Expression.Parser import Parser
+from PySpice.Spice.Expression.Compiler import compile_expression
+from PySpice.Spice.Expression.Parser import Parser, get_parser
+from PySpice.Spice.Expression import _lextab, _parsetab
 
 ####################################################################################################
 
@@ -60,7 +66,7 @@ class TestParser(unittest.TestCase):
         parser.parse('1 * 2')
         parser.parse('1 / 2')
         parser.parse('1 % 2')
-        # parser.parse('1 \\ 2')
+        parser.parse('1 \\ 2')
         parser.parse('1 + 2')
 
         parser.parse('1 == 2')
@@ -79,6 +85,56 @@ class TestParser(unittest.TestCase):
 
         parser.parse('x * -y + z')
 
+        parser.parse('1e3')
+        parser.parse('10k * (x + 1)')
+        parser.parse('max(x, 2 * y)')
+
+    ##############################################
+
+    def test_tables(self):
+
+        # the shipped tables must be regenerated using Parser.write_tables when the grammar is modified
+        self.assertEqual(Parser.signature(), _parsetab._lr_signature)
+        lexer = lex.lex(module=Parser._reflect()[0])
+        self.assertEqual([pattern for pattern, names in _lextab._lexstatere['INITIAL']],
+                         [regex.pattern for regex, names in lexer.lexstatere['INITIAL']])
+
+        directory = Path(_parsetab.__file__).parent
+        files = sorted(directory.iterdir())
+        Parser()
+        self.assertEqual(sorted(directory.iterdir()), files)
+
+        self.assertIs(get_parser(), get_parser())
+
+####################################################################################################
+
+class TestCompiler(unittest.TestCase):
+
+    ##############################################
+
+    def test_compiler(self):
+
+        x = np.array([-1., 0., 1., 2.])
+
+        self.assertEqual(compile_expression('1k + 2 * 3')(), 1006)
+        self.assertEqual(compile_expression('a - b - c')(a=1, b=2, c=3), -4)
+        self.assertEqual(compile_expression('-x ** 2 + 7 \\ 2 + 7 % 4')(x=3), -3)
+        np.testing.assert_allclose(compile_expression('r0 * (1 + tc1 * (temp - 27))')(r0=1e3, tc1=x, temp=28),
+                                   1e3 * (1 + x))
+        np.testing.assert_array_equal(compile_expression('x >= 1 && x != 2')(x=x), [0, 0, 1, 0])
+        np.testing.assert_array_equal(compile_expression('x > 0 ? x : -x')(x=x), np.abs(x))
+        np.testing.assert_array_equal(compile_expression('IF(x > 0, 1, 0) + Max(x, 0.5)')({'x': x}),
+                                      [0.5, 0.5, 2, 3])
+        self.assertAlmostEqual(compile_expression('sqrt(pi * pi)')(), np.pi)
+
+        expression = compile_expression('k * (x + y)')
+        self.assertIs(compile_expression('k * (x + y)'), expression)
+        self.assertEqual(expression.variables, ['k', 'x', 'y'])
+        with self.assertRaises(NameError):
+            expression(k=1, x=1)
+        with self.assertRaises(NameError):
+            compile_expression('foo(x)')
+
 ####################################################################################################
 
 if __name__ == '__main__':
@@ -0,0 +1,360 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+####################################################################################################
+
+from unittest import mock
+import unittest
+
+import numpy as np
+
+####################################################################################################
+
+import PySpice.Logging.Logging as Logging
+logger = Logging.setup_logging()
+
+from PySpice.Spice.BasicElement import SubCircuitElement
+from PySpice.Spice.Netlist import Circuit, Element
+from PySpice.Spice.Mna.Prima import find_linear_networks
+from PySpice.Spice.Mna.Solver import MnaSystem, UnsupportedElementError, SingularMatrixError
+from PySpice.Unit import *
+
+####################################################################################################
+
+class TestMnaSimulator(unittest.TestCase):
+
+    ##############################################
+
+    def _rc_circuit(self):
+        circuit = Circuit('RC')
+        circuit.V('input', 'in', circuit.gnd, 'DC 10 AC 1')
+        circuit.R(1, 'in', 'out', 1@u_kΩ)
+        circuit.C(1, 'out', circuit.gnd, 1@u_uF)
+        circuit.R(2, 'out', circuit.gnd, 1@u_kΩ)
+        return circuit
+
+    ##############################################
+
+    def test_operating_point(self):
+        simulator = self._rc_circuit().simulator(simulator='mna')
+        analysis = simulator.operating_point()
+        self.assertAlmostEqual(float(analysis['in'][0]), 10)
+        self.assertAlmostEqual(float(analysis.out[0]), 5)
+        self.assertAlmostEqual(float(analysis.Vinput[0]), -5e-3)
+
+    ##############################################
+
+    def test_controlled_sources(self):
+        circuit = Circuit('Controlled Sources')
+        circuit.V('input', 'in', circuit.gnd, 1@u_V)
+        circuit.R(1, 'in', circuit.gnd, 1@u_kΩ)
+        circuit.VCVS(1, 'e', circuit.gnd, 'in', circuit.gnd, 2)
+        circuit.R(2, 'e', circuit.gnd, 1@u_kΩ)
+        circuit.VCCS(1, circuit.gnd, 'g', 'in', circuit.gnd, 1e-3)
+        circuit.R(3, 'g', circuit.gnd, 1@u_kΩ)
+        circuit.CCCS(1, circuit.gnd, 'f', 'Vinput', 2)
+        circuit.R(4, 'f', circuit.gnd, 1@u_kΩ)
+        circuit.CCVS(1, 'h', circuit.gnd, 'Vinput', 1@u_kΩ)
+        circuit.R(5, 'h', circuit.gnd, 1@u_kΩ)
+        circuit.L(1, 'h', 'l', 1@u_mH)
+        circuit.R(6, 'l', circuit.gnd, 1@u_kΩ)
+        analysis = circuit.simulator(simulator='mna').operating_point()
+        self.assertAlmostEqual(float(analysis.e[0]), 2)
+        self.assertAlmostEqual(float(analysis.g[0]), 1)
+        self.assertAlmostEqual(float(analysis.f[0]), -2)
+        self.assertAlmostEqual(float(analysis.h[0]), -1)
+        self.assertAlmostEqual(float(analysis.l[0]), -1)
+
+    ##############################################
+
+    def test_ac(self):
+        simulator = self._rc_circuit().simulator(simulator='mna')
+        analysis = simulator.ac(start_frequency=1@u_Hz, stop_frequency=1@u_MHz, number_of_points=10,
+                                variation='dec')
+        frequency = analysis.frequency.as_ndarray()
+        self.assertEqual(len(frequency), 61)
+        self.assertAlmostEqual(frequency[-1], 1e6)
+        expected = .5 / (1 + 1j * np.pi * frequency * 1e-3)
+        self.assertTrue(np.allclose(analysis.out.as_ndarray(), expected))
+
+    ##############################################
+
+    def test_unit_free(self):
+        simulator = self._rc_circuit().simulator(simulator='mna', units=False)
+        analysis = simulator.ac(start_frequency=1@u_Hz, stop_frequency=1@u_MHz, number_of_points=10,
+                                variation='dec')
+        self.assertIs(type(analysis.out), np.ndarray)
+        self.assertIs(type(analysis.frequency), np.ndarray)
+        self.assertIs(analysis.out, analysis['out'])
+        expected = .5 / (1 + 1j * np.pi * analysis.frequency * 1e-3)
+        self.assertTrue(np.allclose(analysis.out, expected))
+        self.assertEqual(analysis.units['out'], u_V(1).prefixed_unit)
+        self.assertEqual(analysis.units['Vinput'], u_A(1).prefixed_unit)
+        self.assertEqual(analysis.units['frequency'], u_Hz(1).prefixed_unit)
+        unit_free_units = analysis.units
+        # the units of the waveforms
+        analysis = self._rc_circuit().simulator(simulator='mna').ac(
+            start_frequency=1@u_Hz, stop_frequency=1@u_MHz, number_of_points=10, variation='dec')
+        self.assertEqual(analysis.units, unit_free_units)
+        analysis = self._rc_circuit().simulator(simulator='mna').operating_point()
+        self.assertEqual(analysis.units['out'], u_V(1).prefixed_unit)
+        # unit-free operating point values are scalars
+        analysis = self._rc_circuit().simulator(simulator='mna', units=False).operating_point()
+        self.assertEqual(np.ndim(analysis.out), 0)
+        self.assertAlmostEqual(float(analysis.out), 5.)
+        self.assertEqual(analysis.units['out'], u_V(1).prefixed_unit)
+
+    ##############################################
+
+    def test_errors(self):
+        circuit = self._rc_circuit()
+        circuit.D(1, 'out', circuit.gnd, model='Diode')
+        with self.assertRaises(UnsupportedElementError):
+            circuit.simulator(simulator='mna')
+        circuit = self._rc_circuit()
+        circuit.C(2, 'out', 'floating', 1@u_uF)
+        with self.assertRaises(SingularMatrixError):
+            circuit.simulator(simulator='mna').operating_point()
+        # a numerical error
+        with self.assertRaises(np.linalg.LinAlgError):
+            circuit.simulator(simulator='mna').operating_point()
+
+    ##############################################
+
+    def test_string_values(self):
+        circuit = Circuit('RC')
+        circuit.V('input', 'in', circuit.gnd, 'DC 10 AC 1')
+        circuit.R(1, 'in', 'out', '2k', m=2)
+        circuit.C(1, 'out', circuit.gnd, '1uF')
+        circuit.R(2, 'out', circuit.gnd, 1@u_kΩ)
+        reference = MnaSystem(self._rc_circuit())
+        system = MnaSystem(circuit)
+        self.assertTrue(np.allclose(system.G.toarray(), reference.G.toarray()))
+        self.assertTrue(np.allclose(system.C.toarray(), reference.C.toarray()))
+        circuit.R(3, 'out', circuit.gnd, '{rload}')
+        with self.assertRaises(UnsupportedElementError):
+            MnaSystem(circuit)
+
+    ##############################################
+
+    def _divider_output(self, add_source):
+        circuit = Circuit('Divider')
+        add_source(circuit)
+        circuit.R(1, 'in', 'out', 1@u_kΩ)
+        circuit.R(2, 'out', circuit.gnd, 1@u_kΩ)
+        analysis = circuit.simulator(simulator='mna', units=False).operating_point()
+        return float(analysis.out)
+
+    ##############################################
+
+    def test_transient_sources(self):
+        # the operating point uses the value at t=0 of the transient function
+        self.assertAlmostEqual(self._divider_output(
+            lambda circuit: circuit.V('input', 'in', circuit.gnd, 'PULSE(2 5 1n 1n 1n 1u 2u)')), 1)
+        self.assertAlmostEqual(self._divider_output(
+            lambda circuit: circuit.V('input', 'in', circuit.gnd, 'AC 1 SIN(1, 2, 1k, 0, 0, 90)')), 1.5)
+        self.assertAlmostEqual(self._divider_output(
+            lambda circuit: circuit.V('input', 'in', circuit.gnd, 'DC 4 PULSE(2 5 1n 1n 1n 1u 2u)')), 2)
+        self.assertAlmostEqual(self._divider_output(
+            lambda circuit: circuit.ExponentialVoltageSource('input', 'in', circuit.gnd,
+                                                             initial_value=6, pulsed_value=0,
+                                                             rise_time_constant=1@u_ms,
+                                                             fall_delay_time=1@u_ms,
+                                                             fall_time_constant=1@u_ms)), 3)
+        self.assertAlmostEqual(self._divider_output(
+            lambda circuit: circuit.PieceWiseLinearVoltageSource(
+                'input', 'in', circuit.gnd, values=[(-1@u_ms, 0), (1@u_ms, 8)])), 2)
+        self.assertAlmostEqual(self._divider_output(
+            lambda circuit: circuit.PieceWiseLinearVoltageSource(
+                'input', 'in', circuit.gnd, values=[(0, 0), (2@u_ms, 8)], delay_time=-1@u_ms)), 2)
+        with self.assertRaisesRegex(UnsupportedElementError, 'Vinput'):
+            self._divider_output(
+                lambda circuit: circuit.RandomVoltageSource('input', 'in', circuit.gnd, random_type='uniform'))
+
+    ##############################################
+
+    def test_ac_batches(self):
+        system = MnaSystem(self._rc_circuit())
+        omegas = 2 * np.pi * np.logspace(0, 6, 61)
+        reference = system.solve_ac(omegas)
+        system.DENSE_BATCH_BYTES = 1
+        self.assertTrue(np.allclose(system.solve_ac(omegas), reference))
+        system.DENSE_MAX_SIZE = 0
+        self.assertTrue(np.allclose(system.solve_ac(omegas), reference))
+
+####################################################################################################
+
+class TestPrima(unittest.TestCase):
+
+    ##############################################
+
+    def _rc_line(self, number_of_segments=200):
+        circuit = Circuit('RC Line')
+        circuit.V('input', 'in', circuit.gnd, 'DC 0 AC 1')
+        for i in range(number_of_segments):
+            circuit.R(i + 1, 'in' if i == 0 else i, i + 1, 10@u_Ω)
+            circuit.C(i + 1, i + 1, circuit.gnd, 0.01@u_pF)
+        return circuit, str(number_of_segments)
+
+    ##############################################
+
+    def _port_impedance(self, circuit, ports, frequencies):
+        elements = [element for element in circuit.elements if element.PREFIX in ('R', 'L', 'C')]
+        return MnaSystem(circuit, elements=elements).port_impedance(ports, frequencies)
+
+    ##############################################
+
+    def _flatten(self, circuit):
+
+        """Return a copy of the circuit where the sub-circuit instances are replaced by the elements
+        of the sub-circuit.
+
+        """
+
+        flat_circuit = Circuit(circuit.title)
+        for element in circuit.elements:
+            if not isinstance(element, SubCircuitElement):
+                element.copy_to(flat_circuit)
+                continue
+            subcircuit = circuit._subcircuits[element.subcircuit_name]
+            port_nodes = dict(zip(subcircuit.external_nodes, [str(node) for node in element.nodes]))
+            prefix = element.name + '_'
+            for subcircuit_element in subcircuit.elements:
+                nodes = [node if node.is_ground_node else port_nodes.get(str(node), prefix + str(node))
+                         for node in subcircuit_element.nodes]
+                flat_element = subcircuit_element.__class__(flat_circuit, prefix + subcircuit_element._name, *nodes)
+                Element.copy_to(subcircuit_element, flat_element)
+                source = getattr(subcircuit_element, 'source', None)
+                if source is not None:
+                    flat_element.source = source[0] + prefix + source[1:]
+        return flat_circuit
+
+    ##############################################
+
+    def test_find_linear_networks(self):
+        circuit, output = self._rc_line(20)
+        networks = find_linear_networks(circuit, preserved_nodes=(output,))
+        self.assertEqual(len(networks), 1)
+        network = networks[0]
+        self.assertEqual([str(node) for node in network.ports], ['in', output])
+        self.assertEqual(len(network.internal_nodes), 19)
+        self.assertEqual(len(network.elements), 40)
+
+    ##############################################
+
+    def test_rc_line(self):
+        circuit, output = self._rc_line()
+        ports = ['in', output]
+        frequencies = np.logspace(6, 9, 7)
+        reference = self._port_impedance(circuit, ports, frequencies)
+
+        models = circuit.reduce_order(preserved_nodes=(output,), order=4)
+        self.assertEqual(len(models), 1)
+        model = models[0]
+        self.assertTrue(model.is_diagonal)
+        self.assertLessEqual(model.order, 8)
+        self.assertEqual(sorted(element.name for element in circuit.elements), ['Vinput', 'Xprima1'])
+        self.assertEqual(sorted(str(node) for node in circuit.nodes), sorted(['0', 'in', output]))
+
+        # the emitted sub-circuit implements the model
+        for impedance in (model.port_impedance(frequencies),
+                          MnaSystem(model.subcircuit).port_impedance(('port1', 'port2'), frequencies)):
+            error = np.abs(impedance - reference) / np.abs(reference)
+            self.assertLess(error.max(), 1e-3)
+
+    ##############################################
+
+    def test_reduced_circuit(self):
+        # compare the responses of the circuit and of the circuit using the sub-circuit
+        circuit, output = self._rc_line()
+        circuit.R('load', output, circuit.gnd, 1@u_kΩ)
+        reduced_circuit, output = self._rc_line()
+        reduced_circuit.R('load', output, reduced_circuit.gnd, 1@u_kΩ)
+        reduced_circuit.reduce_order(preserved_nodes=(output,), order=4)
+        flat_circuit = self._flatten(reduced_circuit)
+        self.assertNotIn('C1', [element.name for element in flat_circuit.elements])
+
+        kwargs = dict(start_frequency=1@u_MHz, stop_frequency=1@u_GHz, number_of_points=5, variation='dec')
+        reference = circuit.simulator(simulator='mna', units=False).ac(**kwargs)
+        analysis = flat_circuit.simulator(simulator='mna', units=False).ac(**kwargs)
+        error = np.abs(analysis[output] - reference[output]) / np.abs(reference[output])
+        self.assertLess(error.max(), 1e-3)
+
+        circuit.Vinput.dc_value = 'DC 1 AC 1'
+        flat_circuit.Vinput.dc_value = 'DC 1 AC 1'
+        reference = circuit.simulator(simulator='mna', units=False).operating_point()
+        analysis = flat_circuit.simulator(simulator='mna', units=False).operating_point()
+        self.assertAlmostEqual(float(analysis[output]), float(reference[output]), places=6)
+
+    ##############################################
+
+    def test_singular_model(self):
+        # two networks
+        circuit, output = self._rc_line(20)
+        circuit.V('input2', 'b0', circuit.gnd, 'DC 0 AC 1')
+        for i in range(20):
+            circuit.R('b{}'.format(i + 1), 'b{}'.format(i), 'b{}'.format(i + 1), 10@u_Ω)
+            circuit.C('b{}'.format(i + 1), 'b{}'.format(i + 1), circuit.gnd, 0.01@u_pF)
+        self.assertEqual(len(find_linear_networks(circuit, preserved_nodes=(output, 'b20'))), 2)
+        netlist = str(circuit)
+
+        # the second model fails, the error is raised before the netlist is modified
+        cholesky = np.linalg.cholesky
+        calls = []
+        def singular_cholesky(a):
+            calls.append(a)
+            if len(calls) > 1:
+                raise np.linalg.LinAlgError
+            return cholesky(a)
+        with mock.patch('numpy.linalg.cholesky', side_effect=singular_cholesky):
+            with self.assertRaisesRegex(SingularMatrixError, 'Singular reduced capacitance matrix'):
+                circuit.reduce_order(preserved_nodes=(output, 'b20'), order=4)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(str(circuit), netlist)
+
+        # the resistive networks are left untouched
+        circuit, output = self._rc_line(20)
+        for i in range(20):
+            circuit['C{}'.format(i + 1)].detach()
+        self.assertEqual(circuit.reduce_order(preserved_nodes=(output,), order=4), [])
+
+    ##############################################
+
+    def test_rlc_line(self):
+        circuit = Circuit('RLC Line')
+        circuit.V('input', 'in', circuit.gnd, 'DC 0 AC 1')
+        for i in range(50):
+            circuit.R(i + 1, 'in' if i == 0 else 'n{}'.format(i), 'm{}'.format(i + 1), 1@u_Ω)
+            circuit.L(i + 1, 'm{}'.format(i + 1), 'n{}'.format(i + 1), 1@u_nH)
+            circuit.C(i + 1, 'n{}'.format(i + 1), circuit.gnd, 1@u_pF)
+        circuit.R('load', 'n50', circuit.gnd, 50@u_Ω)
+        frequencies = np.logspace(6, 8, 5)
+        reference = self._port_impedance(circuit, ['in'], frequencies)
+
+        model = circuit.reduce_order(order=6)[0]
+        self.assertFalse(model.is_diagonal)
+        impedance = MnaSystem(model.subcircuit).port_impedance(('port1',), frequencies)
+        error = np.abs(impedance - reference) / np.abs(reference)
+        self.assertLess(error.max(), 1e-3)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,14 +20,22 @@
 
 ####################################################################################################
 
+from pathlib import Path
+import os
+import subprocess
+import sys
 import unittest
 
 ####################################################################################################
 
+import PySpice
 import PySpice.Logging.Logging as Logging
 logger = Logging.setup_logging()
 
 from PySpice.Spice.Netlist import *
+from PySpice.Spice.ParameterGraph import ParameterCycleError
+from PySpice.Spice.Reduction import NetlistReducer
+from PySpice.Spice.Topology import TopologyError
 from PySpice.Unit import *
 
 ####################################################################################################
@@ -85,6 +93,58 @@ R2 output_plus output_minus 1kOhm
 """
         self._test_spice_declaration(VoltageDivider(), spice_declaration)
 
+    ##############################################
+
+    def test_cache(self):
+
+        subcircuit = VoltageDivider()
+        text = str(subcircuit)
+        self.assertIs(subcircuit._str_body(), subcircuit._str_body())
+        subcircuit.R2.resistance = 2@u_kΩ
+        self.assertEqual(str(subcircuit), text.replace('1kOhm', '2kOhm'))
+        subcircuit.R2.enabled = False
+        self.assertNotIn('R2', str(subcircuit))
+        # in place edit of a model
+        model = subcircuit.model('Diode', 'D', bv=10)
+        self.assertIn('bv=10', str(subcircuit))
+        model._parameters['bv'] = 20
+        self.assertIn('bv=20', str(subcircuit))
+
+    ##############################################
+
+    def test_duplicate(self):
+
+        spice_declaration = """
+.title Duplicate
+.subckt VoltageDivider input output_plus output_minus
+R1 input output_plus 9kOhm
+R2 output_plus output_minus 1kOhm
+.ends VoltageDivider
+.subckt VoltageDivider2 input output_plus output_minus
+X1 input output_plus output_minus VoltageDivider
+.ends VoltageDivider2
+.subckt VoltageDivider3 input output_plus output_minus
+R1 input output_plus 9kOhm
+R2 output_plus output_minus 2kOhm
+.ends VoltageDivider3
+X1 in out 0 VoltageDivider2
+"""
+
+        circuit = Circuit('Duplicate')
+        for i, resistance in enumerate((1@u_kΩ, 1@u_kΩ, 2@u_kΩ)):
+            subcircuit = SubCircuit('VoltageDivider' + (str(i + 1) if i else ''),
+                                    'input', 'output_plus', 'output_minus')
+            subcircuit.R(1, 'input', 'output_plus', 9@u_kΩ)
+            subcircuit.R(2, 'output_plus', 'output_minus', resistance)
+            circuit.subcircuit(subcircuit)
+        circuit.X(1, 'VoltageDivider2', 'in', 'out', circuit.gnd)
+        # the sub-circuits are not deduplicated by default
+        self._test_spice_declaration(circuit, spice_declaration.replace(
+            'X1 input output_plus output_minus VoltageDivider\n',
+            'R1 input output_plus 9kOhm\nR2 output_plus output_minus 1kOhm\n'))
+        circuit.deduplicate_subcircuits = True
+        self._test_spice_declaration(circuit, spice_declaration)
+
 ####################################################################################################
 
 class TestCircuit(TestNetlist):
@@ -154,6 +214,46 @@ R2 out 0 1kOhm
 
     ##############################################
 
+    def test_lazy_imports(self):
+
+        code = """
+import sys
+import PySpice.Spice.Number
+print('PySpice.Spice.BasicElement' in sys.modules)
+{}
+from PySpice.Spice.Netlist import Circuit
+print(hasattr(Circuit, 'R') and hasattr(Circuit, 'SinusoidalVoltageSource'))
+circuit = Circuit('')
+circuit.R(1, 'in', circuit.gnd, 1)
+circuit.SinusoidalVoltageSource('input', 'in', circuit.gnd)
+str(circuit)
+for module in ('PySpice.Spice.NgSpice.Shared', 'cffi', 'ply', 'scipy'):
+    print(module in sys.modules)
+"""
+        env = dict(os.environ, PYTHONPATH=str(Path(PySpice.__file__).parents[1]))
+        # an element module can be imported first
+        for statement in ('', 'import PySpice.Spice.BasicElement', 'import PySpice.Spice.HighLevelElement'):
+            output = subprocess.check_output([sys.executable, '-c', code.format(statement)],
+                                             env=env, universal_newlines=True)
+            self.assertEqual(output.split(), ['False', 'True', 'False', 'False', 'False', 'False'])
+
+        # Python 3.6 has no module __getattr__, the element modules are imported with the package
+        code = """
+import collections, sys
+import numpy
+real_version_info = sys.version_info
+VersionInfo = collections.namedtuple('VersionInfo', 'major minor micro releaselevel serial')
+sys.version_info = VersionInfo(3, 6, 15, 'final', 0)
+import PySpice.Spice.Number
+sys.version_info = real_version_info
+import PySpice.Spice
+print(len(vars(PySpice.Spice)['spice_elements']) > 0)
+"""
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True)
+        self.assertEqual(output.split(), ['True'])
+
+    ##############################################
+
     def test_raw_spice(self):
 
         spice_declaration = """
@@ -208,6 +308,217 @@ R1 in out 9kOhm
 
 ####################################################################################################
 
+class TestParameterGraph(TestNetlist):
+
+    ##############################################
+
+    def test_parameter_graph(self):
+
+        circuit = Circuit('Parameter Graph')
+        circuit.parameter('r2', '{2 * rload}')
+        circuit.parameter('rload', '1k')
+        circuit.parameter('tc', '{1 + 1e-3 * (temp - 27)}')
+        circuit.parameter('pap', '{AGAUSS(1k, 1, 1.67)}')
+        circuit.parameter('l0', 180e-9)
+        circuit.R(1, 'in', 'out', '{r2 * tc}')
+        circuit.R(2, 'out', circuit.gnd, 1@u_kΩ)
+        circuit.M(1, 'out', 'in', circuit.gnd, circuit.gnd, model='nch', l='{l0}', w='{10 * l0}')
+
+        graph = circuit.parameter_graph()
+        self.assertEqual(graph.parameters, ['rload', 'tc', 'pap', 'l0', 'r2'])
+        self.assertEqual(graph.free_variables, ['temp'])
+        self.assertEqual(graph.fold(), {'rload': 1e3, 'l0': 180e-9, 'r2': 2e3})
+
+        # a statistical function must be evaluated by the caller
+        values = graph.evaluate(temp=27, pap=1e3)
+        self.assertEqual(values['r2'], 2e3)
+        self.assertEqual(graph.affected_elements(['temp']), ['R1'])
+
+        names = graph.update(values, rload=2e3)
+        self.assertEqual(names, ['rload', 'r2'])
+        self.assertEqual(graph.alterations(values, names), {'R1': {'resistance': 4e3}})
+        names = graph.update(values, l0=100e-9)
+        alterations = graph.alterations(values, names)
+        self.assertAlmostEqual(alterations['M1']['w'], 1e-6)
+
+        # the names are case-insensitive and the keys are the names of the alter command
+        circuit.parameter('Vbias', 1)
+        circuit.V('bias', 'bias', circuit.gnd, '{vbias}')
+        circuit.R(3, 'out', circuit.gnd, '{RLOAD}')
+        graph = circuit.parameter_graph()
+        values = graph.evaluate(TEMP=27, pap=1e3)
+        self.assertEqual(graph.affected_elements(['Rload']), ['R1', 'R3'])
+        names = graph.update(values, VBIAS=2)
+        self.assertEqual(names, ['vbias'])
+        self.assertEqual(graph.alterations(values, names), {'Vbias': {'dc': 2}})
+
+        circuit.parameter('rload', '{r2 / 2}')
+        with self.assertRaises(ParameterCycleError):
+            circuit.parameter_graph()
+
+####################################################################################################
+
+class TestTopology(TestNetlist):
+
+    ##############################################
+
+    def test_valid(self):
+        circuit = VoltageDividerCircuit()
+        report = circuit.check_topology()
+        self.assertTrue(report.is_valid)
+        self.assertTrue(circuit.connectivity.connected('in', circuit.gnd))
+
+    ##############################################
+
+    def test_floating_and_single_connection(self):
+        circuit = VoltageDividerCircuit()
+        circuit.R(3, 'a', 'b', 1@u_kΩ)
+        report = circuit.check_topology()
+        self.assertFalse(report.is_valid)
+        self.assertEqual(sorted(str(node) for node in report.floating_nodes), ['a', 'b'])
+        self.assertEqual(sorted(str(node) for node in report.single_connection_nodes), ['a', 'b'])
+        with self.assertRaises(TopologyError):
+            circuit.check_topology(raise_exception=True)
+        circuit.R3.enabled = False
+        self.assertTrue(circuit.check_topology().is_valid)
+        circuit.R3.enabled = True
+        circuit.R3.detach()
+        self.assertTrue(circuit.check_topology().is_valid)
+
+    ##############################################
+
+    def test_dc_path(self):
+        circuit = VoltageDividerCircuit()
+        circuit.C(1, 'out', 'x', 1@u_uF)
+        circuit.C(2, 'x', circuit.gnd, 1@u_uF)
+        report = circuit.check_topology()
+        self.assertEqual([str(node) for node in report.no_dc_path_nodes], ['x'])
+        self.assertFalse(report.floating_nodes)
+
+    ##############################################
+
+    def test_voltage_loop(self):
+        circuit = VoltageDividerCircuit()
+        circuit.V('loop', 'in', circuit.gnd, '5V')
+        circuit.L(1, 'out', 'out', 1@u_uH)
+        report = circuit.check_topology()
+        self.assertEqual(sorted(report.voltage_loops), ['L1', 'Vloop'])
+
+    ##############################################
+
+    def test_subcircuit(self):
+        self.assertTrue(VoltageDivider().check_topology().is_valid)
+
+####################################################################################################
+
+class TestReduction(TestNetlist):
+
+    ##############################################
+
+    def _rc_ladder(self):
+        circuit = Circuit('RC Ladder')
+        circuit.V('input', 'in', circuit.gnd, '1V')
+        circuit.R(1, 'in', 1, 1@u_kΩ)
+        circuit.R(2, 1, 2, 2@u_kΩ)
+        circuit.R(3, 2, 'out', 3@u_kΩ)
+        circuit.C(1, 'out', circuit.gnd, 1@u_nF)
+        circuit.C(2, 'out', circuit.gnd, 2@u_nF)
+        circuit.R('dangling', 'out', 'x', 1@u_kΩ)
+        return circuit
+
+    ##############################################
+
+    def test_reduce(self):
+        circuit = self._rc_ladder()
+        report = circuit.reduce()
+        self.assertEqual(sorted(report.series_resistors), ['R2', 'R3'])
+        self.assertEqual(report.parallel_capacitors, ['C2'])
+        self.assertEqual(report.dangling_elements, ['Rdangling'])
+        self.assertEqual(sorted(report.removed_nodes), ['1', '2', 'x'])
+        self.assertEqual(sorted(element.name for element in circuit.elements), ['C1', 'R1', 'Vinput'])
+        self.assertAlmostEqual(float(circuit.R1.resistance), 6e3)
+        self.assertAlmostEqual(float(circuit.C1.capacitance), 3e-9)
+        self.assertTrue(circuit.check_topology().is_valid)
+
+    ##############################################
+
+    def test_preserved_nodes(self):
+        circuit = self._rc_ladder()
+        report = circuit.reduce(preserved_nodes=('2',), remove_dangling=False)
+        self.assertEqual(report.series_resistors, ['R2'])
+        self.assertFalse(report.dangling_elements)
+        self.assertIn('2', [str(node) for node in circuit.nodes])
+        self.assertAlmostEqual(float(circuit.R1.resistance), 3e3)
+
+    ##############################################
+
+    def test_thresholds(self):
+        circuit = self._rc_ladder()
+        circuit.R(4, 'out', 'y', 1@u_mΩ)
+        circuit.C(3, 'y', circuit.gnd, 1@u_pF)
+        report = circuit.reduce(preserved_nodes=('out',), short_resistance=1, open_capacitance=1e-12)
+        self.assertEqual(report.shorted_resistors, ['R4'])
+        self.assertEqual(report.opened_capacitors, ['C3'])
+        self.assertNotIn('y', [str(node) for node in circuit.nodes])
+
+    ##############################################
+
+    def test_null_resistors(self):
+        circuit = Circuit('Null Resistors')
+        circuit.V('input', 'in', circuit.gnd, '1V')
+        circuit.R(1, 'in', 'a', 0)
+        circuit.R(2, 'in', 'a', 0)
+        circuit.R(3, 'a', circuit.gnd, 1@u_kΩ)
+        report = circuit.reduce(preserved_nodes={'in', 'a'})
+        self.assertEqual(report.parallel_resistors, ['R2'])
+        self.assertEqual(float(circuit.R1.resistance), 0)
+
+        # the anchored nodes of a netlist are not preserved in the next one
+        reducer = NetlistReducer()
+        circuit = Circuit('Global', global_nodes=('x',))
+        circuit.R(1, 'in', 'x', 1@u_kΩ)
+        circuit.R(2, 'x', circuit.gnd, 1@u_kΩ)
+        self.assertFalse(reducer.reduce(circuit).series_resistors)
+        circuit = Circuit('Local')
+        circuit.R(1, 'in', 'x', 1@u_kΩ)
+        circuit.R(2, 'x', circuit.gnd, 1@u_kΩ)
+        self.assertEqual(reducer.reduce(circuit).series_resistors, ['R2'])
+
+    ##############################################
+
+    def test_simulator(self):
+        circuit = self._rc_ladder()
+        netlist = str(circuit)
+        simulator = circuit.simulator(simulator='mna', reduction=True)
+        analysis = simulator.operating_point(probes=('out',))
+        self.assertEqual(sorted(simulator.reduction_report.series_resistors), ['R2', 'R3'])
+        self.assertAlmostEqual(float(analysis.out[0]), 1)
+        # the circuit is not modified
+        self.assertEqual(str(circuit), netlist)
+        self.assertIsNot(simulator.simulated_circuit, circuit)
+        self.assertNotIn('R2', [element.name for element in simulator.simulated_circuit.elements])
+
+    ##############################################
+
+    def test_preserved_elements(self):
+        circuit = self._rc_ladder()
+        report = circuit.reduce(preserved_nodes=('out',), preserved_elements=('r2',))
+        self.assertFalse(report.series_resistors)
+        self.assertAlmostEqual(float(circuit.R2.resistance), 2e3)
+
+        # the elements of the current probes are preserved
+        circuit = self._rc_ladder()
+        simulator = circuit.simulator(simulator='mna', reduction=True)
+        simulator.operating_point(probes=('out', '@R2[i]'))
+        self.assertFalse(simulator.reduction_report.series_resistors)
+        self.assertEqual(simulator.reduction_report.dangling_elements, ['Rdangling'])
+        self.assertIn('R2', [element.name for element in simulator.simulated_circuit.elements])
+        simulator = circuit.simulator(simulator='mna', reduction=True)
+        simulator.save(['v(out, 1)', 'i(R3)', 'R1#branch'])
+        self.assertEqual(simulator._probed_nodes(), ({'out', '1'}, {'R3', 'R1'}))
+
+####################################################################################################
+
 if __name__ == '__main__':
 
     unittest.main()
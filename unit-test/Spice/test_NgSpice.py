@@ -0,0 +1,91 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2025 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+####################################################################################################
+
+from ctypes.util import find_library
+from pathlib import Path
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+####################################################################################################
+
+from PySpice.Spice.NgSpice.Build import CALLBACKS, MODULE_NAME, make_ffi_builder
+from PySpice.Spice.NgSpice.Shared import NgSpiceShared
+
+####################################################################################################
+
+class TestCompiledBinding(unittest.TestCase):
+
+    ##############################################
+
+    def test_ffi_builder(self):
+        ffi_builder = make_ffi_builder()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir).joinpath(MODULE_NAME.split('.')[-1] + '.c')
+            ffi_builder.emit_c_code(str(path))
+            source = path.read_text()
+        for name in CALLBACKS:
+            # a callback of NgSpiceShared implemented as an extern "Python" function
+            self.assertTrue(callable(getattr(NgSpiceShared, name)))
+            self.assertIn('pyspice' + name, source)
+        self.assertIn('ngSpice_Init_Sync', source)
+
+    ##############################################
+
+    def test_compiled_binding(self):
+
+        if find_library('ngspice') is None:
+            self.skipTest('libngspice is missing')
+        library_dirs = [_ for _ in os.environ.get('LD_LIBRARY_PATH', '').split(os.pathsep) if _]
+        ffi_builder = make_ffi_builder(library_dirs)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            try:
+                module_path = ffi_builder.compile(tmpdir=tmpdir)
+            except Exception as exception:
+                self.skipTest('the extension cannot be built: {}'.format(exception))
+            # the handles, the arrays and the strings use the ffi of the compiled binding
+            source = textwrap.dedent("""
+                import importlib.util
+                import sys
+                spec = importlib.util.spec_from_file_location({0!r}, {1!r})
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                sys.modules[{0!r}] = module
+                from PySpice.Spice.NgSpice.Shared import NgSpiceShared
+                ngspice = NgSpiceShared()
+                assert ngspice.use_compiled_binding and ngspice._ffi is module.ffi
+                assert isinstance(ngspice.ngspice_version, int)
+                ngspice.load_circuit('.title Test\\nR1 1 0 1k\\n.end')
+            """).format(MODULE_NAME, module_path)
+            environ = dict(os.environ)
+            environ.pop('NGSPICE_LIBRARY_PATH', None)
+            process = subprocess.run([sys.executable, '-c', source], env=environ,
+                                     stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            self.assertEqual(process.returncode, 0, process.stdout.decode('utf-8', 'replace'))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+####################################################################################################
+
+import unittest
+
+import numpy as np
+
+####################################################################################################
+
+from PySpice.Spice.Number import spice_number_to_float, spice_numbers_to_array
+from PySpice.Unit import *
+
+####################################################################################################
+
+class TestNumber(unittest.TestCase):
+
+    ##############################################
+
+    def test_spice_number_to_float(self):
+        self.assertEqual(spice_number_to_float('10meg'), 10e6)
+        self.assertEqual(spice_number_to_float('4.7uF'), 4.7e-6)
+        self.assertEqual(spice_number_to_float(1@u_kΩ), 1e3)
+        # the scale is exact
+        for value, number in (('10u', 10e-6), ('470n', 470e-9), ('220u', 220e-6), ('4.7p', 4.7e-12),
+                              ('1.5e-3k', 1.5), ('-3.3Meg', -3.3e6), ('1mil', 25.4e-6)):
+            self.assertEqual(spice_number_to_float(value), number)
+        with self.assertRaises(ValueError):
+            spice_number_to_float('{rload}')
+
+    ##############################################
+
+    def test_spice_numbers_to_array(self):
+
+        values = ['1k', '10meg', '4.7uF', '2.2e-12', '1mil', 2@u_kΩ, 5, '.5e3']
+        numbers, prefixes, units = spice_numbers_to_array(values)
+        self.assertTrue(np.allclose(numbers, [spice_number_to_float(x) for x in values], rtol=1e-15))
+        self.assertEqual(list(prefixes), ['k', 'meg', 'u', '', 'mil', '', '', ''])
+        self.assertEqual(list(units), ['', '', 'F', '', '', '', '', ''])
+        numbers = spice_numbers_to_array(['10u', '470n', '220uF', '4.7p', '1k'])[0]
+        self.assertEqual(list(numbers), [10e-6, 470e-9, 220e-6, 4.7e-12, 1e3])
+        numbers = spice_numbers_to_array(['10u', '470n', '{rload}'], strict=False)[0]
+        self.assertEqual(list(numbers[:2]), [10e-6, 470e-9])
+
+        # the values which are not a number
+        with self.assertRaises(ValueError):
+            spice_numbers_to_array(['1k', '{rload}'])
+        numbers, prefixes, units = spice_numbers_to_array(['1k', '{rload}', ' 2p ', '1_0'], strict=False)
+        self.assertEqual(numbers[0], 1e3)
+        self.assertTrue(np.isnan(numbers[1]))
+        self.assertAlmostEqual(numbers[2], 2e-12)
+        self.assertTrue(np.isnan(numbers[3]))
+
+        self.assertEqual(len(spice_numbers_to_array([])[0]), 0)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
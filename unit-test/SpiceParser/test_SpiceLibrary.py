@@ -0,0 +1,240 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+####################################################################################################
+
+from pathlib import Path
+from unittest import mock
+import os
+import tempfile
+import unittest
+
+####################################################################################################
+
+import PySpice.Spice.Library as Library
+from PySpice.Spice.Library import IncludeResolver, SpiceLibrary
+from PySpice.Spice.Parser import SpiceParser
+
+####################################################################################################
+
+diode_lib = """* Diodes
+.model 1N4148 D (IS=4.352E-9 N=1.906 BV=110 IBV=0.0001 RS=0.6458)
+.model 1N5822 D (IS=531.26E-9 N=1.5 RS=0.0276)
+"""
+
+opamp_lib = """* Operational amplifier
+.subckt follower in out
+Rin in 0 1Meg
+E1 out 0 in 0 1
+.ends follower
+"""
+
+section_lib = """* Corners
+.lib tt
+.model nch nmos (level=54
++ vth0=0.4)
+.endl
+.lib ff
+.model nch nmos (level=54 vth0=0.3)
+.endl
+.subckt inverter in out vdd vss params: w=1u
+M1 out in vss vss nch w={w}
+.model local nmos
+.ends inverter
+"""
+
+####################################################################################################
+
+class TestSpiceLibrary(unittest.TestCase):
+
+    ##############################################
+
+    def setUp(self):
+        self._tmp_directory = tempfile.TemporaryDirectory()
+        self._root = Path(self._tmp_directory.name)
+        self._write('diode.lib', diode_lib)
+        self._write('opamp/opamp.lib', opamp_lib)
+
+    def tearDown(self):
+        self._tmp_directory.cleanup()
+
+    ##############################################
+
+    def _write(self, filename, text):
+        path = self._root.joinpath(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return path
+
+    ##############################################
+
+    def _library(self, **kwargs):
+        with mock.patch.object(Library, 'SpiceParser', wraps=Library.SpiceParser) as parser:
+            library = SpiceLibrary(self._root, **kwargs)
+        return library, parser.scan.call_count
+
+    ##############################################
+
+    def test_lookup(self):
+
+        library, number_of_parses = self._library()
+        self.assertEqual(number_of_parses, 2)
+        self.assertEqual(sorted(library.models), ['1N4148', '1N5822'])
+        self.assertEqual(list(library.subcircuits), ['follower'])
+        self.assertEqual(list(library.search('^1N5')), ['1N5822'])
+
+        path, offset = library.location('1N5822')
+        self.assertEqual(Path(str(path)), self._root.joinpath('diode.lib'))
+        with open(str(path), 'rb') as f:
+            f.seek(offset)
+            self.assertTrue(f.readline().startswith(b'.model 1N5822'))
+
+        self.assertEqual(library.definition('follower'), opamp_lib[opamp_lib.index('.subckt'):])
+
+    ##############################################
+
+    def test_scan(self):
+
+        path = self._write('section.lib', section_lib)
+        scan = SpiceParser.scan(path, section='tt')
+        self.assertFalse(scan.has_title)
+        self.assertEqual([model.name for model in scan.models], ['nch'])
+        definition = scan.models[0]
+        self.assertEqual(section_lib.encode()[definition.start:definition.stop], b'.model nch nmos (level=54\n+ vth0=0.4)\n')
+        definition = scan.subcircuits[0]
+        self.assertEqual((definition.name, definition.nodes), ('inverter', ['in', 'out', 'vdd', 'vss']))
+        self.assertTrue(section_lib.encode()[definition.start:definition.stop].endswith(b'.ends inverter\n'))
+        self.assertTrue(scan.is_only_subcircuit())
+
+    ##############################################
+
+    def test_index(self):
+
+        library, number_of_parses = self._library(index=True)
+        self.assertTrue(self._root.joinpath(SpiceLibrary.INDEX_FILENAME).exists())
+
+        # the index is up to date
+        library, number_of_parses = self._library(index=True)
+        self.assertEqual(number_of_parses, 0)
+        self.assertEqual(str(library['follower']), str(self._root.joinpath('opamp', 'opamp.lib')))
+
+        # only the modified file is parsed again
+        self._write('opamp/opamp.lib', opamp_lib.replace('follower', 'buffer'))
+        library, number_of_parses = self._library(index=True)
+        self.assertEqual(number_of_parses, 1)
+        self.assertEqual(list(library.subcircuits), ['buffer'])
+        self.assertIn('1N4148', library.models)
+
+        # removed files are dropped
+        os.remove(str(self._root.joinpath('diode.lib')))
+        library, number_of_parses = self._library(index=True)
+        self.assertEqual(number_of_parses, 0)
+        self.assertEqual(list(library.models), [])
+
+    ##############################################
+
+    def test_workers(self):
+        for i in range(10):
+            self._write('diodes/diode{}.lib'.format(i), diode_lib.replace('1N', 'D{}_'.format(i)))
+        library = SpiceLibrary(self._root, index=False)
+        parallel_library = SpiceLibrary(self._root, index=False, workers=2)
+        for names in ('_subcircuits', '_models'):
+            self.assertEqual([(name, str(path)) for name, path in getattr(library, names).items()],
+                             [(name, str(path)) for name, path in getattr(parallel_library, names).items()])
+        self.assertEqual(len(list(parallel_library.models)), 22)
+
+    ##############################################
+
+    def test_no_index(self):
+        # the library directory is not written by default
+        library, number_of_parses = self._library()
+        self.assertEqual(sorted(path.name for path in self._root.iterdir()), ['diode.lib', 'opamp'])
+        library, number_of_parses = self._library(index=False)
+        self.assertEqual(number_of_parses, 2)
+        # the index can be stored elsewhere
+        with tempfile.TemporaryDirectory() as directory:
+            index_path = Path(directory).joinpath('index.json')
+            self._library(index=index_path)
+            library, number_of_parses = self._library(index=index_path)
+            self.assertTrue(index_path.exists())
+            self.assertEqual(number_of_parses, 0)
+        self.assertEqual(sorted(path.name for path in self._root.iterdir()), ['diode.lib', 'opamp'])
+
+    ##############################################
+
+    def test_include_resolver(self):
+
+        # diode.lib is included twice, cycle.lib and loop.lib include each other
+        self._write('include/diodes.lib', '* Diodes\n.include ../diode.lib\n.include ../diode.lib\n')
+        self._write('include/cycle.lib', '* Cycle\n.include loop.lib\n.include ../diode.lib\n')
+        self._write('include/loop.lib', '* Loop\n.include cycle.lib\n')
+        top = self._write('top.cir', '* Top\n.include include/diodes.lib\n.include include/cycle.lib\n'
+                          'R1 1 0 1k\n')
+
+        include_resolver = IncludeResolver()
+        with mock.patch.object(Library, 'SpiceParser', wraps=Library.SpiceParser) as parser:
+            spice_parser = SpiceParser(path=str(top), recurse=True, include_resolver=include_resolver)
+        self.assertEqual(parser.scan.call_count, 4)
+        self.assertEqual(len(include_resolver), 4)
+        self.assertEqual(len(spice_parser.incl_libs), 2)
+        for library in spice_parser.incl_libs:
+            self.assertEqual(sorted(library.models), ['1N4148', '1N5822'])
+
+    ##############################################
+
+    def test_index_dependencies(self):
+
+        # the entry of a file is rescanned when an included file changes
+        self._write('wrappers/wrapper.mod', '* Wrapper\n.include ../models/diodes.lib\n')
+        index_path = self._root.joinpath('index.json')
+
+        def library():
+            with mock.patch.object(Library, 'SpiceParser', wraps=Library.SpiceParser) as parser:
+                library = SpiceLibrary(self._root.joinpath('wrappers'), recurse=True, index=index_path)
+            return sorted(library.models), parser.scan.call_count
+
+        self.assertEqual(library(), ([], 1))
+        self._write('models/diodes.lib', diode_lib)
+        self.assertEqual(library(), (['1N4148', '1N5822'], 2))
+        self.assertEqual(library(), (['1N4148', '1N5822'], 0))
+        self._write('models/diodes.lib', diode_lib.replace('1N', 'D'))
+        self.assertEqual(library(), (['D4148', 'D5822'], 2))
+        os.remove(str(self._root.joinpath('models', 'diodes.lib')))
+        self.assertEqual(library(), ([], 1))
+
+    ##############################################
+
+    def test_parallel_include_resolver(self):
+
+        # the includes are resolved by the parent process, the common file is scanned once
+        for i in range(4):
+            self._write('wrappers/wrapper{}.mod'.format(i), '* Wrapper\n.include ../diode.lib\n')
+        for workers in (1, 2):
+            include_resolver = IncludeResolver()
+            library = SpiceLibrary(self._root.joinpath('wrappers'), recurse=True, index=False,
+                                   workers=workers, include_resolver=include_resolver)
+            self.assertEqual(len(include_resolver), 1)
+            self.assertEqual(sorted(library.models), ['1N4148', '1N5822'])
+            self.assertEqual(library['1N4148'].filename, 'diode.lib')
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
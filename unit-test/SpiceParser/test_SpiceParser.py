@@ -21,7 +21,10 @@
 ####################################################################################################
 
 from pathlib import Path
+from unittest import mock
 import os
+import shutil
+import tempfile
 import unittest
 
 ####################################################################################################
@@ -39,6 +42,27 @@ with open(path.joinpath('hsop77.cir')) as fh:
 with open(path.joinpath('hsada4077.cir')) as fh:
     hsada4077 = fh.read()
 
+corner_lib = """* Corners
+.param vdd=1.8
+.lib tt
+.model nch nmos (level=54
++ vth0=0.4)
+.endl tt
+.lib ff
+.model nch nmos (level=54 vth0=0.3)
+.endl
+.lib ss
+.model nch nmos (level=54 vth0=0.5)
+.lib nested
+.model pch pmos
+.endl
+.model local nmos
+.endl
+.subckt inverter in out vdd vss params: w=1u
+M1 out in vss vss nch w={w}
+.ends inverter
+"""
+
 ####################################################################################################
 
 def circuit_gft(prb):
@@ -74,6 +98,111 @@ class TestSpiceParser(unittest.TestCase):
         circuit.BehavioralSource('test', '1', '0', voltage_expression='if(0, 0, 1)', smoothbsrc=1)
         print(circuit)
 
+    ##############################################
+
+    def test_section(self):
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            lib_path = os.path.join(tmp_directory, 'corner.lib')
+            with open(lib_path, 'w') as fh:
+                fh.write(corner_lib)
+            for section in ('tt', 'ff', 'ss', 'fs'):
+                parser = SpiceParser(path=lib_path, section=section)
+                reference = SpiceParser(source=corner_lib, section=section)
+                self.assertEqual([repr(statement) for statement in parser._statements],
+                                 [repr(statement) for statement in reference._statements])
+            self.assertIn((os.path.realpath(lib_path), ('$', '//', ';')), SpiceParser._section_indexes)
+
+            # only the requested section is read
+            raw_lines, line_indexes = parser._read_section(lib_path, 'ff')
+            self.assertEqual(''.join(raw_lines).count('level=54'), 1)
+            self.assertEqual(raw_lines[line_indexes.index(6)], '.lib ff\n')
+
+    ##############################################
+
+    def test_library_references(self):
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            models_path = os.path.join(tmp_directory, 'models.lib')
+            with open(models_path, 'w') as fh:
+                fh.write('* Models\n'
+                         '.lib nmos_tt\n'
+                         '.model nch nmos (level=54)\n'
+                         '.endl\n'
+                         '.lib pmos_tt\n'
+                         '.model pch pmos (level=54)\n'
+                         # cycle
+                         '.lib "corner.lib" tt\n'
+                         '.endl\n')
+            corner_path = os.path.join(tmp_directory, 'corner.lib')
+            with open(corner_path, 'w') as fh:
+                fh.write('* Corners\n'
+                         '.lib tt\n'
+                         '.lib models.lib nmos_tt\n'
+                         '.lib "models.lib" pmos_tt\n'
+                         '.model local nmos\n'
+                         '.endl tt\n'
+                         '.lib models.lib nmos_tt\n'
+                         '.model global nmos\n')
+            with mock.patch.object(SpiceParser._logger, 'warning') as warning:
+                parser = SpiceParser(path=corner_path, section='tt')
+            self.assertIn('Library cycle', warning.call_args[0][0])
+            self.assertEqual([model.name for model in parser.models], ['nch', 'pch', 'local', 'nch', 'global'])
+            # a reference doesn't start a section
+            self.assertEqual([section[0] for section in parser._section_index(corner_path)], ['tt'])
+
+    ##############################################
+
+    def test_stream(self):
+
+        cir_path = str(path.joinpath('hsop77.cir'))
+        reference = SpiceParser(path=cir_path)
+        parser = SpiceParser(path=cir_path, stream=True)
+        self.assertIsNone(parser._statements)
+        self.assertEqual(str(parser.build_circuit()), str(reference.build_circuit()))
+
+        # the pipeline reads the lines on demand
+        def raw_lines():
+            yield 'Title\n'
+            yield 'R1 1 0\n'
+            yield '+ 1k\n'
+            yield '* comment\n'
+            yield 'R2 1 2 2k\n'
+            raise AssertionError('line read too early')
+        statements = parser._iter_statements(parser._merge_lines(raw_lines()))
+        element = next(statements)
+        self.assertEqual(repr(element), "Element R 1 ['1', '0'] ['1k'] {}")
+
+    ##############################################
+
+    def test_cache(self):
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            cir_path = os.path.join(tmp_directory, 'hsop77.cir')
+            shutil.copy(str(path.joinpath('hsop77.cir')), cir_path)
+            cache_directory = os.path.join(tmp_directory, 'cache')
+
+            def parse():
+                with mock.patch.object(SpiceParser, '_parse', autospec=True, side_effect=SpiceParser._parse) as _parse:
+                    parser = SpiceParser(path=cir_path, cache=cache_directory)
+                return parser, _parse.call_count
+
+            parser, number_of_parses = parse()
+            self.assertEqual(number_of_parses, 1)
+            self.assertEqual(len(os.listdir(cache_directory)), 1)
+            reference = str(parser.build_circuit())
+
+            parser, number_of_parses = parse()
+            self.assertEqual(number_of_parses, 0)
+            self.assertEqual(str(parser.build_circuit()), reference)
+
+            # the cache is invalidated when the file content changes
+            with open(cir_path, 'a') as fh:
+                fh.write('R99 1 0 1k\n')
+            parser, number_of_parses = parse()
+            self.assertEqual(number_of_parses, 1)
+            self.assertIn('R99', str(parser.build_circuit()))
+
 ####################################################################################################
 
 if __name__ == '__main__':
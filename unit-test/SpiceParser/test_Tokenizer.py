@@ -0,0 +1,120 @@
+####################################################################################################
+#
+# PySpice - A Spice Package for Python
+# Copyright (C) 2014 Fabrice Salvaire
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+####################################################################################################
+
+####################################################################################################
+
+####################################################################################################
+
+import unittest
+
+####################################################################################################
+
+from PySpice.Spice.Parser import Element, Line
+from PySpice.Spice import Parser_jmgc
+from PySpice.Spice.Tokenizer import iter_groups, split_parameters, tokenize
+
+####################################################################################################
+
+class TestTokenizer(unittest.TestCase):
+
+    ##############################################
+
+    def test_tokenize(self):
+
+        self.assertEqual(tokenize('M1 d g\ts b nch w=1u l = 180n'),
+                         [('M1', '', ''), ('d', '', ''), ('g', '', ''), ('s', '', ''), ('b', '', ''),
+                          ('nch', '', ''), ('w=1u', 'w', '1u'), ('l=180n', 'l', '180n')])
+        self.assertEqual(tokenize('B1 1 0 v={if(v(a, b) > 0.5, 5, 0)}'),
+                         [('B1', '', ''), ('1', '', ''), ('0', '', ''),
+                          ('v={if(v(a, b) > 0.5, 5, 0)}', 'v', '{if(v(a, b) > 0.5, 5, 0)}')])
+        # the fast path and the regular expression agree
+        self.assertEqual(tokenize('a= b c= d'), tokenize('a=b c=d'))
+        self.assertEqual(tokenize('a= ='), [('a', '', ''), ('=', '', ''), ('=', '', '')])
+        # nested braces
+        self.assertEqual(tokenize('R1 a b r={ 1 + {k} }'),
+                         [('R1', '', ''), ('a', '', ''), ('b', '', ''),
+                          ('r={ 1 + {k} }', 'r', '{ 1 + {k} }')])
+        self.assertEqual(tokenize('B1 1 0 v = {{a}*{b}} ic={ {c} }'),
+                         [('B1', '', ''), ('1', '', ''), ('0', '', ''),
+                          ('v={{a}*{b}}', 'v', '{{a}*{b}}'), ('ic={ {c} }', 'ic', '{ {c} }')])
+        # an unbalanced brace is a token of one character
+        self.assertEqual(tokenize('r={1 + {k}'),
+                         [('r', '', ''), ('=', '', ''), ('{', '', ''), ('1', '', ''), ('+', '', ''),
+                          ('{k}', '', '')])
+
+    ##############################################
+
+    def test_ends(self):
+        for text in ('V1 in 0  DC 1 AC 1', 'R1 a b r = { 1 + {k} } m=2'):
+            tokens, ends = tokenize(text, ends=True)
+            self.assertEqual(tokens, tokenize(text))
+            for (token, key, value), end in zip(tokens, ends):
+                self.assertTrue(text[:end].endswith(value or token))
+        self.assertEqual(tokenize('V1 in 0  DC 1', ends=True)[1], [2, 5, 7, 11, 13])
+
+    ##############################################
+
+    def test_iter_groups(self):
+        self.assertEqual(list(iter_groups('a {b} {{c} d} e')), [(2, 5), (6, 13)])
+        self.assertEqual(list(iter_groups('f((1, 2), (3)) (4', '()')), [(1, 14)])
+        # an opening bracket which is not closed is skipped
+        self.assertEqual(list(iter_groups('((a)', '()')), [(1, 4)])
+        self.assertEqual(list(iter_groups('{a}}')), [(0, 3)])
+
+    ##############################################
+
+    def test_parser_jmgc(self):
+
+        def line(text):
+            return Parser_jmgc.Line(text, slice(0, 1), ('$', '//', ';'))
+
+        self.assertEqual(line('.model nch nmos (level=1 vto={ {vt0} + 0.1 })').split_keyword('.model'),
+                         (['nch', 'nmos'], {'level': '1', 'vto': '{ {vt0} + 0.1 }'}))
+        self.assertEqual(line('.param a={ {b} * 2 } c = 3').split_keyword('.param'),
+                         ([], {'a': '{ {b} * 2 }', 'c': '3'}))
+        self.assertEqual(line('B1 out 0 v={ if(v(a) > {th}, 1, 0) } tc1=1').split_element('B1'),
+                         (['out', '0'], {'v': '{ if(v(a) > {th}, 1, 0) }', 'tc1': '1'}))
+        with self.assertRaises(ValueError):
+            line('.model m d ({a) b}').split_keyword('.model')
+
+    ##############################################
+
+    def test_split_parameters(self):
+        self.assertEqual(split_parameters('inverter in out params: w = 1u l=180n'),
+                         (['inverter', 'in', 'out', 'params:'], {'w': '1u', 'l': '180n'}))
+
+    ##############################################
+
+    def test_element(self):
+
+        def element(text):
+            return repr(Element(Line(text, slice(0, 1), ('$', '//', ';'))))
+
+        self.assertEqual(element('R1 1 0 1k'), "Element R 1 ['1', '0'] ['1k'] {}")
+        self.assertEqual(element('C1\t1\t0 1p ic=0'), "Element C 1 ['1', '0'] ['1p'] {'ic': '0'}")
+        self.assertEqual(element('X1 a b sub'), "Element X 1 ['a', 'b'] ['sub'] {}")
+        self.assertEqual(element('V1 1 0 DC 1 AC 1'), "Element V 1 ['1', '0'] ['DC 1 AC 1'] {}")
+        self.assertEqual(element('C1 1 0 1p ic={ {v0} + 1 }'),
+                         "Element C 1 ['1', '0'] ['1p'] {'ic': '{ {v0} + 1 }'}")
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
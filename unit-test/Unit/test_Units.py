@@ -20,7 +20,11 @@
 
 ####################################################################################################
 
+from pathlib import Path
 import math
+import os
+import subprocess
+import sys
 import unittest
 
 import numpy as np
@@ -64,6 +68,35 @@ class TestUnits(unittest.TestCase):
 
     ##############################################
 
+    def test_lazy_shortcuts(self):
+
+        import PySpice.Unit as Unit
+        self.assertIs(Unit.u_kOhm, Unit.u_kΩ)
+        self.assertIs(Unit.U_uF, Unit.U_μF)
+        self.assertIs(Unit.Frequency, Unit.u_Hz)
+        self.assertIn('u_Degree', dir(Unit))
+        self.assertIn('as_Ohm', Unit.__all__)
+        self.assertNotIn('u_°C', dir(Unit))
+        with self.assertRaises(AttributeError):
+            Unit.u_foo
+
+        # Python 3.6 has no module __getattr__, the shortcuts are defined at import
+        code = """
+import collections, sys
+import numpy
+real_version_info = sys.version_info
+VersionInfo = collections.namedtuple('VersionInfo', 'major minor micro releaselevel serial')
+sys.version_info = VersionInfo(3, 6, 15, 'final', 0)
+import PySpice.Unit as Unit
+sys.version_info = real_version_info
+print(all(name in vars(Unit) for name in ('u_V', 'u_kOhm', 'U_uF', 'as_A', 'Frequency', '__all__')))
+"""
+        env = dict(os.environ, PYTHONPATH=str(Path(Unit.__file__).parents[2]))
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True)
+        self.assertEqual(output.split(), ['True'])
+
+    ##############################################
+
     # @unittest.skip('')
     def test_si_derived_unit(self):
 
@@ -199,6 +232,52 @@ class TestUnits(unittest.TestCase):
 
     ##############################################
 
+    def test_fast_path(self):
+
+        value1 = u_kΩ(1)
+        self.assertFalse(hasattr(value1, '__dict__'))
+        self.assertFalse(hasattr(value1.prefixed_unit, '__dict__'))
+        self.assertFalse(hasattr(u_Hz(50), '__dict__'))
+
+        value2 = value1 + u_kΩ(2)
+        self.assertIs(value2.prefixed_unit, value1.prefixed_unit)
+        self.assertEqual(value2.value, 3)
+        self.assertIsInstance(value2.value, int)
+        value2 -= u_Ω(500)
+        self.assertEqual(value2, u_kΩ(2.5))
+        with self.assertRaises(UnitError):
+            value1 + u_A(1)
+
+        # the derived prefixed units are memoized
+        self.assertIs((value1 * u_mA(1)).prefixed_unit, (u_Ω(2) * u_A(3)).prefixed_unit)
+        self.assertIs((value1 / u_A(1)).prefixed_unit, (u_Ω(2) / u_A(3)).prefixed_unit)
+        self.assertIs(value1.unit.power(2, True), u_Ω(1).unit.power(2, True))
+        self.assertEqual(str((value1 * u_F(1)).prefixed_unit), 's')
+
+    ##############################################
+
+    def test_algebra_table(self):
+
+        volt = u_V(1).unit
+        ampere = u_A(1).unit
+        self.assertIs(volt.si_unit * ampere.si_unit, volt.si_unit * ampere.si_unit)
+        self.assertIs(volt.multiply(ampere), volt.multiply(ampere))
+        self.assertEqual(str(volt.multiply(ampere)), 'W')
+        self.assertEqual(str(volt.divide(ampere, True)), 'Ω')
+        self.assertEqual(str(volt.square().sqrt()), 'V')
+
+        # the shared results are not modified in place
+        si_unit = volt.si_unit * ampere.si_unit
+        si_unit *= ampere.si_unit
+        self.assertEqual(volt.si_unit * ampere.si_unit, u_W(1).unit.si_unit)
+        self.assertEqual(si_unit, u_W(1).unit.si_unit * ampere.si_unit)
+
+        _Unit.UnitMetaclass._algebra_table[('*', volt.si_unit.hash, ampere.si_unit.hash, False)] = None
+        _Unit.PrefixedUnit.register(_Unit.PrefixedUnit.from_prefixed_unit(volt))
+        self.assertEqual(str(volt.multiply(ampere)), 'W')
+
+    ##############################################
+
     # @unittest.skip('')
     def test_validation(self):
 